@@ -6,6 +6,7 @@
 #----------------#
 
 import numpy as np
+import xarray as xr
 
 #------------------------#
 # Import project modules #
@@ -17,6 +18,18 @@ from pygenutils.strings.text_formatters import format_string
 # Define custom functions #
 #-------------------------#
 
+# Internal Helper Functions #
+#---------------------------#
+
+def _wind_direction_dtype(u, v) -> np.dtype:
+    """
+    Floating-point data type of the wind direction: float32 for float32 components, else float64.
+    """
+    u_dtype = u.dtype if hasattr(u, "dtype") else np.asarray(u).dtype
+    v_dtype = v.dtype if hasattr(v, "dtype") else np.asarray(v).dtype
+    return np.result_type(u_dtype, v_dtype, np.float32)
+
+
 # Angle converter #
 def angle_converter(angle: float | np.ndarray, conversion: str) -> float | np.ndarray:
     """
@@ -100,7 +113,10 @@ def ws_unit_converter(wind_speed: float | np.ndarray, conversion: str) -> float
 
 
 # Wind direction calculator based on meteorological criteria #
-def meteorological_wind_direction(u: int | float | np.ndarray, v: int | float | np.ndarray) -> np.ndarray:
+def meteorological_wind_direction(
+        u: int | float | np.ndarray | xr.DataArray,
+        v: int | float | np.ndarray | xr.DataArray,
+        out: np.ndarray | None = None) -> np.ndarray | xr.DataArray:
     
     """
     Calculates the wind direction, as the opposite to
@@ -109,78 +125,88 @@ def meteorological_wind_direction(u: int | float | np.ndarray, v: int | float |
     This means that if the direction is, for example, 225º,
     then that is where wind is blowing, thus coming from
     an angle of 45º, so the wind is blowing from the north-east.
+
+    The calculation is vectorised: `u` and `v` may be N-dimensional
+    arrays of any broadcastable shapes, or xarray DataArrays (the result
+    is then a DataArray, computed with `xarray.apply_ufunc`, lazily for
+    dask-backed inputs).
     
     Parameters
     ----------
-    u : int | float | np.ndarray
+    u : int | float | np.ndarray | xr.DataArray
         Array containing the modulus and sense of the
         zonal component of the wind.
-    v : int | float | np.ndarray
+    v : int | float | np.ndarray | xr.DataArray
         Array containing the modulus and sense of the
         meridional component of the wind.
+    out : np.ndarray | None, optional
+        Floating-point array in which to store the result, with the
+        broadcast shape of `u` and `v`; its data type is used for the
+        calculation. Not supported for DataArrays. Default is None.
     
     Returns
     -------
-    np.ndarray
+    np.ndarray | xr.DataArray
         Array containing the directions of the wind, 
-        described as in the first paragraph.
+        described as in the first paragraph. It is float32 if both
+        components are float32 (or has the data type of `out`), float64
+        otherwise; scalar components give a one-element array.
+        Calm records (u == v == 0), whose direction is undefined, and
+        records with NaN components are NaN.
+
+    Raises
+    ------
+    ValueError
+        If `u` and `v` cannot be broadcast together, or `out` is given
+        with DataArrays.
+
+    Examples
+    --------
+    >>> meteorological_wind_direction(np.array([1., -1., 0.]), np.array([1., -1., 0.]))
+    array([225.,  45.,  nan])
     """
     
-    if (isinstance(u, int) or isinstance(v, int))\
-        or (isinstance(u, float) or isinstance(v, float)):
+    if isinstance(u, xr.DataArray) or isinstance(v, xr.DataArray):
+        if out is not None:
+            raise ValueError("'out' is not supported for xarray DataArrays.")
+        return xr.apply_ufunc(meteorological_wind_direction, u, v,
+                              dask="parallelized",
+                              output_dtypes=[_wind_direction_dtype(u, v)])
+    
+    if np.isscalar(u) and np.isscalar(v):
         u = [u]
         v = [v]
-            
-    else:
-        if u.dtype.str == 'O':
-            u = u.astype('d')
-        if v.dtype.str == 'O':
-            v = v.astype('d')
-    
-    u_records = len(u)
-    v_records = len(v)
-    
-    wind_dir_meteo_list = []
-    
-    if u_records == v_records:
-        for t in range(u_records):  
-            
-            print(f"Calculating the wind direction for the time no. {t}...")
-            
-            if u[t] != 0 and v[t] != 0:
-                wind_dir = angle_converter(np.arctan2(v[t],u[t]), "rad2deg")
-                
-                if u[t] > 0 and v[t] > 0:
-                    wind_dir_meteo = 180 - (abs(wind_dir) - 90)
-                    
-                elif u[t] < 0 and v[t] > 0:
-                    wind_dir_meteo = 180 - (wind_dir - 90)
-                    
-                elif u[t] > 0 and v[t] < 0:
-                    wind_dir_meteo = 360 + wind_dir
-                    
-                elif u[t] < 0 and v[t] < 0:
-                    wind_dir_meteo = 180 + wind_dir
-                    
-            elif u[t] == 0 and v[t] != 0:
-                    
-                if v[t] > 0:
-                    wind_dir_meteo = 0
-                elif v[t] < 0:
-                    wind_dir_meteo = 180
-                    
-            elif u[t] != 0 and v[t] == 0:
-    
-                if u[t] > 0:
-                    wind_dir_meteo = 270
-                elif u[t] < 0:
-                    wind_dir_meteo = 90     
-                        
-            wind_dir_meteo_list.append(wind_dir_meteo)   
-
-    wind_dir_meteo_array = np.array(wind_dir_meteo_list).astype('d')
-    
-    return wind_dir_meteo_array
+    u = np.asarray(u)
+    v = np.asarray(v)
+    if u.dtype.str == '|O':
+        u = u.astype('d')
+    if v.dtype.str == '|O':
+        v = v.astype('d')
+    
+    dtype = _wind_direction_dtype(u, v) if out is None else out.dtype
+    if out is None:
+        out = np.empty(np.broadcast_shapes(u.shape, v.shape), dtype=dtype)
+    
+    # Mathematical angle of the wind vector, in degrees #
+    wind_dir = angle_converter(np.arctan2(v.astype(dtype, copy=False), u.astype(dtype, copy=False)), 
+                               "rad2deg")
+    
+    # Meteorological angle, by quadrant or axis; calm and NaN records are left as NaN #
+    out[...] = np.nan
+    branches = [
+        ((u > 0) & (v > 0), 180 - (np.abs(wind_dir) - 90)),
+        ((u < 0) & (v > 0), 180 - (wind_dir - 90)),
+        ((u > 0) & (v < 0), 360 + wind_dir),
+        ((u < 0) & (v < 0), 180 + wind_dir),
+        ((u == 0) & (v > 0), 0),
+        ((u == 0) & (v < 0), 180),
+        ((u > 0) & (v == 0), 270),
+        ((u < 0) & (v == 0), 90)
+    ]
+    for condition, wind_dir_meteo in branches:
+        np.copyto(out, wind_dir_meteo, where=condition)
+    
+    return out
 
 
 # Dewpoint temperature #
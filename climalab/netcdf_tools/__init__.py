@@ -6,7 +6,20 @@
 # Define what should be available when using 'from climalab.netcdf_tools import *'
 __all__ = [
     'cdo_tools',
+    'command_plan',
+    'command_runner',
+    'command_telemetry',
+    'cpu_budget',
     'detect_faulty',
     'extract_basics',
-    'nco_tools'
+    'in_place_editing',
+    'longitude_tools',
+    'nco_tools',
+    'processing_pipelines',
+    'remap_weights',
+    'result_cache',
+    'storage_policy',
+    'streaming_statistics',
+    'time_coverage',
+    'xarray_statistics'
 ]
\ No newline at end of file
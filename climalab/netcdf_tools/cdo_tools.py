@@ -1,11 +1,51 @@
 #! /usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+#----------------#
+# Import modules #
+#----------------#
+
+import os
+import shutil
+import tempfile
+import warnings
+from collections.abc import Callable
+from functools import partial
+from pathlib import Path
+
+import netCDF4
+
 #------------------------#
 # Import project modules #
 #------------------------#
 
-from filewise.file_operations.ops_handler import rename_objects
+from climalab.netcdf_tools.command_plan import get_active_plan, is_planning, rename_output
+from climalab.netcdf_tools.command_runner import (
+    format_command,
+    in_process_netcdf,
+    run_command,
+    run_command_batch
+)
+from climalab.netcdf_tools.cpu_budget import add_thread_option, get_cpu_budget
+from climalab.netcdf_tools.in_place_editing import (
+    append_time_steps,
+    find_data_variables,
+    is_editable_in_place,
+    rename_variable_in_place,
+    set_time_axis_in_place,
+    shift_time_axis_in_place
+)
+from climalab.netcdf_tools.remap_weights import RemapWeightsStore, get_grid_signature
+from climalab.netcdf_tools.result_cache import ResultCache, file_fingerprint, fingerprint_digest
+from climalab.netcdf_tools.storage_policy import StoragePolicy
+from climalab.netcdf_tools.streaming_statistics import stream_time_statistic
+from climalab.netcdf_tools.time_coverage import (
+    build_time_coverage_index,
+    check_time_coverage,
+    format_time_coverage_report,
+    select_files_by_period
+)
+from climalab.netcdf_tools.xarray_statistics import xr_periodic_statistics, xr_time_statistic
 from climarraykit.patterns import get_file_variables, get_times
 from paramlib.global_parameters import (
     BASIC_ARITHMETIC_OPERATORS, 
@@ -13,8 +53,8 @@ from paramlib.global_parameters import (
     TIME_FREQUENCIES_BRIEF,
     TIME_FREQUENCIES_ABBREVIATED
 )
-from pygenutils.arrays_and_lists.data_manipulation import flatten_to_string, flatten_list
-from pygenutils.operative_systems.os_operations import exit_info, run_system_command
+from pygenutils.arrays_and_lists.data_manipulation import flatten_list
+from pygenutils.operative_systems.os_operations import exit_info
 from pygenutils.strings.text_formatters import format_string
 from pygenutils.strings.string_handler import (
     add_to_path, 
@@ -141,12 +181,340 @@ def _standardise_filename(
     return f"{variable}_{freq}_{model}_{experiment}_{calc_proc}_{region}_{period}.{ext}"
 
 
+def _get_periodic_statname(statistic: str, is_climatic: bool, freq: str) -> str:
+    """
+    Build the name of the CDO periodic statistics operator.
+
+    Parameters
+    ----------
+    statistic : str
+        Statistic to calculate (e.g., 'mean', 'sum'). Must be one of `STATKIT`.
+    is_climatic : bool
+        Whether to use the climatological ('y'-prefixed) variant of the operator.
+    freq : str
+        Time frequency (e.g., 'monthly', 'yearly').
+
+    Returns
+    -------
+    str
+        CDO operator name, e.g. 'monmean' or 'ymonmean'.
+
+    Raises
+    ------
+    ValueError
+        If `statistic` is not one of `STATKIT`.
+    """
+    if statistic not in STATKIT:
+        raise ValueError(f"Unsupported statistic {statistic}. Options are {STATKIT}")
+    
+    period_abbr = TIME_FREQUENCIES_BRIEF[find_substring_index(TIME_FREQUENCIES_ABBREVIATED, freq)]
+    return f"y{period_abbr}{statistic}" if is_climatic else f"{period_abbr}{statistic}"
+
+
+def _run_cdo_command(
+        cmd: list[str],
+        output_file: str,
+        capture_output: bool = False,
+        return_output_name: bool = False,
+        encoding: str = "utf-8",
+        shell: bool = True,
+        cache: ResultCache | None = None,
+        operator_str: str | None = None,
+        input_files: list[str] | None = None) -> None:
+    """
+    Run a single CDO command and check its exit status, optionally through a result cache.
+
+    Parameters
+    ----------
+    cmd : list[str]
+        Argument vector of the CDO command to execute.
+    output_file : str
+        Output file written by the command.
+    capture_output : bool, optional
+        Whether to capture the command output. Default is False.
+    return_output_name : bool, optional
+        Kept for backwards compatibility; it has no effect. Default is False.
+    encoding : str, optional
+        Encoding to use when decoding command output. Default is "utf-8".
+    shell : bool, optional
+        Kept for backwards compatibility; commands never run through a shell.
+        Default is True.
+    cache : ResultCache | None, optional
+        If given, `output_file` is materialised from the cache when an entry
+        for `operator_str` and `input_files` exists; otherwise the command is
+        run and its output stored in the cache. Default is None.
+    operator_str : str | None, optional
+        The operator chain, without file names, used as part of the cache key.
+        Required if `cache` is given.
+    input_files : list[str] | None, optional
+        Input files whose fingerprints are part of the cache key.
+        Required if `cache` is given.
+
+    Returns
+    -------
+    None
+    """
+    cpu_budget = get_cpu_budget()
+    if cpu_budget is not None:
+        cmd = add_thread_option(cmd, cpu_budget.allocate([cmd])[1])
+
+    def run_cdo():
+        # Run the command and capture the output
+        process_exit_info = run_command(cmd, capture_output=capture_output, encoding=encoding)
+
+        # Call exit_info with parameters based on capture_output
+        exit_info(process_exit_info,
+            check_stdout=capture_output,
+            check_stderr=capture_output,
+            check_return_code=True
+        )
+
+    _run_cached(run_cdo, output_file, cache, operator_str, input_files)
+
+
+def _run_cached(
+        compute_func: Callable[[], None],
+        output_file: str,
+        cache: ResultCache | None = None,
+        operator_str: str | None = None,
+        input_files: list[str] | None = None,
+        in_process: bool = False) -> None:
+    """
+    Produce an output file with `compute_func`, unless a cached copy can be reused.
+
+    In plan mode (see `command_plan.plan_commands`) the cache is bypassed,
+    and in-process computations are recorded as a plan step instead of
+    being run.
+
+    Parameters
+    ----------
+    compute_func : Callable[[], None]
+        Callable that writes `output_file`.
+    output_file : str
+        Output file written by `compute_func`.
+    cache : ResultCache | None, optional
+        Result cache, as in `_run_cdo_command`. Default is None.
+    operator_str : str | None, optional
+        Operation identifier used as part of the cache key.
+        Required if `cache` is given.
+    input_files : list[str] | None, optional
+        Input files whose fingerprints are part of the cache key.
+        Required if `cache` is given.
+    in_process : bool, optional
+        Whether `compute_func` computes in Python rather than by running a
+        command. Default is False.
+
+    Returns
+    -------
+    None
+    """
+    plan = get_active_plan()
+    if plan is not None:
+        if in_process:
+            plan.add_step(operator_str or compute_func.__name__, input_files or [], [output_file])
+        else:
+            compute_func()
+        return
+
+    if cache is not None:
+        if operator_str is None or input_files is None:
+            raise ValueError("'operator_str' and 'input_files' must be provided when using a cache.")
+        cache_key = cache.make_key(operator_str, input_files)
+        if cache.fetch(cache_key, output_file):
+            print(f"Reusing cached result for '{output_file}'")
+            return
+
+    compute_func()
+    
+    if cache is not None:
+        cache.store(cache_key, output_file)
+
+
+def _apply_storage_policy(cmd: list[str], storage_policy: StoragePolicy | None) -> list[str]:
+    """
+    Apply a storage policy to a CDO command, if given.
+    """
+    return cmd if storage_policy is None else storage_policy.apply_to_cdo_command(cmd)
+
+
+def _cache_operator_str(operator_str: str, storage_policy: StoragePolicy | None) -> str:
+    """
+    Extend a cache operator string with the storage policy, so differently stored results are kept apart.
+    """
+    return operator_str if storage_policy is None else f"{operator_str} {storage_policy!r}"
+
+
+def _mergetime(
+        file_list: list[str],
+        output_file: str,
+        storage_policy: StoragePolicy | None = None,
+        max_fan_in: int | None = None,
+        max_workers: int | None = None,
+        capture_output: bool = False,
+        encoding: str = "utf-8") -> None:
+    """
+    Merge files with CDO's mergetime, as a tree of merges if there are more than `max_fan_in`.
+
+    Each level merges consecutive groups of at most `max_fan_in` files
+    concurrently into temporary files (losslessly, as 64-bit floats), until
+    one final merge writes `output_file` with `storage_policy`; the result is
+    that of a flat merge, while no command opens more than `max_fan_in`
+    files. Temporary files are removed level by level, and on failure.
+    """
+    if max_fan_in is None:
+        max_fan_in = DEFAULT_MERGE_FAN_IN
+    if max_fan_in < 2:
+        raise ValueError(f"'max_fan_in' must be at least 2, got {max_fan_in}.")
+
+    planning = is_planning()
+    level_files = list(file_list)
+    temp_dir = None
+    try:
+        level = 0
+        while len(level_files) > max_fan_in:
+            if temp_dir is None:
+                output_dir = os.path.dirname(os.path.abspath(output_file))
+                temp_dir = (os.path.join(output_dir, TREE_MERGE_TEMP_DIR_PREFIX) if planning
+                            else tempfile.mkdtemp(prefix=TREE_MERGE_TEMP_DIR_PREFIX, dir=output_dir))
+
+            # Split the files into balanced groups of consecutive files
+            n_groups = -(-len(level_files) // max_fan_in)
+            group_size, n_larger_groups = divmod(len(level_files), n_groups)
+            cmd_list = []
+            group_start = 0
+            for group_idx in range(n_groups):
+                group_end = group_start + group_size + (group_idx < n_larger_groups)
+                group_output = os.path.join(temp_dir, f"level{level}_{group_idx:05d}.nc")
+                cmd_list.append([*MERGETIME_ARGS, *level_files[group_start:group_end], group_output])
+                group_start = group_end
+
+            run_command_batch(cmd_list, max_workers=max_workers,
+                              capture_output=capture_output, encoding=encoding)
+
+            # Intermediate files of the previous level are no longer needed
+            if level > 0 and not planning:
+                for file in level_files:
+                    os.remove(file)
+            level_files = [cmd[-1] for cmd in cmd_list]
+            level += 1
+
+        cmd = _apply_storage_policy([*MERGETIME_ARGS, *level_files, output_file], storage_policy)
+        _run_cdo_command(cmd, output_file, capture_output=capture_output, encoding=encoding)
+    finally:
+        if temp_dir is not None and not planning:
+            shutil.rmtree(temp_dir, ignore_errors=True)
+
+
+def _select_files_for_period(
+        file_list: list[str],
+        period: str,
+        index_file: str | None = None,
+        allow_gaps: bool = True) -> list[str]:
+    """
+    Select the files covering a period, sorted by start time, and check their coverage.
+
+    Parameters
+    ----------
+    file_list : list[str]
+        Candidate netCDF files.
+    period : str
+        Time period string (e.g., '2000-2020').
+    index_file : str | None, optional
+        Sidecar file where the time coverage index is persisted. Default is None.
+    allow_gaps : bool, optional
+        Whether missing time steps between files are accepted, with a
+        warning listing them. Default is True.
+
+    Returns
+    -------
+    list[str]
+        Absolute paths of the selected files, in time order.
+
+    Raises
+    ------
+    ValueError
+        If no file covers the period, if several files cover the same time
+        steps, or if time steps are missing and `allow_gaps` is False.
+
+    Warns
+    -----
+    UserWarning
+        If time steps are missing and `allow_gaps` is True.
+    """
+    start_year, end_year = period.split(SPLIT_DELIM2)
+    
+    # Select and sort the files by their actual time coverage #
+    coverage_index = build_time_coverage_index(file_list, index_file=index_file)
+    coverage_index = select_files_by_period(coverage_index, start_year, end_year)
+    if not coverage_index:
+        raise ValueError(f"No input file covers the period {period}.")
+    
+    coverage_report = check_time_coverage(coverage_index)
+    if coverage_report["duplicates"] or coverage_report["overlaps"] \
+        or (coverage_report["gaps"] and not allow_gaps):
+        raise ValueError("Inconsistent time coverage of the files to merge:\n"
+                         f"{format_time_coverage_report(coverage_report)}")
+    if coverage_report["gaps"]:
+        warnings.warn("Time steps are missing between the files to merge:\n"
+                      f"{format_time_coverage_report(coverage_report)}",
+                      stacklevel=3)
+    
+    return [entry["file"] for entry in coverage_index]
+
+
+def _find_variable_to_rename(file: str, varlist_orig: list[str]) -> str:
+    """
+    Find the data variable of a netCDF file to be renamed, reading only its header.
+    """
+    with netCDF4.Dataset(file) as dataset:
+        data_vars = find_data_variables(dataset)
+    listed_vars = [var_name for var_name in data_vars if var_name in varlist_orig]
+    if listed_vars:
+        return listed_vars[0]
+    if len(data_vars) == 1:
+        return data_vars[0]
+    raise ValueError(f"Cannot tell which of the variables {data_vars} in '{file}' to rename; "
+                     f"none of them is in {varlist_orig}.")
+
+
+def _check_engine(engine: str) -> None:
+    if engine not in ENGINE_OPTS:
+        raise ValueError(f"Unsupported engine '{engine}'. Options are {ENGINE_OPTS}")
+
+
+def _get_delta_period(delta_period: str) -> tuple[str, str]:
+    """
+    Validate a delta period and return its name and its CDO abbreviation.
+
+    Parameters
+    ----------
+    delta_period : str
+        Period for delta calculation (e.g., 'monthly', 'yearly').
+
+    Returns
+    -------
+    tuple[str, str]
+        The period name, used in output file names (e.g., 'monthly'), and
+        its CDO abbreviation, used in operator names (e.g., 'mon').
+
+    Raises
+    ------
+    ValueError
+        If the period is not one of `TIME_FREQS_DELTA`.
+    """
+    period_idx = find_substring_index(TIME_FREQS_DELTA, delta_period)
+    if period_idx == -1:
+        raise ValueError(f"Unsupported delta period. Options are {TIME_FREQS_DELTA}")
+    return TIME_FREQS_DELTA[period_idx], FREQ_ABBRS_DELTA[period_idx]
+
+
 # Main functions #
 #----------------#
 
 # Core Data Processing Functions #
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
 
+@in_process_netcdf
 def cdo_mergetime(
         file_list: str | list[str], 
         variable: str, 
@@ -160,13 +528,22 @@ def cdo_mergetime(
         capture_output: bool = False,
         return_output_name: bool = False,
         encoding: str = "utf-8",
-        shell: bool = True) -> None:
+        shell: bool = True,
+        index_file: str | None = None,
+        allow_gaps: bool = True,
+        storage_policy: StoragePolicy | None = None,
+        max_fan_in: int | None = None,
+        max_workers: int | None = None) -> None:
     """
     Merge time steps of multiple files into one using CDO's mergetime operator.
     
     This function combines multiple NetCDF files with different time steps into
     a single file, filtering files by the specified period and using CDO's
     mergetime operator for the actual merging process.
+    
+    Files are selected by the time span read from their time coordinate
+    (see `build_time_coverage_index`), and duplicated, overlapping or missing
+    time ranges are reported before CDO is called.
 
     Parameters
     ----------
@@ -191,21 +568,52 @@ def cdo_mergetime(
     capture_output : bool, optional
         Whether to capture the command output. Default is False.
     return_output_name : bool, optional
-        Whether to return file descriptor names. Default is False.
+        Kept for backwards compatibility; it has no effect. Default is False.
     encoding : str, optional
         Encoding to use when decoding command output. Default is "utf-8".
     shell : bool, optional
-        Whether to execute the command through the shell. Default is True.
+        Kept for backwards compatibility; commands never run through a shell.
+        Default is True.
+    index_file : str | None, optional
+        Sidecar file where the time coverage index is persisted. If None, a
+        sidecar is kept in the directory of each input file. Default is None.
+    allow_gaps : bool, optional
+        Whether to merge files even if time steps are missing between them,
+        with a warning listing the gaps. If False, gaps raise an error like
+        duplicated or overlapping time steps. Default is True.
+    storage_policy : StoragePolicy | None, optional
+        Precision, compression and chunking of the output file. If None,
+        the output is written as 64-bit floats in netCDF4 format, without
+        compression. Default is None.
+    max_fan_in : int | None, optional
+        Maximum number of files merged by a single CDO command. Longer file
+        lists are merged as a tree (see Notes). If None,
+        `DEFAULT_MERGE_FAN_IN`. Default is None.
+    max_workers : int | None, optional
+        Maximum number of group merges run concurrently in a tree merge.
+        If None, as many as available CPUs. Default is None.
 
     Returns
     -------
     None
         The function creates a merged NetCDF file as output.
         
+    Raises
+    ------
+    ValueError
+        If no file covers the period, if several files cover the same time
+        steps, or if time steps are missing and `allow_gaps` is False.
+        
     Notes
     -----
-    This function filters input files by the specified period, extracting
-    the year from the filename and only including files within the period range.
+    This function keeps the input files whose time span intersects the
+    specified period, and passes them to CDO sorted by start time.
+
+    With more than `max_fan_in` files (e.g. tens of thousands of hourly
+    files, beyond the command line length or open file limits), groups of
+    consecutive files are merged concurrently into temporary files, which
+    are merged again until a single command writes the output; the result
+    is identical to a flat merge.
     
     Examples
     --------
@@ -221,27 +629,14 @@ def cdo_mergetime(
         file_list = flatten_list(file_list)
     
     output_name = _standardise_filename(variable, freq, model, experiment, calc_proc, period, region, ext)
-    start_year, end_year = period.split(SPLIT_DELIM2)
-    file_list_selyear = [f for f in file_list if (year := obj_path_specs(f, "name_noext_parts", SPLIT_DELIM1)[-1]) >= start_year and year <= end_year]
-
-    allfiles_string = flatten_to_string(file_list_selyear)
-    cmd = f"cdo -b F64 -f nc4 mergetime '{allfiles_string}' {output_name}"
+    file_list_selyear = _select_files_for_period(file_list, period, index_file, allow_gaps)
 
-    # Run the command and capture the output
-    process_exit_info = run_system_command(
-        cmd, 
-        capture_output=capture_output,
-        return_output_name=return_output_name,
-        encoding=encoding,
-        shell=shell
-    )
-    
-    # Call exit_info with parameters based on capture_output
-    exit_info(process_exit_info,
-        check_stdout=capture_output,
-        check_stderr=capture_output,
-        check_return_code=True
-    )
+    _mergetime(file_list_selyear, output_name,
+               storage_policy=storage_policy,
+               max_fan_in=max_fan_in,
+               max_workers=max_workers,
+               capture_output=capture_output,
+               encoding=encoding)
 
 
 def cdo_selyear(
@@ -256,7 +651,9 @@ def cdo_selyear(
         capture_output: bool = False,
         return_output_name: bool = False,
         encoding: str = "utf-8",
-        shell: bool = True) -> None:
+        shell: bool = True,
+        max_workers: int | None = None,
+        storage_policy: StoragePolicy | None = None) -> None:
     """
     Select data for specific years from files using CDO's selyear operator.
     
@@ -284,16 +681,29 @@ def cdo_selyear(
     capture_output : bool, optional
         Whether to capture the command output. Default is False.
     return_output_name : bool, optional
-        Whether to return file descriptor names. Default is False.
+        Kept for backwards compatibility; it has no effect. Default is False.
     encoding : str, optional
         Encoding to use when decoding command output. Default is "utf-8".
     shell : bool, optional
-        Whether to execute the command through the shell. Default is True.
+        Kept for backwards compatibility; commands never run through a shell.
+        Default is True.
+    max_workers : int | None, optional
+        Maximum number of files processed concurrently. If None, as many
+        files as available CPUs are processed at once. Default is None.
+    storage_policy : StoragePolicy | None, optional
+        Precision, compression and chunking of the output files. If None,
+        CDO's defaults are used. Default is None.
 
     Returns
     -------
     None
         The function creates new NetCDF files with selected years as output.
+
+    Raises
+    ------
+    ValueError
+        If several input files would be written to the same output file
+        (e.g. files of the same variable).
         
     Examples
     --------
@@ -314,28 +724,31 @@ def cdo_selyear(
     selyear_cdo = f"{start_year}/{end_year}"
     period = f"{start_year}-{end_year}"
     
+    output_name_list = []
+    cmd_list = []
     for file in file_list:
         var = _get_varname_in_filename(file)
         output_name = _standardise_filename(var, freq, model, experiment, calc_proc, period, region, ext)
-        cmd = f"cdo selyear,{selyear_cdo} '{file}' {output_name}"
-
-        # Run the command and capture the output
-        process_exit_info = run_system_command(
-            cmd, 
-            capture_output=capture_output,
-            return_output_name=return_output_name,
-            encoding=encoding,
-            shell=shell
-        )
-
-        # Call exit_info with parameters based on capture_output
-        exit_info(process_exit_info,
-            check_stdout=capture_output,
-            check_stderr=capture_output,
-            check_return_code=True
-        )
+        output_name_list.append(output_name)
+        cmd = ["cdo", f"selyear,{selyear_cdo}", file, output_name]
+        cmd_list.append(_apply_storage_policy(cmd, storage_policy))
+
+    if len(set(output_name_list)) < len(output_name_list):
+        raise ValueError("Several input files would be written to the same output file. "
+                         "Process them separately or merge them first.")
+
+    # Run the commands concurrently and check their exit statuses in order
+    run_command_batch(
+        cmd_list,
+        max_workers=max_workers,
+        capture_output=capture_output,
+        return_output_name=return_output_name,
+        encoding=encoding,
+        shell=shell
+    )
 
 
+@in_process_netcdf
 def cdo_sellonlatbox(
         file_list: str | list[str], 
         coords: str, 
@@ -348,7 +761,9 @@ def cdo_sellonlatbox(
         capture_output: bool = False,
         return_output_name: bool = False,
         encoding: str = "utf-8",
-        shell: bool = True) -> None:
+        shell: bool = True,
+        max_workers: int | None = None,
+        storage_policy: StoragePolicy | None = None) -> None:
     """
     Apply CDO's sellonlatbox operator to select a geographical box from input files.
     
@@ -378,11 +793,18 @@ def cdo_sellonlatbox(
     capture_output : bool, optional
         Whether to capture the command output. Default is False.
     return_output_name : bool, optional
-        Whether to return file descriptor names. Default is False.
+        Kept for backwards compatibility; it has no effect. Default is False.
     encoding : str, optional
         Encoding to use when decoding command output. Default is "utf-8".
     shell : bool, optional
-        Whether to execute the command through the shell. Default is True.
+        Kept for backwards compatibility; commands never run through a shell.
+        Default is True.
+    max_workers : int | None, optional
+        Maximum number of files processed concurrently. If None, as many
+        files as available CPUs are processed at once. Default is None.
+    storage_policy : StoragePolicy | None, optional
+        Precision, compression and chunking of the output files. If None,
+        CDO's defaults are used. Default is None.
 
     Returns
     -------
@@ -401,31 +823,28 @@ def cdo_sellonlatbox(
     else:
         file_list = list(flatten_list(file_list))
     
+    cmd_list = []
     for file in file_list:
         var = _get_varname_in_filename(file)
         time_var = find_dt_key(file)
         times = get_times(file, time_var)
         period = f"{times.dt.year.values[0]}-{times.dt.year.values[-1]}"
         output_name = _standardise_filename(var, freq, model, experiment, calc_proc, period, region, ext)
-        cmd = f"cdo sellonlatbox,{coords} '{file}' {output_name}"
-
-        # Run the command and capture the output
-        process_exit_info = run_system_command(
-            cmd, 
-            capture_output=capture_output,
-            return_output_name=return_output_name,
-            encoding=encoding,
-            shell=shell
-        )
+        cmd = ["cdo", f"sellonlatbox,{coords}", file, output_name]
+        cmd_list.append(_apply_storage_policy(cmd, storage_policy))
 
-        # Call exit_info with parameters based on capture_output
-        exit_info(process_exit_info,
-            check_stdout=capture_output,
-            check_stderr=capture_output,
-            check_return_code=True
-        )
+    # Run the commands concurrently and check their exit statuses in order
+    run_command_batch(
+        cmd_list,
+        max_workers=max_workers,
+        capture_output=capture_output,
+        return_output_name=return_output_name,
+        encoding=encoding,
+        shell=shell
+    )
         
 
+@in_process_netcdf
 def cdo_remap(
         file_list: str | list[str], 
         remap_str: str, 
@@ -441,13 +860,21 @@ def cdo_remap(
         capture_output: bool = False,
         return_output_name: bool = False,
         encoding: str = "utf-8", 
-        shell: bool = True) -> None:
+        shell: bool = True,
+        max_workers: int | None = None,
+        weights_store: RemapWeightsStore | None = None,
+        storage_policy: StoragePolicy | None = None) -> None:
     """
     Apply remapping to files using CDO's remap procedures.
     
     This function remaps NetCDF files to a different grid using various 
     interpolation methods available in CDO. The remapping can be done using
     different procedures like bilinear, nearest neighbor, conservative, etc.
+    
+    If a weights store is given, the interpolation weights are generated
+    once per distinct source grid with the matching CDO `gen*` operator and
+    every file is then remapped with `remap,<grid>,<weights>`, instead of
+    recomputing the weights for each file.
 
     Parameters
     ----------
@@ -477,11 +904,22 @@ def cdo_remap(
     capture_output : bool, optional
         Whether to capture the command output. Default is False.
     return_output_name : bool, optional
-        Whether to return file descriptor names. Default is False.
+        Kept for backwards compatibility; it has no effect. Default is False.
     encoding : str, optional
         Encoding to use when decoding command output. Default is "utf-8".
     shell : bool, optional
-        Whether to execute the command through the shell. Default is True.
+        Kept for backwards compatibility; commands never run through a shell.
+        Default is True.
+    max_workers : int | None, optional
+        Maximum number of files processed concurrently. If None, as many
+        files as available CPUs are processed at once. Default is None.
+    weights_store : RemapWeightsStore | None, optional
+        Store of precomputed interpolation weights. Only used for remapping
+        procedures with a weight generation operator
+        (see `CDO_REMAP_WEIGHTS_OPTION_DICT`). Default is None.
+    storage_policy : StoragePolicy | None, optional
+        Precision, compression and chunking of the output files. If None,
+        CDO's defaults are used. Default is None.
 
     Returns
     -------
@@ -491,7 +929,14 @@ def cdo_remap(
     Raises
     ------
     ValueError
-        If `remap_proc` is not one of the supported CDO remap options.
+        If `remap_proc` is not one of the supported CDO remap options, or if
+        several input files would be written to the same output file.
+        
+    Notes
+    -----
+    When several files are given, the period in each output file name is
+    taken from the file's own time coordinate, so that every file is written
+    to a different output file.
         
     Examples
     --------
@@ -506,31 +951,55 @@ def cdo_remap(
     else:
         file_list = list(flatten_list(file_list))
     
-    output_name = _standardise_filename(var, freq, model, experiment, calc_proc, period, region, ext)
-    
     if remap_proc not in CDO_REMAP_OPTIONS:
         raise ValueError(f"Unsupported remap procedure. Options are {CDO_REMAP_OPTIONS}")
     
-    remap_cdo = CDO_REMAP_OPTION_DICT[remap_str]
+    remap_cdo = CDO_REMAP_OPTION_DICT[remap_proc]
     
-    for file in file_list:
-        cmd = f"cdo {remap_cdo},{remap_str} '{file}' {output_name}"
-
-        # Run the command and capture the output
-        process_exit_info = run_system_command(
-            cmd, 
+    # Give each input file its own output file #
+    if len(file_list) == 1:
+        output_name_list = [_standardise_filename(var, freq, model, experiment, calc_proc, period, region, ext)]
+    else:
+        output_name_list = []
+        for file in file_list:
+            time_var = find_dt_key(file)
+            times = get_times(file, time_var)
+            file_period = f"{times.dt.year.values[0]}-{times.dt.year.values[-1]}"
+            output_name_list.append(_standardise_filename(var, freq, model, experiment, calc_proc, file_period, region, ext))
+            
+        if len(set(output_name_list)) < len(output_name_list):
+            raise ValueError("Several input files would be remapped to the same output file. "
+                             "Remap them separately or merge them first.")
+    
+    # Reuse precomputed interpolation weights if possible #
+    gen_operator = CDO_REMAP_WEIGHTS_OPTION_DICT.get(remap_proc)
+    if weights_store is not None and gen_operator is not None:
+        weights_file_list = weights_store.get_weights(
+            file_list,
+            remap_str,
+            gen_operator,
             capture_output=capture_output,
             return_output_name=return_output_name,
             encoding=encoding,
-            shell=shell
-        )
-        
-        # Call exit_info with parameters based on capture_output
-        exit_info(process_exit_info,
-            check_stdout=capture_output,
-            check_stderr=capture_output,
-            check_return_code=True
+            shell=shell,
+            max_workers=max_workers
         )
+        cmd_list = [["cdo", f"remap,{remap_str},{weights_file}", file, output_name]
+                    for file, weights_file, output_name in zip(file_list, weights_file_list, output_name_list)]
+    else:
+        cmd_list = [["cdo", f"{remap_cdo},{remap_str}", file, output_name]
+                    for file, output_name in zip(file_list, output_name_list)]
+    cmd_list = [_apply_storage_policy(cmd, storage_policy) for cmd in cmd_list]
+
+    # Run the commands concurrently and check their exit statuses in order
+    run_command_batch(
+        cmd_list,
+        max_workers=max_workers,
+        capture_output=capture_output,
+        return_output_name=return_output_name,
+        encoding=encoding,
+        shell=shell
+    )
 
 
 # Statistical and Analytical Functions #
@@ -549,11 +1018,19 @@ def cdo_time_mean(
         capture_output=False,
         return_output_name=False,
         encoding="utf-8", 
-        shell=True
+        shell=True,
+        cache=None,
+        engine="cdo",
+        storage_policy=None
         ):
     """
     Calculates the time mean for a specific variable using CDO.
 
+    With `engine='xarray'` the statistic is computed in-process with xarray
+    instead, reading the file lazily (in on-disk chunks if dask is available)
+    and writing an output file with the same name. This avoids spawning a
+    CDO process, which pays off for the many small files of a typical batch.
+
     Parameters
     ----------
     input_file : str
@@ -577,35 +1054,153 @@ def cdo_time_mean(
     capture_output : bool, optional
         Whether to capture the command output. Default is False.
     return_output_name : bool, optional
-        Whether to return file descriptor names. Default is False.
+        Kept for backwards compatibility; it has no effect. Default is False.
     encoding : str, optional
         Encoding to use when decoding command output. Default is "utf-8".
     shell : bool, optional
-        Whether to execute the command through the shell. Default is True.
+        Kept for backwards compatibility; commands never run through a shell.
+        Default is True.
+    cache : ResultCache, optional
+        On-disk result cache. If given, the output is taken from the cache when
+        neither the operation nor the input files have changed since it was
+        computed. Default is None.
+    engine : {'cdo', 'xarray'}, optional
+        Backend used to compute the statistic. The xarray engine supports the
+        'tim*' statistics only (e.g. 'timmean', 'timstd1'). Default is 'cdo'.
+    storage_policy : StoragePolicy, optional
+        Precision, compression and chunking of the output file. If None,
+        the engine's defaults are used. Default is None.
 
     Returns
     -------
     None
+
+    Raises
+    ------
+    ValueError
+        If the engine is not supported.
     """
+    _check_engine(engine)
     output_name = _standardise_filename(var, freq, model, experiment, calc_proc, period, region, ext)
-    cmd = f"cdo -{calc_proc} '{input_file}' {output_name}"
 
-    # Run the command and capture the output
-    process_exit_info = run_system_command(
-        cmd, 
+    if engine == "xarray":
+        _run_cached(
+            partial(xr_time_statistic, input_file, output_name, calc_proc,
+                    storage_policy=storage_policy),
+            output_name,
+            cache=cache,
+            operator_str=_cache_operator_str(f"xarray:{calc_proc}", storage_policy),
+            input_files=[input_file],
+            in_process=True
+        )
+        return
+
+    cmd = _apply_storage_policy(["cdo", f"-{calc_proc}", input_file, output_name], storage_policy)
+
+    # Run the command, reusing a cached result if available
+    _run_cdo_command(
+        cmd,
+        output_name,
         capture_output=capture_output,
         return_output_name=return_output_name,
         encoding=encoding,
-        shell=shell
+        shell=shell,
+        cache=cache,
+        operator_str=_cache_operator_str(f"-{calc_proc}", storage_policy),
+        input_files=[input_file]
     )
+        
+
+@in_process_netcdf
+def streaming_time_mean(
+        file_list: str | list[str],
+        var: str,
+        freq: str,
+        model: str,
+        experiment: str,
+        calc_proc: str,
+        period: str,
+        region: str,
+        ext: str,
+        index_file: str | None = None,
+        allow_gaps: bool = True,
+        cache: ResultCache | None = None,
+        storage_policy: StoragePolicy | None = None) -> None:
+    """
+    Calculate the time statistic of a multi-file record in a single streaming pass.
+
+    Produces the same file as merging the files with `cdo_mergetime` and
+    then running `cdo_time_mean` on the result, but without writing the
+    merged intermediate: the files covering `period` are read in time order,
+    one time slice at a time, and reduced with running accumulators (see
+    `stream_time_statistic`), so memory scales with a single time slice.
+
+    Parameters
+    ----------
+    file_list : str | list[str]
+        Single file path or list of netCDF file paths.
+    var : str
+        Variable name, for the output file naming.
+    freq : str
+        Frequency of the data (e.g., daily, monthly).
+    model : str
+        Model name.
+    experiment : str
+        Experiment name or type.
+    calc_proc : str
+        Time statistic operator, e.g. 'timmean', 'timstd' or 'timmax'.
+    period : str
+        Time period string (e.g., '1981-2010'), used to select the files.
+    region : str
+        Region or geographic area.
+    ext : str
+        File extension (e.g., 'nc').
+    index_file : str | None, optional
+        Sidecar file where the time coverage index is persisted. If None, a
+        sidecar is kept in the directory of each input file. Default is None.
+    allow_gaps : bool, optional
+        Whether to accept missing time steps between files, with a warning
+        listing them. Default is True.
+    cache : ResultCache | None, optional
+        On-disk result cache, as in `cdo_time_mean`. Default is None.
+    storage_policy : StoragePolicy | None, optional
+        Precision, compression and chunking of the output file. If None,
+        the input data types and filters are kept. Default is None.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ValueError
+        If the files do not cover the period consistently, do not share
+        variables and grid, or if the operator is not supported.
+
+    Examples
+    --------
+    >>> streaming_time_mean(sorted(glob('tas_day_*.nc')), 'tas', 'daily', 'ERA5', 'reanalysis',
+    ...                     'timstd', '1981-2010', 'europe', 'nc')
+    """
+    # Defensive programming: handle nested lists
+    if not isinstance(file_list, list):
+        file_list = [file_list]
+    else:
+        file_list = flatten_list(file_list)
 
-    # Call exit_info with parameters based on capture_output
-    exit_info(process_exit_info,
-        check_stdout=capture_output,
-        check_stderr=capture_output,
-        check_return_code=True
+    output_name = _standardise_filename(var, freq, model, experiment, calc_proc, period, region, ext)
+    file_list_period = _select_files_for_period(file_list, period, index_file, allow_gaps)
+
+    _run_cached(
+        partial(stream_time_statistic, file_list_period, output_name, calc_proc,
+                storage_policy=storage_policy),
+        output_name,
+        cache=cache,
+        operator_str=_cache_operator_str(f"streaming:{calc_proc}", storage_policy),
+        input_files=file_list_period,
+        in_process=True
     )
-        
+
 
 def cdo_periodic_statistics(
         nc_file, 
@@ -615,11 +1210,19 @@ def cdo_periodic_statistics(
         season_str=None,
         capture_output=False,
         return_output_name=False,
-        encoding="utf-8", shell=True
+        encoding="utf-8", shell=True,
+        cache=None,
+        engine="cdo",
+        storage_policy=None
         ):
     """
     Calculates basic periodic statistics on a netCDF file using CDO.
 
+    With `engine='xarray'` the statistics, including the climatological
+    'y'-prefixed variants and the season selection, are computed in-process
+    with xarray instead, reading the file lazily (in on-disk chunks if dask
+    is available) and writing an output file with the same name.
+
     Parameters
     ----------
     nc_file : str
@@ -635,46 +1238,74 @@ def cdo_periodic_statistics(
     capture_output : bool, optional
         Whether to capture the command output. Default is False.
     return_output_name : bool, optional
-        Whether to return file descriptor names. Default is False.
+        Kept for backwards compatibility; it has no effect. Default is False.
     encoding : str, optional
         Encoding to use when decoding command output. Default is "utf-8".
     shell : bool, optional
-        Whether to execute the command through the shell. Default is True.
+        Kept for backwards compatibility; commands never run through a shell.
+        Default is True.
+    cache : ResultCache, optional
+        On-disk result cache. If given, the output is taken from the cache when
+        neither the operation nor the input files have changed since it was
+        computed. Default is None.
+    engine : {'cdo', 'xarray'}, optional
+        Backend used to compute the statistics. Default is 'cdo'.
+    storage_policy : StoragePolicy, optional
+        Precision, compression and chunking of the output file. If None,
+        the engine's defaults are used. Default is None.
 
     Returns
     -------
     None
+
+    Raises
+    ------
+    ValueError
+        If the statistic or the engine is not supported.
     """
-    if statistic not in STATKIT:
-        raise ValueError(f"Unsupported statistic {statistic}. Options are {STATKIT}")
-    
+    _check_engine(engine)
+    statname = _get_periodic_statname(statistic, is_climatic, freq)
     period_abbr = TIME_FREQUENCIES_BRIEF[find_substring_index(TIME_FREQUENCIES_ABBREVIATED, freq)]
-
-    statname = f"y{period_abbr}{statistic}" if is_climatic else f"{period_abbr}{statistic}"
     
-    if period_abbr == TIME_FREQUENCIES_BRIEF[3] and season_str:
+    select_season = period_abbr == TIME_FREQUENCIES_BRIEF[3] and season_str
+    if select_season:
         statname += f" -select,season={season_str}"
 
     file_name_noext = add_to_path(nc_file, return_file_name_noext=True)
     string2add = f"{SPLIT_DELIM1}{statname}" if not season_str else f"{SPLIT_DELIM1}{statname}_{statname[-3:]}"
     output_name = modify_obj_specs(nc_file, "name_noext", add_to_path(file_name_noext, string2add))
 
-    cmd = f"cdo {statname} {nc_file} {output_name}"
+    if engine == "xarray":
+        _run_cached(
+            partial(xr_periodic_statistics,
+                    nc_file,
+                    output_name,
+                    period_abbr,
+                    statistic,
+                    is_climatic,
+                    season_str=season_str if select_season else None,
+                    storage_policy=storage_policy),
+            output_name,
+            cache=cache,
+            operator_str=_cache_operator_str(f"xarray:{statname}", storage_policy),
+            input_files=[nc_file],
+            in_process=True
+        )
+        return
+
+    cmd = _apply_storage_policy(["cdo", *statname.split(), nc_file, output_name], storage_policy)
 
-    # Run the command and capture the output
-    process_exit_info = run_system_command(
-        cmd, 
+    # Run the command, reusing a cached result if available
+    _run_cdo_command(
+        cmd,
+        output_name,
         capture_output=capture_output,
         return_output_name=return_output_name,
         encoding=encoding,
-        shell=shell
-    )
-
-    # Call exit_info with parameters based on capture_output
-    exit_info(process_exit_info,
-        check_stdout=capture_output,
-        check_stderr=capture_output,
-        check_return_code=True
+        shell=shell,
+        cache=cache,
+        operator_str=_cache_operator_str(statname, storage_policy),
+        input_files=[nc_file]
     )
     
 
@@ -691,7 +1322,9 @@ def cdo_anomalies(
         ext,
         capture_output=False,
         return_output_name=False,
-        encoding="utf-8", shell=True
+        encoding="utf-8", shell=True,
+        cache=None,
+        storage_policy=None
         ):
     """
     Calculates anomalies by subtracting the average from the full time series using CDO's sub operator.
@@ -721,34 +1354,176 @@ def cdo_anomalies(
     capture_output : bool, optional
         Whether to capture the command output. Default is False.
     return_output_name : bool, optional
-        Whether to return file descriptor names. Default is False.
+        Kept for backwards compatibility; it has no effect. Default is False.
     encoding : str, optional
         Encoding to use when decoding command output. Default is "utf-8".
     shell : bool, optional
-        Whether to execute the command through the shell. Default is True.
+        Kept for backwards compatibility; commands never run through a shell.
+        Default is True.
+    cache : ResultCache, optional
+        On-disk result cache. If given, the output is taken from the cache when
+        neither the operation nor the input files have changed since it was
+        computed. Default is None.
+    storage_policy : StoragePolicy, optional
+        Precision, compression and chunking of the output file. If None,
+        CDO's defaults are used. Default is None.
 
     Returns
     -------
     None
     """
     output_name = _standardise_filename(var, freq, model, experiment, calc_proc, period, region, ext)
-    cmd = f"cdo sub '{input_file_avg}' '{input_file_full}' {output_name}"
+    cmd = _apply_storage_policy(["cdo", "sub", input_file_avg, input_file_full, output_name], storage_policy)
 
-    # Run the command and capture the output
-    process_exit_info = run_system_command(
-        cmd, 
+    # Run the command, reusing a cached result if available
+    _run_cdo_command(
+        cmd,
+        output_name,
         capture_output=capture_output,
         return_output_name=return_output_name,
         encoding=encoding,
-        shell=shell
+        shell=shell,
+        cache=cache,
+        operator_str=_cache_operator_str("sub", storage_policy),
+        input_files=[input_file_avg, input_file_full]
     )
 
-    # Call exit_info with parameters based on capture_output
-    exit_info(process_exit_info,
-        check_stdout=capture_output,
-        check_stderr=capture_output,
-        check_return_code=True
+
+@in_process_netcdf
+def cdo_anomalies_batch(
+        file_list: str | list[str],
+        climatology_file: str | None = None,
+        reference_file: str | None = None,
+        reference_period: str | None = None,
+        freq: str = "monthly",
+        climatology_dir: str | None = None,
+        capture_output: bool = False,
+        return_output_name: bool = False,
+        encoding: str = "utf-8",
+        shell: bool = True,
+        max_workers: int | None = None,
+        storage_policy: StoragePolicy | None = None) -> list[str]:
+    """
+    Calculate anomalies of many files against one shared climatology, concurrently.
+
+    The climatology is either given or computed once from `reference_file`
+    over `reference_period` (see `get_climatology`, which also persists it
+    for later calls). Before any anomaly is computed, the grid of every
+    file is checked against that of the climatology and all calendars are
+    checked to match, so a mismatch fails the batch up front instead of
+    in one of its commands. Anomalies are then computed with the
+    periodic subtraction operator matching `freq` (e.g. `ymonsub`), up to
+    `max_workers` files at a time.
+
+    Parameters
+    ----------
+    file_list : str | list[str]
+        Single file path or list of netCDF files.
+    climatology_file : str | None, optional
+        Precomputed climatology, at the periodicity given by `freq`.
+        Default is None.
+    reference_file : str | None, optional
+        File to compute the climatology from, if `climatology_file` is not given.
+        Default is None.
+    reference_period : str | None, optional
+        Reference period (e.g., '1981-2010') of the computed climatology.
+        If None, the whole reference file is used. Default is None.
+    freq : str, optional
+        Periodicity of the climatology ('yearly', 'monthly' or 'daily').
+        Default is 'monthly'.
+    climatology_dir : str | None, optional
+        Directory where a computed climatology is persisted. If None, the
+        directory of `reference_file` is used. Default is None.
+    capture_output : bool, optional
+        Whether to capture the command output. Default is False.
+    return_output_name : bool, optional
+        Kept for backwards compatibility; it has no effect. Default is False.
+    encoding : str, optional
+        Encoding to use when decoding command output. Default is "utf-8".
+    shell : bool, optional
+        Kept for backwards compatibility; commands never run through a shell.
+        Default is True.
+    max_workers : int | None, optional
+        Maximum number of files processed concurrently. If None, as many
+        files as available CPUs are processed at once. Default is None.
+    storage_policy : StoragePolicy | None, optional
+        Precision, compression and chunking of the output files. If None,
+        CDO's defaults are used. Default is None.
+
+    Returns
+    -------
+    list[str]
+        Output file paths, one per input file, named after it with the
+        suffix `_anomalies`.
+
+    Raises
+    ------
+    ValueError
+        If neither a climatology nor a reference file is given, if `freq`
+        is not supported, or if grids or calendars do not match.
+    RuntimeError
+        If one or more CDO commands fail.
+
+    Examples
+    --------
+    >>> cdo_anomalies_batch(sorted(glob('tas_mon_*_ssp585.nc')),
+    ...                     reference_file='tas_mon_ERA5.nc',
+    ...                     reference_period='1991-2020')
+    """
+    # Defensive programming: handle nested lists
+    if not isinstance(file_list, list):
+        file_list = [file_list]
+    else:
+        file_list = flatten_list(file_list)
+
+    _, period_abbr = _get_delta_period(freq)
+
+    if climatology_file is None:
+        if reference_file is None:
+            raise ValueError("Either 'climatology_file' or 'reference_file' must be provided.")
+        climatology_file = get_climatology(
+            reference_file,
+            freq,
+            climatology_dir,
+            capture_output=capture_output,
+            return_output_name=return_output_name,
+            encoding=encoding,
+            shell=shell,
+            period=reference_period
+        )
+
+    # Validate grids and calendars once for the whole batch #
+    clim_grid = get_grid_signature(climatology_file, encoding=encoding)
+    grid_mismatches = [file for file in file_list
+                       if get_grid_signature(file, encoding=encoding) != clim_grid]
+    if grid_mismatches:
+        raise ValueError(f"Grid of the following files does not match that of "
+                         f"'{climatology_file}': {grid_mismatches}")
+
+    calendars = {entry["file"]: entry["calendar"]
+                 for entry in build_time_coverage_index(file_list + [climatology_file])}
+    if len(set(calendars.values())) > 1:
+        raise ValueError(f"Files use different calendars: {calendars}")
+
+    # Compute the anomalies concurrently #
+    anomaly_operator = ANOMALY_OPERATOR_DICT[period_abbr]
+    output_list = []
+    cmd_list = []
+    for file in file_list:
+        output_name = add_to_path(file, f"{SPLIT_DELIM1}anomalies")
+        output_list.append(output_name)
+        cmd = ["cdo", anomaly_operator, file, climatology_file, output_name]
+        cmd_list.append(_apply_storage_policy(cmd, storage_policy))
+
+    run_command_batch(
+        cmd_list,
+        max_workers=max_workers,
+        capture_output=capture_output,
+        return_output_name=return_output_name,
+        encoding=encoding,
+        shell=shell
     )
+    return output_list
 
 
 def calculate_periodic_deltas(
@@ -759,7 +1534,10 @@ def calculate_periodic_deltas(
         model=None,
         capture_output=False,
         return_output_name=False,
-        encoding="utf-8", shell=True
+        encoding="utf-8", shell=True,
+        cache=None,
+        climatology_dir=None,
+        storage_policy=None
         ):
     """
     Calculates periodic deltas between projected and historical data using CDO.
@@ -779,51 +1557,65 @@ def calculate_periodic_deltas(
     capture_output : bool, optional
         Whether to capture the command output. Default is False.
     return_output_name : bool, optional
-        Whether to return file descriptor names. Default is False.
+        Kept for backwards compatibility; it has no effect. Default is False.
     encoding : str, optional
         Encoding to use when decoding command output. Default is "utf-8".
     shell : bool, optional
-        Whether to execute the command through the shell. Default is True.
+        Kept for backwards compatibility; commands never run through a shell.
+        Default is True.
+    cache : ResultCache, optional
+        On-disk result cache. If given, the output is taken from the cache when
+        neither the operation nor the input files have changed since it was
+        computed. Default is None.
+    climatology_dir : str, optional
+        If given, the climatologies are taken from (or computed once into)
+        this directory through `get_climatology`, instead of being
+        recomputed within every CDO call. Default is None.
+    storage_policy : StoragePolicy, optional
+        Precision, compression and chunking of the output file. If None,
+        CDO's defaults are used. Default is None.
 
     Returns
     -------
     None
     """
-    period_idx = find_substring_index(TIME_FREQS_DELTA, delta_period)
-    if period_idx == -1:
-        raise ValueError(f"Unsupported delta period. Options are {TIME_FREQS_DELTA}")
+    delta_period_str, period_abbr = _get_delta_period(delta_period)
 
     if model is None:
         raise ValueError("Model must be provided to calculate deltas.")
     
-    period_abbr = TIME_FREQS_DELTA[period_idx]
-    hist_mean_cmd = f"-y{period_abbr}mean {hist_file}"
-    proj_mean_cmd = f"-y{period_abbr}mean {proj_file}"
+    clim_operator = f"-{CLIMATOLOGY_OPERATOR_DICT[period_abbr]}"
+    if climatology_dir is None:
+        hist_mean_cmd = [clim_operator, hist_file]
+        proj_mean_cmd = [clim_operator, proj_file]
+    else:
+        hist_mean_cmd = [get_climatology(hist_file, delta_period, climatology_dir,
+                                         capture_output, return_output_name, encoding, shell)]
+        proj_mean_cmd = [get_climatology(proj_file, delta_period, climatology_dir,
+                                         capture_output, return_output_name, encoding, shell)]
     
     delta_filename = add_to_path(hist_file, return_file_name_noext=True)
-    string2add = f"{period_abbr}Deltas_{model}.nc"
+    string2add = f"{delta_period_str}Deltas_{model}.nc"
     delta_output = add_to_path(delta_filename, string2add)
     
     if operator not in BASIC_ARITHMETIC_OPERATORS:
         raise ValueError(f"Unsupported operator. Options are {BASIC_ARITHMETIC_OPERATORS}")
     
     operator_str = CDO_OPERATOR_STR_DICT[operator]
-    cmd = f"cdo {operator_str} {hist_mean_cmd} {proj_mean_cmd} {delta_output}"
+    cmd = ["cdo", operator_str, *hist_mean_cmd, *proj_mean_cmd, delta_output]
+    cmd = _apply_storage_policy(cmd, storage_policy)
 
-    # Run the command and capture the output
-    process_exit_info = run_system_command(
-        cmd, 
+    # Run the command, reusing a cached result if available
+    _run_cdo_command(
+        cmd,
+        delta_output,
         capture_output=capture_output,
         return_output_name=return_output_name,
         encoding=encoding,
-        shell=shell
-    )
-
-    # Call exit_info with parameters based on capture_output
-    exit_info(process_exit_info,
-        check_stdout=capture_output,
-        check_stderr=capture_output,
-        check_return_code=True
+        shell=shell,
+        cache=cache,
+        operator_str=_cache_operator_str(f"{operator_str} {clim_operator} {clim_operator}", storage_policy),
+        input_files=[hist_file, proj_file]
     )
 
 
@@ -835,7 +1627,10 @@ def apply_periodic_deltas(
         model=None,
         capture_output=False,
         return_output_name=False,
-        encoding="utf-8", shell=True
+        encoding="utf-8", shell=True,
+        cache=None,
+        climatology_dir=None,
+        storage_policy=None
         ):
     """
     Applies periodic deltas between projected and historical data using CDO.
@@ -855,56 +1650,280 @@ def apply_periodic_deltas(
     capture_output : bool, optional
         Whether to capture the command output. Default is False.
     return_output_name : bool, optional
-        Whether to return file descriptor names. Default is False.
+        Kept for backwards compatibility; it has no effect. Default is False.
     encoding : str, optional
         Encoding to use when decoding command output. Default is "utf-8".
     shell : bool, optional
-        Whether to execute the command through the shell. Default is True.
+        Kept for backwards compatibility; commands never run through a shell.
+        Default is True.
+    cache : ResultCache, optional
+        On-disk result cache. If given, the output is taken from the cache when
+        neither the operation nor the input files have changed since it was
+        computed. Default is None.
+    climatology_dir : str, optional
+        If given, the climatologies are taken from (or computed once into)
+        this directory through `get_climatology`, instead of being
+        recomputed within every CDO call. Default is None.
+    storage_policy : StoragePolicy, optional
+        Precision, compression and chunking of the output file. If None,
+        CDO's defaults are used. Default is None.
 
     Returns
     -------
     None
     """
-    period_idx = find_substring_index(TIME_FREQS_DELTA, delta_period)
-    if period_idx == -1:
-        raise ValueError(f"Unsupported delta period. Options are {TIME_FREQS_DELTA}")
+    delta_period_str, period_abbr = _get_delta_period(delta_period)
 
     if model is None:
         raise ValueError("Model must be provided to apply deltas.")
     
-    period_abbr = TIME_FREQS_DELTA[period_idx]
     delta_output = add_to_path(hist_file, return_file_name_noext=True)
-    string2add = f"{period_abbr}DeltaApplied_{model}.nc"
+    string2add = f"{delta_period_str}DeltaApplied_{model}.nc"
     delta_applied_output = add_to_path(delta_output, string2add)
     
-    hist_mean_cmd = f"-y{period_abbr}mean {hist_file}"
+    clim_operator = f"-{CLIMATOLOGY_OPERATOR_DICT[period_abbr]}"
+    if climatology_dir is None:
+        hist_mean_cmd = [clim_operator, hist_file]
+    else:
+        hist_mean_cmd = [get_climatology(hist_file, delta_period, climatology_dir,
+                                         capture_output, return_output_name, encoding, shell)]
     
     if operator not in BASIC_ARITHMETIC_OPERATORS:
         raise ValueError(f"Unsupported operator. Options are {BASIC_ARITHMETIC_OPERATORS}")
     
     operator_str = CDO_OPERATOR_STR_DICT[operator]
-    cmd = f"cdo {operator_str} {proj_file} {hist_mean_cmd} {delta_applied_output}"
+    cmd = ["cdo", operator_str, proj_file, *hist_mean_cmd, delta_applied_output]
+    cmd = _apply_storage_policy(cmd, storage_policy)
+
+    # Run the command, reusing a cached result if available
+    _run_cdo_command(
+        cmd,
+        delta_applied_output,
+        capture_output=capture_output,
+        return_output_name=return_output_name,
+        encoding=encoding,
+        shell=shell,
+        cache=cache,
+        operator_str=_cache_operator_str(f"{operator_str} {clim_operator}", storage_policy),
+        input_files=[proj_file, hist_file]
+    )
+
+
+def get_climatology(
+        nc_file: str,
+        delta_period: str = "monthly",
+        climatology_dir: str | None = None,
+        capture_output: bool = False,
+        return_output_name: bool = False,
+        encoding: str = "utf-8",
+        shell: bool = True,
+        period: str | None = None) -> str:
+    """
+    Return the multi-year periodic mean of a file, computing it only once.
+
+    The climatology (`ymonmean`, `ydaymean`, or `timmean` for yearly data,
+    see `CLIMATOLOGY_OPERATOR_DICT`), optionally restricted to the years of
+    `period`, is persisted in `climatology_dir`
+    under a name carrying a digest of the input file fingerprint (path,
+    size and modification time) and the operator. Later calls with the
+    same, unchanged file return the persisted file without running CDO;
+    when the file changes, the climatology is recomputed and the outdated
+    one removed.
+
+    Parameters
+    ----------
+    nc_file : str
+        Path to the netCDF file.
+    delta_period : str, optional
+        Period of the climatology (e.g., 'monthly', 'yearly'). Default is 'monthly'.
+    climatology_dir : str | None, optional
+        Directory where climatologies are kept. If None, the directory of
+        `nc_file` is used. Default is None.
+    capture_output : bool, optional
+        Whether to capture the command output. Default is False.
+    return_output_name : bool, optional
+        Kept for backwards compatibility; it has no effect. Default is False.
+    encoding : str, optional
+        Encoding to use when decoding command output. Default is "utf-8".
+    shell : bool, optional
+        Kept for backwards compatibility; commands never run through a shell.
+        Default is True.
+    period : str | None, optional
+        Reference period (e.g., '1981-2010'). If given, only those years
+        are averaged. Default is None, which averages the whole file.
+
+    Returns
+    -------
+    str
+        Path to the climatology file.
+
+    Raises
+    ------
+    ValueError
+        If the delta period is not supported.
+
+    Examples
+    --------
+    >>> get_climatology('tas_mon_EC-Earth3_historical.nc', 'monthly', '/scratch/climatologies')
+    '/scratch/climatologies/tas_mon_EC-Earth3_historical_ymonmean_3f2a9c81d07e.nc'
+    """
+    _, period_abbr = _get_delta_period(delta_period)
+    statname = CLIMATOLOGY_OPERATOR_DICT[period_abbr]
+    if period is not None:
+        start_year, end_year = period.split(SPLIT_DELIM2)
+        statname += f" -selyear,{start_year}/{end_year}"
+
+    if climatology_dir is None:
+        climatology_dir = os.path.dirname(os.path.abspath(nc_file))
+    if not is_planning():
+        os.makedirs(climatology_dir, exist_ok=True)
+
+    clim_prefix = f"{Path(nc_file).stem}{SPLIT_DELIM1}{CLIMATOLOGY_OPERATOR_DICT[period_abbr]}{SPLIT_DELIM1}"
+    if period is not None:
+        clim_prefix += f"{period}{SPLIT_DELIM1}"
+    clim_key = fingerprint_digest(statname, file_fingerprint(nc_file))
+    clim_file = os.path.join(climatology_dir, f"{clim_prefix}{clim_key[:12]}.nc")
+    if os.path.exists(clim_file):
+        return clim_file
+
+    # Write to a temporary name, so an interrupted run never leaves a partial climatology
+    temp_file = f"{clim_file}.tmp"
+    cmd = ["cdo", *statname.split(), nc_file, temp_file]
+    _run_cdo_command(
+        cmd,
+        temp_file,
+        capture_output=capture_output,
+        return_output_name=return_output_name,
+        encoding=encoding,
+        shell=shell
+    )
+    if is_planning():
+        rename_output(temp_file, clim_file)
+        return clim_file
+    os.replace(temp_file, clim_file)
+
+    # Remove climatologies of earlier versions of the same file #
+    for outdated_file in Path(climatology_dir).glob(f"{clim_prefix}{'[0-9a-f]' * 12}.nc"):
+        if str(outdated_file) != clim_file:
+            outdated_file.unlink(missing_ok=True)
+
+    return clim_file
+
+
+def apply_periodic_deltas_batch(
+        proj_file_list: str | list[str],
+        hist_file: str,
+        operator: str = "+",
+        delta_period: str = "monthly",
+        model: str | None = None,
+        climatology_dir: str | None = None,
+        capture_output: bool = False,
+        return_output_name: bool = False,
+        encoding: str = "utf-8",
+        shell: bool = True,
+        max_workers: int | None = None,
+        storage_policy: StoragePolicy | None = None) -> list[str]:
+    """
+    Apply one historical baseline to many projection files concurrently.
+
+    The historical climatology is computed once (see `get_climatology`)
+    and then combined with every projection file, up to `max_workers`
+    files at a time. Each file gets the same operation as
+    `apply_periodic_deltas`.
+
+    Parameters
+    ----------
+    proj_file_list : str | list[str]
+        Single file path or list of projected netCDF files.
+    hist_file : str
+        Path to the historical netCDF file.
+    operator : str, optional
+        Operation to apply between files ('+', '-', '*', '/'). Default is '+'.
+    delta_period : str, optional
+        Period for delta application (e.g., 'monthly', 'yearly'). Default is 'monthly'.
+    model : str
+        Model name, used in the output file names.
+    climatology_dir : str | None, optional
+        Directory where the historical climatology is persisted. If None,
+        the directory of `hist_file` is used. Default is None.
+    capture_output : bool, optional
+        Whether to capture the command output. Default is False.
+    return_output_name : bool, optional
+        Kept for backwards compatibility; it has no effect. Default is False.
+    encoding : str, optional
+        Encoding to use when decoding command output. Default is "utf-8".
+    shell : bool, optional
+        Kept for backwards compatibility; commands never run through a shell.
+        Default is True.
+    max_workers : int | None, optional
+        Maximum number of files processed concurrently. If None, as many
+        files as available CPUs are processed at once. Default is None.
+    storage_policy : StoragePolicy | None, optional
+        Precision, compression and chunking of the output files. If None,
+        CDO's defaults are used. Default is None.
+
+    Returns
+    -------
+    list[str]
+        Output file paths, one per projection file, named after it with
+        the suffix `_<period>DeltaApplied_<model>`.
+
+    Raises
+    ------
+    ValueError
+        If the period or the operator is not supported, or `model` is missing.
+    RuntimeError
+        If one or more CDO commands fail.
+    """
+    # Defensive programming: handle nested lists
+    if not isinstance(proj_file_list, list):
+        proj_file_list = [proj_file_list]
+    else:
+        proj_file_list = flatten_list(proj_file_list)
+
+    delta_period_str, _ = _get_delta_period(delta_period)
 
-    # Run the command and capture the output
-    process_exit_info = run_system_command(
-        cmd, 
+    if model is None:
+        raise ValueError("Model must be provided to apply deltas.")
+    
+    if operator not in BASIC_ARITHMETIC_OPERATORS:
+        raise ValueError(f"Unsupported operator. Options are {BASIC_ARITHMETIC_OPERATORS}")
+    
+    operator_str = CDO_OPERATOR_STR_DICT[operator]
+    hist_clim_file = get_climatology(
+        hist_file,
+        delta_period,
+        climatology_dir,
         capture_output=capture_output,
         return_output_name=return_output_name,
         encoding=encoding,
         shell=shell
     )
 
-    # Call exit_info with parameters based on capture_output
-    exit_info(process_exit_info,
-        check_stdout=capture_output,
-        check_stderr=capture_output,
-        check_return_code=True
+    output_list = []
+    cmd_list = []
+    for proj_file in proj_file_list:
+        delta_applied_output = add_to_path(proj_file, f"{SPLIT_DELIM1}{delta_period_str}DeltaApplied_{model}")
+        output_list.append(delta_applied_output)
+        cmd = ["cdo", operator_str, proj_file, hist_clim_file, delta_applied_output]
+        cmd_list.append(_apply_storage_policy(cmd, storage_policy))
+
+    # Run the commands concurrently
+    run_command_batch(
+        cmd_list,
+        max_workers=max_workers,
+        capture_output=capture_output,
+        return_output_name=return_output_name,
+        encoding=encoding,
+        shell=shell
     )
+    return output_list
 
 
 # File Renaming and Organisational Functions #
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
     
+@in_process_netcdf
 def cdo_rename(
         file_list: str | list[str], 
         varlist_orig: list[str], 
@@ -912,13 +1931,16 @@ def cdo_rename(
         capture_output: bool = False,
         return_output_name: bool = False,
         encoding: str = "utf-8", 
-        shell: bool = True) -> None:
+        shell: bool = True,
+        max_workers: int | None = None) -> None:
     """
-    Rename variables in files using a standardised variable list via CDO's chname operator.
+    Rename variables in files using a standardised variable list.
     
-    This function systematically renames variables within NetCDF files using CDO's
-    chname operator. It maps original variable names to standardised names and
-    creates new files with the updated variable names.
+    This function systematically renames variables within NetCDF files,
+    mapping original variable names to standardised names. A rename only
+    changes the file header, so netCDF files are edited in place without
+    copying their data; CDO's chname operator is only used for formats that
+    cannot be edited in place (e.g. GRIB).
 
     Parameters
     ----------
@@ -932,21 +1954,32 @@ def cdo_rename(
     capture_output : bool, optional
         Whether to capture the command output. Default is False.
     return_output_name : bool, optional
-        Whether to return file descriptor names. Default is False.
+        Kept for backwards compatibility; it has no effect. Default is False.
     encoding : str, optional
         Encoding to use when decoding command output. Default is "utf-8".
     shell : bool, optional
-        Whether to execute the command through the shell. Default is True.
+        Kept for backwards compatibility; commands never run through a shell.
+        Default is True.
+    max_workers : int | None, optional
+        Maximum number of files processed concurrently by CDO. If None, as
+        many files as available CPUs are processed at once. Default is None.
 
     Returns
     -------
     None
         The function modifies the files in-place by renaming variables.
+
+    Raises
+    ------
+    ValueError
+        If the variable to rename cannot be identified in a netCDF file.
         
     Notes
     -----
-    This function creates temporary files during processing and renames them
-    back to the original filenames after successful variable renaming.
+    In netCDF files, the variable to rename is the data variable listed in
+    `varlist_orig` or, failing that, the only data variable of the file.
+    Files processed by CDO are written to temporary files, renamed back to
+    the original filenames after successful variable renaming.
     
     Examples
     --------
@@ -960,33 +1993,40 @@ def cdo_rename(
     else:
         file_list = list(flatten_list(file_list))
     
+    cmd_list = []
+    post_command_actions = []
     for i, file in enumerate(file_list, start=1):
-        var_file = get_file_variables(file)
         var_std = _get_varname_in_filename(file, True, varlist_orig, varlist_std)
+        editable_in_place = is_editable_in_place(file)
+        if editable_in_place:
+            var_file = _find_variable_to_rename(file, varlist_orig)
+        else:
+            var_file = get_file_variables(file)
         
         print(f"Renaming variable '{var_file}' to '{var_std}' in file {i}/{len(file_list)}...")
-        
-        temp_file = add_to_path(file)
-        cmd = f"cdo chname,{var_file},{var_std} '{file}' '{temp_file}'"
-
-        # Run the command and capture the output
-        process_exit_info = run_system_command(
-            cmd, 
-            capture_output=capture_output,
-            return_output_name=return_output_name,
-            encoding=encoding,
-            shell=shell
-        )
 
-        # Call exit_info with parameters based on capture_output
-        exit_info(process_exit_info,
-            check_stdout=capture_output,
-            check_stderr=capture_output,
-            check_return_code=True
-        )
+        # Edit the header of netCDF files directly, without copying any data
+        if editable_in_place:
+            if var_file != var_std:
+                rename_variable_in_place(file, var_file, var_std)
+            continue
         
-        # Rename the temporary file to the given file
-        rename_objects(temp_file, file)
+        temp_file = add_to_path(file, str2add=TEMP_FILE_SUFFIX)
+        cmd_list.append(["cdo", f"chname,{var_file},{var_std}", file, temp_file])
+        
+        # Rename the temporary file to the given file once the command succeeds
+        post_command_actions.append(partial(rename_output, temp_file, file))
+
+    # Run the commands concurrently and check their exit statuses in order
+    run_command_batch(
+        cmd_list,
+        max_workers=max_workers,
+        post_command_actions=post_command_actions,
+        capture_output=capture_output,
+        return_output_name=return_output_name,
+        encoding=encoding,
+        shell=shell
+    )
         
     
 def change_filenames_by_var(
@@ -1043,13 +2083,14 @@ def change_filenames_by_var(
         std_var = _get_varname_in_filename(file, True, varlist_orig, varlist_std)
         file_name_parts = obj_path_specs(file, file_spec_key="name_noext_parts", SPLIT_DELIM=SPLIT_DELIM1)
         new_filename = modify_obj_specs(file, "name_noext_parts", (file_name_parts[0], std_var))
-        rename_objects(file, new_filename)
+        rename_output(file, new_filename)
 
         
 
 # Time and Date Adjustment Functions #
 #~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~~#
 
+@in_process_netcdf
 def cdo_inttime(
         file_list: str | list[str], 
         year0: int, 
@@ -1062,14 +2103,21 @@ def cdo_inttime(
         capture_output: bool = False,
         return_output_name: bool = False,
         encoding: str = "utf-8", 
-        shell: bool = True) -> None:
+        shell: bool = True,
+        max_workers: int | None = None) -> None:
     """
-    Initialise time steps in files with a specific starting date and step using CDO's inttime operator.
+    Initialise time steps in files with a specific starting date and step.
     
     This function sets up time coordinates in NetCDF files by defining a starting
     date/time and a time step interval. It's useful for files that lack proper
     time coordinates or need time coordinate correction.
 
+    Only the time coordinate changes, so netCDF files are edited in place
+    (see `in_place_editing.set_time_axis_in_place`), writing the time
+    variable and its bounds but no data. CDO's settaxis operator is only
+    used for files that cannot be edited in place (e.g. GRIB files, or
+    time units such as 'months since').
+
     Parameters
     ----------
     file_list : str | list[str]
@@ -1091,16 +2139,25 @@ def cdo_inttime(
     capture_output : bool, optional
         Whether to capture the command output. Default is False.
     return_output_name : bool, optional
-        Whether to return file descriptor names. Default is False.
+        Kept for backwards compatibility; it has no effect. Default is False.
     encoding : str, optional
         Encoding to use when decoding command output. Default is "utf-8".
     shell : bool, optional
-        Whether to execute the command through the shell. Default is True.
+        Kept for backwards compatibility; commands never run through a shell.
+        Default is True.
+    max_workers : int | None, optional
+        Maximum number of files processed concurrently by CDO. If None, as
+        many files as available CPUs are processed at once. Default is None.
 
     Returns
     -------
     None
         The function modifies the files in-place by updating time coordinates.
+
+    Raises
+    ------
+    ValueError
+        If the time step is not supported.
         
     Examples
     --------
@@ -1113,45 +2170,56 @@ def cdo_inttime(
     else:
         file_list = list(flatten_list(file_list))
     
+    start_date = f"{year0}-{month0:02d}-{day0:02d}"
+    start_time = f"{hour0:02d}:{minute0:02d}:{second0:02d}"
+    
+    cmd_list = []
+    post_command_actions = []
     for file in file_list:
-        temp_file = add_to_path(file)
-        start_date = f"{year0}-{month0:02d}-{day0:02d} {hour0:02d}:{minute0:02d}:{second0:02d}"
-        cmd = f"cdo inttime,{start_date},{time_step} '{file}' '{temp_file}'"
+        # Rewrite only the time axis of netCDF files, if possible
+        if set_time_axis_in_place(file, f"{start_date} {start_time}", time_step):
+            continue
 
-        # Run the command and capture the output
-        process_exit_info = run_system_command(
-            cmd, 
-            capture_output=capture_output,
-            return_output_name=return_output_name,
-            encoding=encoding,
-            shell=shell
-        )
+        temp_file = add_to_path(file, str2add=TEMP_FILE_SUFFIX)
+        cmd_list.append(["cdo", f"settaxis,{start_date},{start_time},{time_step}", file, temp_file])
 
-        # Call exit_info with parameters based on capture_output    
-        exit_info(process_exit_info,
-            check_stdout=capture_output,
-            check_stderr=capture_output,
-            check_return_code=True
-        )
+        # Rename the temporary file to the given file once the command succeeds
+        post_command_actions.append(partial(rename_output, temp_file, file))
 
-        # Rename the temporary file to the given file
-        rename_objects(temp_file, file)
+    # Run the commands concurrently and check their exit statuses in order
+    run_command_batch(
+        cmd_list,
+        max_workers=max_workers,
+        post_command_actions=post_command_actions,
+        capture_output=capture_output,
+        return_output_name=return_output_name,
+        encoding=encoding,
+        shell=shell
+    )
         
 
+@in_process_netcdf
 def cdo_shifttime(
         file_list: str | list[str], 
         shift_val: str,
         capture_output: bool = False,
         return_output_name: bool = False,
         encoding: str = "utf-8",
-        shell: bool = True) -> None:
+        shell: bool = True,
+        max_workers: int | None = None) -> None:
     """
-    Shift time steps in files by a specified value using CDO's shifttime operator.
+    Shift time steps in files by a specified value, as CDO's shifttime operator does.
     
     This function adjusts time coordinates in NetCDF files by adding or subtracting
     a specified time amount. This is useful for correcting time zones, adjusting
     time references, or synchronising datasets.
 
+    Only the time coordinate changes, so netCDF files are edited in place
+    (see `in_place_editing.shift_time_axis_in_place`), writing the time
+    variable and its bounds but no data. CDO's shifttime operator is only
+    used for files that cannot be edited in place (e.g. GRIB files, or
+    time units such as 'months since').
+
     Parameters
     ----------
     file_list : str | list[str]
@@ -1162,16 +2230,25 @@ def cdo_shifttime(
     capture_output : bool, optional
         Whether to capture the command output. Default is False.
     return_output_name : bool, optional
-        Whether to return file descriptor names. Default is False.
+        Kept for backwards compatibility; it has no effect. Default is False.
     encoding : str, optional
         Encoding to use when decoding command output. Default is "utf-8".
     shell : bool, optional
-        Whether to execute the command through the shell. Default is True.
+        Kept for backwards compatibility; commands never run through a shell.
+        Default is True.
+    max_workers : int | None, optional
+        Maximum number of files processed concurrently by CDO. If None, as
+        many files as available CPUs are processed at once. Default is None.
         
     Returns
     -------
     None
         The function modifies the files in-place by shifting time coordinates.
+
+    Raises
+    ------
+    ValueError
+        If the shift is not supported.
         
     Examples
     --------
@@ -1187,28 +2264,29 @@ def cdo_shifttime(
     else:
         file_list = list(flatten_list(file_list))
     
+    cmd_list = []
+    post_command_actions = []
     for file in file_list:
-        temp_file = add_to_path(file)
-        cmd = f"cdo shifttime,{shift_val} '{file}' '{temp_file}'"
+        # Rewrite only the time axis of netCDF files, if possible
+        if shift_time_axis_in_place(file, shift_val):
+            continue
 
-        # Run the command and capture the output
-        process_exit_info = run_system_command(
-            cmd, 
-            capture_output=capture_output,
-            return_output_name=return_output_name,
-            encoding=encoding,
-            shell=shell
-        )   
+        temp_file = add_to_path(file, str2add=TEMP_FILE_SUFFIX)
+        cmd_list.append(["cdo", f"shifttime,{shift_val}", file, temp_file])
 
-        # Call exit_info with parameters based on capture_output
-        exit_info(process_exit_info,
-            check_stdout=capture_output,
-            check_stderr=capture_output,
-            check_return_code=True
-        )   
+        # Rename the temporary file to the given file once the command succeeds
+        post_command_actions.append(partial(rename_output, temp_file, file))
 
-        # Rename the temporary file to the given file
-        rename_objects(temp_file, file)
+    # Run the commands concurrently and check their exit statuses in order
+    run_command_batch(
+        cmd_list,
+        max_workers=max_workers,
+        post_command_actions=post_command_actions,
+        capture_output=capture_output,
+        return_output_name=return_output_name,
+        encoding=encoding,
+        shell=shell
+    )
 
 
 # Miscellaneous Functions #
@@ -1255,6 +2333,7 @@ yfirst    = {4:.20f}
         output_f.write(grid_str)        
         
 
+@in_process_netcdf
 def custom_cdo_mergetime(
         file_list: str | list[str], 
         custom_output_name: str, 
@@ -1262,7 +2341,11 @@ def custom_cdo_mergetime(
         capture_output: bool = False,
         return_output_name: bool = False,
         encoding: str = "utf-8",
-        shell: bool = True) -> None:
+        shell: bool = True,
+        storage_policy: StoragePolicy | None = None,
+        max_fan_in: int | None = None,
+        max_workers: int | None = None,
+        append: bool = False) -> None:
     """
     Custom CDO mergetime operation that optionally uses a temporary file.
     
@@ -1282,21 +2365,47 @@ def custom_cdo_mergetime(
     capture_output : bool, optional
         Whether to capture the command output. Default is False.
     return_output_name : bool, optional
-        Whether to return file descriptor names. Default is False.
+        Kept for backwards compatibility; it has no effect. Default is False.
     encoding : str, optional
         Encoding to use when decoding command output. Default is "utf-8".
     shell : bool, optional
-        Whether to execute the command through the shell. Default is True.
+        Kept for backwards compatibility; commands never run through a shell.
+        Default is True.
+    storage_policy : StoragePolicy | None, optional
+        Precision, compression and chunking of the output file. If None,
+        the output is written as 64-bit floats in netCDF4 format, without
+        compression. Default is None.
+    max_fan_in : int | None, optional
+        Maximum number of files merged by a single CDO command. Longer file
+        lists are merged as a tree of concurrent group merges, with the same
+        result as a flat merge. If None, `DEFAULT_MERGE_FAN_IN`.
+        Default is None.
+    max_workers : int | None, optional
+        Maximum number of group merges run concurrently in a tree merge.
+        If None, as many as available CPUs. Default is None.
+    append : bool, optional
+        If True and `custom_output_name` exists, only the time steps of
+        `file_list` are appended to it in place (see
+        `in_place_editing.append_time_steps`), instead of merging the whole
+        series again. `create_temp_file` and `storage_policy` do not apply
+        to appends. Default is False.
 
     Returns
     -------
     None
         The function creates a merged NetCDF file with the specified name.
+
+    Raises
+    ------
+    ValueError
+        If `append` is True and the files are not compatible with the
+        merged file or their time steps overlap it.
         
     Notes
     -----
-    This function uses 64-bit floating point precision (-b F64) and NetCDF4
-    format (-f nc4) for the output file.
+    If no `storage_policy` is given, the output file is written with 64-bit
+    floating point precision (-b F64) in NetCDF4 format (-f nc4); otherwise
+    its precision, format, compression and chunking follow the policy.
     
     Examples
     --------
@@ -1306,6 +2415,9 @@ def custom_cdo_mergetime(
     >>> # Merge with temporary file creation
     >>> custom_cdo_mergetime(['file1.nc', 'file2.nc'], 'output.nc', 
     ...                      create_temp_file=True)
+
+    >>> # Add a new day to an existing merged file
+    >>> custom_cdo_mergetime(['tas_20250102.nc'], 'merged_data.nc', append=True)
     """
     # Defensive programming: handle nested lists
     if not isinstance(file_list, list):
@@ -1313,29 +2425,319 @@ def custom_cdo_mergetime(
     else:
         file_list = list(flatten_list(file_list))
     
-    allfiles_string = flatten_to_string(file_list)
-    
-    if not create_temp_file:
-        cmd = f"cdo -b F64 -f nc4 mergetime '{allfiles_string}' {custom_output_name}"
-    else:
-        temp_file = add_to_path(file_list[0])
-        cmd = f"cdo -b F64 -f nc4 mergetime '{allfiles_string}' {temp_file}"
-                     
-    # Run the command and capture the output
-    process_exit_info = run_system_command(
-        cmd, 
-        capture_output=capture_output,
-        return_output_name=return_output_name,
-        encoding=encoding,
-        shell=shell
-    )
+    # Append only the new time steps to an existing merged file
+    if append and os.path.exists(custom_output_name):
+        append_time_steps(custom_output_name, file_list)
+        return
 
-    # Call exit_info with parameters based on capture_output
-    exit_info(process_exit_info,
-        check_stdout=capture_output,
-        check_stderr=capture_output,
-        check_return_code=True
-    )
+    output_file = (custom_output_name if not create_temp_file
+                   else add_to_path(file_list[0], str2add=TEMP_FILE_SUFFIX))
+    _mergetime(file_list, output_file,
+               storage_policy=storage_policy,
+               max_fan_in=max_fan_in,
+               max_workers=max_workers,
+               capture_output=capture_output,
+               encoding=encoding)
+
+
+# Operator Chaining #
+#~~~~~~~~~~~~~~~~~~~#
+
+class CdoPipeline:
+    """
+    Chain several CDO operators into a single command without intermediate files.
+
+    Each method appends one processing step, in the order the steps are to be
+    applied, and returns the pipeline itself so that calls can be chained.
+    When run, the steps are emitted as one CDO operator chain, e.g.
+
+        cdo ymonmean -remapbil,grid.txt -sellonlatbox,-10,40,35,70 -selyear,2000/2010 in.nc out.nc
+
+    so that CDO streams the data between operators in memory and only the
+    final product is written to disk.
+
+    Examples
+    --------
+    >>> pipeline = (CdoPipeline()
+    ...             .selyear('2000/2010')
+    ...             .sellonlatbox('-10,40,35,70')
+    ...             .remap('grid.txt', remap_proc='bilinear')
+    ...             .periodic_statistics('mean', True, 'monthly'))
+    >>> pipeline.build_command('tas_day_ERA5.nc', 'tas_ymonmean.nc')
+    'cdo ymonmean -remapbil,grid.txt -sellonlatbox,-10,40,35,70 -selyear,2000/2010 tas_day_ERA5.nc tas_ymonmean.nc'
+    >>> pipeline.run(['tas_day_ERA5.nc'], 'monthly', 'ERA5', 'reanalysis',
+    ...              'ymonmean', '2000-2010', 'europe', 'nc')
+    """
+
+    def __init__(self) -> None:
+        self.operators = []
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.operators!r})"
+
+    def add_operator(self, operator: str) -> "CdoPipeline":
+        """
+        Append an arbitrary CDO operator (with its arguments, without leading dash).
+
+        Parameters
+        ----------
+        operator : str
+            CDO operator string, e.g. 'selmon,6/8' or 'timmean'.
+
+        Returns
+        -------
+        CdoPipeline
+            The pipeline itself.
+        """
+        self.operators.append(operator.lstrip("-"))
+        return self
+
+    def selyear(self, selyear_str: str) -> "CdoPipeline":
+        """
+        Append a year selection step (see `cdo_selyear`).
+
+        Parameters
+        ----------
+        selyear_str : str
+            Start and end years separated by '/' or '-' (e.g., '2000/2010').
+
+        Returns
+        -------
+        CdoPipeline
+            The pipeline itself.
+        """
+        selyear_split = obj_path_specs(selyear_str, file_spec_key="name_noext_parts", SPLIT_DELIM=SPLIT_DELIM2)
+        return self.add_operator(f"selyear,{selyear_split[0]}/{selyear_split[-1]}")
+
+    def sellonlatbox(self, coords: str) -> "CdoPipeline":
+        """
+        Append a longitude-latitude box selection step (see `cdo_sellonlatbox`).
+
+        Parameters
+        ----------
+        coords : str
+            Box coordinates as 'lonwest,loneast,latsouth,latnorth'.
+
+        Returns
+        -------
+        CdoPipeline
+            The pipeline itself.
+        """
+        return self.add_operator(f"sellonlatbox,{coords}")
+
+    def remap(self, remap_str: str, remap_proc: str = "bilinear") -> "CdoPipeline":
+        """
+        Append a remapping step (see `cdo_remap`).
+
+        Parameters
+        ----------
+        remap_str : str
+            Target grid specification or grid description file path.
+        remap_proc : str, optional
+            Remapping procedure, one of `CDO_REMAP_OPTIONS`. Default is 'bilinear'.
+
+        Returns
+        -------
+        CdoPipeline
+            The pipeline itself.
+
+        Raises
+        ------
+        ValueError
+            If `remap_proc` is not one of the supported CDO remap options.
+        """
+        if remap_proc not in CDO_REMAP_OPTIONS:
+            raise ValueError(f"Unsupported remap procedure. Options are {CDO_REMAP_OPTIONS}")
+        return self.add_operator(f"{CDO_REMAP_OPTION_DICT[remap_proc]},{remap_str}")
+
+    def time_mean(self, calc_proc: str = "timmean") -> "CdoPipeline":
+        """
+        Append a whole-period statistic step (see `cdo_time_mean`).
+
+        Parameters
+        ----------
+        calc_proc : str, optional
+            CDO operator to apply over the whole time axis. Default is 'timmean'.
+
+        Returns
+        -------
+        CdoPipeline
+            The pipeline itself.
+        """
+        return self.add_operator(calc_proc)
+
+    def periodic_statistics(
+            self,
+            statistic: str,
+            is_climatic: bool,
+            freq: str,
+            season_str: str | None = None) -> "CdoPipeline":
+        """
+        Append a periodic statistics step (see `cdo_periodic_statistics`).
+
+        Parameters
+        ----------
+        statistic : str
+            Statistic to calculate (e.g., 'mean', 'sum').
+        is_climatic : bool
+            Whether to calculate climatic statistics.
+        freq : str
+            Time frequency (e.g., 'monthly', 'yearly').
+        season_str : str, optional
+            Season to select (e.g., 'DJF') before calculating the statistic.
+            Default is None.
+
+        Returns
+        -------
+        CdoPipeline
+            The pipeline itself.
+        """
+        statname = _get_periodic_statname(statistic, is_climatic, freq)
+        if season_str:
+            self.add_operator(f"select,season={season_str}")
+        return self.add_operator(statname)
+
+    def build_argv(self, input_file: str, output_file: str) -> list[str]:
+        """
+        Build the argument vector of the chained CDO command for a single input file.
+
+        Parameters
+        ----------
+        input_file : str
+            Path to the input file.
+        output_file : str
+            Path to the output file.
+
+        Returns
+        -------
+        list[str]
+            The CDO command, with the last appended step as the outermost operator.
+
+        Raises
+        ------
+        ValueError
+            If the pipeline has no steps.
+        """
+        if not self.operators:
+            raise ValueError("The pipeline has no operators.")
+        
+        outer_operator, *inner_operators = self.operators[::-1]
+        return ["cdo", outer_operator, *[f"-{op}" for op in inner_operators], input_file, output_file]
+
+    def build_command(self, input_file: str, output_file: str) -> str:
+        """
+        Build the chained CDO command for a single input file, as a command line.
+
+        Parameters
+        ----------
+        input_file : str
+            Path to the input file.
+        output_file : str
+            Path to the output file.
+
+        Returns
+        -------
+        str
+            The shell-quoted form of `build_argv`.
+        """
+        return format_command(self.build_argv(input_file, output_file))
+
+    def run(
+            self,
+            file_list: str | list[str],
+            freq: str,
+            model: str,
+            experiment: str,
+            calc_proc: str,
+            period: str,
+            region: str,
+            ext: str,
+            capture_output: bool = False,
+            return_output_name: bool = False,
+            encoding: str = "utf-8",
+            shell: bool = True,
+            max_workers: int | None = None,
+            storage_policy: StoragePolicy | None = None) -> list[str]:
+        """
+        Run the chained command on every file, writing only the final products.
+
+        Output files are named with `_standardise_filename`, taking the
+        variable name from each input file name.
+
+        Parameters
+        ----------
+        file_list : str | list[str]
+            Single file path or list of NetCDF file paths to process.
+        freq : str
+            Frequency of the data (e.g., 'daily', 'monthly').
+        model : str
+            Model name for the output file naming.
+        experiment : str
+            Experiment name or type for the output file naming.
+        calc_proc : str
+            Calculation procedure for the output file naming.
+        period : str
+            Time period string (e.g., '2000-2020') for the output file naming.
+        region : str
+            Region or geographic area for the output file naming.
+        ext : str
+            File extension for the output files (e.g., 'nc').
+        capture_output : bool, optional
+            Whether to capture the command output. Default is False.
+        return_output_name : bool, optional
+            Kept for backwards compatibility; it has no effect. Default is False.
+        encoding : str, optional
+            Encoding to use when decoding command output. Default is "utf-8".
+        shell : bool, optional
+            Kept for backwards compatibility; commands never run through a shell.
+            Default is True.
+        max_workers : int | None, optional
+            Maximum number of files processed concurrently. If None, as many
+            files as available CPUs are processed at once. Default is None.
+        storage_policy : StoragePolicy | None, optional
+            Precision, compression and chunking of the output files. If None,
+            CDO's defaults are used. Default is None.
+
+        Returns
+        -------
+        list[str]
+            The output file names, in the order of `file_list`.
+
+        Raises
+        ------
+        ValueError
+            If several input files would be written to the same output file
+            (e.g. files of the same variable).
+        """
+        # Defensive programming: handle nested lists
+        if not isinstance(file_list, list):
+            file_list = [file_list]
+        else:
+            file_list = list(flatten_list(file_list))
+        
+        output_name_list = []
+        cmd_list = []
+        for file in file_list:
+            var = _get_varname_in_filename(file)
+            output_name = _standardise_filename(var, freq, model, experiment, calc_proc, period, region, ext)
+            output_name_list.append(output_name)
+            cmd_list.append(_apply_storage_policy(self.build_argv(file, output_name), storage_policy))
+
+        if len(set(output_name_list)) < len(output_name_list):
+            raise ValueError("Several input files would be written to the same output file. "
+                             "Process them separately or merge them first.")
+            
+        # Run the commands concurrently and check their exit statuses in order
+        run_command_batch(
+            cmd_list,
+            max_workers=max_workers,
+            capture_output=capture_output,
+            return_output_name=return_output_name,
+            encoding=encoding,
+            shell=shell
+        )
+        
+        return output_name_list
 
 
 #--------------------------#
@@ -1352,6 +2754,14 @@ SPLIT_DELIM2 = COMMON_DELIMITER_LIST[1]
 # Grid header file function key list #
 KEYLIST = ['total_columns', 'total_lines', 'xmin', 'xres', 'ymin', 'yres']
 
+# Suffix of the temporary files that replace their input once a command succeeds #
+TEMP_FILE_SUFFIX = "_temp"
+
+# Tree merges #
+DEFAULT_MERGE_FAN_IN = 128
+MERGETIME_ARGS = ["cdo", "-b", "F64", "-f", "nc4", "mergetime"]
+TREE_MERGE_TEMP_DIR_PREFIX = ".mergetime_tree_"
+
 # Calendar and date-time parameters #
 TIME_FREQS_DELTA = [TIME_FREQUENCIES_ABBREVIATED[0]] + TIME_FREQUENCIES_ABBREVIATED[2:4]
 FREQ_ABBRS_DELTA = [TIME_FREQUENCIES_BRIEF[0]] + TIME_FREQUENCIES_BRIEF[2:4]
@@ -1366,6 +2776,9 @@ STATKIT = [
     "var", "var1",
     "std", "std1"
 ]
+
+# Computation engines for the statistical functions #
+ENGINE_OPTS = ["cdo", "xarray"]
   
 # CDO remapping options #
 CDO_REMAP_OPTION_DICT = {
@@ -1386,6 +2799,31 @@ CDO_REMAP_OPTION_DICT = {
 
 CDO_REMAP_OPTIONS = list(CDO_REMAP_OPTION_DICT.keys())
 
+# CDO remapping weight generation operators #
+CDO_REMAP_WEIGHTS_OPTION_DICT = {
+    "bilinear" : "genbil",
+    "nearest_neighbour" : "gennn",
+    "bicubic" : "genbic",
+    "conservative1" : "gencon",
+    "conservative2" : "gencon2",
+    "conservative1_y" : "genycon",
+    "distance_weighted_average" : "gendis",
+    "largest_area_fraction" : "genlaf",
+}
+
+# Climatology and anomaly operators by period abbreviation #
+CLIMATOLOGY_OPERATOR_DICT = {
+    FREQ_ABBRS_DELTA[0]: "timmean",
+    FREQ_ABBRS_DELTA[1]: "ymonmean",
+    FREQ_ABBRS_DELTA[2]: "ydaymean"
+}
+
+ANOMALY_OPERATOR_DICT = {
+    FREQ_ABBRS_DELTA[0]: "sub",
+    FREQ_ABBRS_DELTA[1]: "ymonsub",
+    FREQ_ABBRS_DELTA[2]: "ydaysub"
+}
+
 # Basic operator switch case dictionary #
 CDO_OPERATOR_STR_DICT = {
     BASIC_ARITHMETIC_OPERATORS[0] : "add",
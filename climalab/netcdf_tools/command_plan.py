@@ -0,0 +1,376 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import os
+import shlex
+import threading
+from contextlib import contextmanager
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from climalab.netcdf_tools.command_telemetry import command_operator
+from filewise.file_operations.ops_handler import rename_objects
+
+#-------------------------#
+# Define custom functions #
+#-------------------------#
+
+# Command plans #
+#---------------#
+
+class CommandPlan:
+    """
+    Record of the steps a sequence of CDO/NCO wrapper calls would run.
+
+    Plans are collected with `plan_commands`. Each step is a dictionary with
+    keys:
+    - 'index': position of the step in the plan.
+    - 'operator': operator name (see `command_telemetry.command_operator`).
+    - 'command': command line, or None for in-process steps.
+    - 'inputs', 'outputs': files read and written.
+    - 'bytes_read': size of the inputs; inputs produced by earlier steps
+      count with their estimated size.
+    - 'bytes_written': estimated size of the outputs, taken as the size of
+      the inputs (an upper bound for reducing operators such as `timmean`).
+
+    Examples
+    --------
+    >>> with plan_commands() as plan:
+    ...     cdo_selyear(file_list, '1981-2010', 'daily', 'ERA5', 'reanalysis',
+    ...                 'selyear', 'europe', 'nc')
+    ...     cdo_selyear(file_list, '1981-2010', 'daily', 'ERA5', 'reanalysis',
+    ...                 'selyear', 'europe', 'nc')
+    >>> print(plan.format())
+    """
+
+    def __init__(self) -> None:
+        self.steps = []
+        self._estimated_sizes = {}
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(n_steps={len(self.steps)})"
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+    def _file_size(self, file: str) -> int:
+        if file in self._estimated_sizes:
+            return self._estimated_sizes[file]
+        try:
+            return os.path.getsize(file)
+        except OSError:
+            return 0
+
+    def _is_known_file(self, file: str) -> bool:
+        return file in self._estimated_sizes or os.path.isfile(file)
+
+    # Recording #
+    #~~~~~~~~~~~#
+
+    def add_step(self,
+                 operator: str,
+                 input_files: list[str],
+                 output_files: list[str],
+                 command: str | None = None,
+                 metadata_only: bool = False) -> dict:
+        """
+        Add a step to the plan.
+
+        Parameters
+        ----------
+        operator : str
+            Operator name.
+        input_files : list[str]
+            Files read by the step.
+        output_files : list[str]
+            Files written by the step.
+        command : str | None, optional
+            Command line of the step, if it runs an external program.
+            Default is None.
+        metadata_only : bool, optional
+            Whether the step only edits file headers or coordinates in
+            place, counting no bytes read or written. Default is False.
+
+        Returns
+        -------
+        dict
+            The recorded step.
+        """
+        with self._lock:
+            if metadata_only:
+                bytes_read = 0
+            else:
+                bytes_read = sum(self._file_size(file) for file in input_files)
+            step = dict(
+                index=len(self.steps),
+                operator=operator,
+                command=command,
+                inputs=list(input_files),
+                outputs=list(output_files),
+                bytes_read=bytes_read,
+                bytes_written=bytes_read * len(output_files)
+            )
+            if not metadata_only:
+                for file in output_files:
+                    self._estimated_sizes[file] = bytes_read
+            self.steps.append(step)
+            return step
+
+    def add_command(self, argv: list[str]) -> dict:
+        """
+        Add an external command to the plan, inferring its input and output files.
+
+        The last argument is taken as the output file; the other arguments
+        that are existing files, or outputs of earlier steps, as inputs.
+        Programs that edit their last argument in place (`IN_PLACE_PROGRAMS`)
+        read and write that same file.
+
+        Parameters
+        ----------
+        argv : list[str]
+            Argument vector of the command.
+
+        Returns
+        -------
+        dict
+            The recorded step.
+        """
+        program = os.path.basename(argv[0])
+        if program in IN_PLACE_PROGRAMS:
+            input_files = output_files = [argv[-1]]
+        else:
+            output_files = [argv[-1]]
+            input_files = [arg for arg in argv[1:-1] if self._is_known_file(arg)]
+        return self.add_step(command_operator(argv), input_files, output_files, shlex.join(argv))
+
+    def add_rename(self, src_file: str, dst_file: str) -> dict:
+        """
+        Add the renaming of a file, e.g. of a temporary output to its final name.
+
+        The step moves the estimated size of `src_file` to `dst_file` and
+        counts no bytes read or written.
+
+        Parameters
+        ----------
+        src_file : str
+            Current file name.
+        dst_file : str
+            New file name.
+
+        Returns
+        -------
+        dict
+            The recorded step.
+        """
+        with self._lock:
+            self._estimated_sizes[dst_file] = self._estimated_sizes.pop(src_file, self._file_size(src_file))
+            step = dict(
+                index=len(self.steps),
+                operator=RENAME_OPERATOR,
+                command=None,
+                inputs=[src_file],
+                outputs=[dst_file],
+                bytes_read=0,
+                bytes_written=0
+            )
+            self.steps.append(step)
+            return step
+
+    # Analysis #
+    #~~~~~~~~~~#
+
+    def total_bytes_read(self) -> int:
+        """
+        Return the estimated number of bytes read by the whole plan.
+        """
+        return sum(step["bytes_read"] for step in self.steps)
+
+    def total_bytes_written(self) -> int:
+        """
+        Return the estimated number of bytes written by the whole plan.
+        """
+        return sum(step["bytes_written"] for step in self.steps)
+
+    def duplicate_steps(self) -> list[tuple[int, int]]:
+        """
+        Find steps repeating the same operation on the same inputs.
+
+        Two steps are duplicates if they run the same command (or in-process
+        operator) on the same inputs, regardless of the output name, and
+        none of those inputs was rewritten in between.
+
+        Returns
+        -------
+        list[tuple[int, int]]
+            Pairs (index of the first step, index of the repeated step).
+        """
+        duplicates = []
+        seen_steps = {}
+        last_writer = {}
+        for step in self.steps:
+            signature = (
+                step["operator"],
+                shlex.join(shlex.split(step["command"])[:-1]) if step["command"] else None,
+                tuple(step["inputs"]),
+                tuple(last_writer.get(file) for file in step["inputs"])
+            )
+            if signature in seen_steps and step["operator"] != RENAME_OPERATOR:
+                duplicates.append((seen_steps[signature], step["index"]))
+            else:
+                seen_steps.setdefault(signature, step["index"])
+            for file in step["outputs"]:
+                last_writer[file] = step["index"]
+        return duplicates
+
+    def overwritten_outputs(self) -> list[tuple[int, int, str]]:
+        """
+        Find outputs written again before any step has read them.
+
+        Returns
+        -------
+        list[tuple[int, int, str]]
+            Tuples (index of the wasted step, index of the overwriting step, file).
+        """
+        overwritten = []
+        pending_writes = {}
+        for step in self.steps:
+            for file in step["inputs"]:
+                pending_writes.pop(file, None)
+            for file in step["outputs"]:
+                if file in pending_writes and file not in step["inputs"]:
+                    overwritten.append((pending_writes[file], step["index"], file))
+                pending_writes[file] = step["index"]
+        return overwritten
+
+    def format(self) -> str:
+        """
+        Format the plan, its I/O estimates and its redundant steps as text.
+
+        Returns
+        -------
+        str
+            Multi-line description of the plan.
+        """
+        lines = [PLAN_HEADER_TEMPLATE.format(len(self.steps),
+                                             self.total_bytes_read() / 1024**3,
+                                             self.total_bytes_written() / 1024**3)]
+        for step in self.steps:
+            lines.append(PLAN_STEP_TEMPLATE.format(step["index"],
+                                                   step["operator"],
+                                                   step["bytes_read"] / 1024**2,
+                                                   step["bytes_written"] / 1024**2,
+                                                   step["command"] or f"{step['inputs']} -> {step['outputs']}"))
+        for first_idx, repeated_idx in self.duplicate_steps():
+            lines.append(f"- Step {repeated_idx} repeats step {first_idx}")
+        for wasted_idx, overwriting_idx, file in self.overwritten_outputs():
+            lines.append(f"- Step {overwriting_idx} overwrites '{file}' from step {wasted_idx} before it is used")
+        return "\n".join(lines)
+
+
+# Plan mode #
+#-----------#
+
+@contextmanager
+def plan_commands():
+    """
+    Run CDO/NCO wrapper calls in dry-run (plan) mode.
+
+    Within the context, `command_runner` records every command in a
+    `CommandPlan` instead of running it, and in-process engines (e.g. the
+    xarray and streaming statistics) record a step instead of computing.
+    Renaming or replacing temporary files is skipped as well, so no file is
+    written. Wrapper logic that reads existing inputs (e.g. to name
+    outputs after the time span of a file) still does so.
+
+    Yields
+    ------
+    CommandPlan
+        The plan being collected.
+
+    Examples
+    --------
+    >>> with plan_commands() as plan:
+    ...     apply_periodic_deltas_batch(proj_files, 'tas_hist.nc', '+', 'monthly', 'EC-Earth3')
+    >>> plan.duplicate_steps(), plan.total_bytes_written()
+    """
+    global _active_plan
+    previous_plan = _active_plan
+    _active_plan = CommandPlan()
+    try:
+        yield _active_plan
+    finally:
+        _active_plan = previous_plan
+
+
+def is_planning() -> bool:
+    """
+    Return whether commands are currently being planned instead of run.
+
+    Returns
+    -------
+    bool
+        True within a `plan_commands` context.
+    """
+    return _active_plan is not None
+
+
+def get_active_plan() -> CommandPlan | None:
+    """
+    Return the plan being collected, if any.
+
+    Returns
+    -------
+    CommandPlan | None
+        The active plan, or None outside a `plan_commands` context.
+    """
+    return _active_plan
+
+
+def rename_output(src_file: str, dst_file: str) -> None:
+    """
+    Rename a file, or only record the renaming in plan mode.
+
+    Wrappers use it to move temporary outputs to their final names.
+
+    Parameters
+    ----------
+    src_file : str
+        Current file name.
+    dst_file : str
+        New file name.
+
+    Returns
+    -------
+    None
+    """
+    plan = _active_plan
+    if plan is not None:
+        plan.add_rename(src_file, dst_file)
+    else:
+        rename_objects(src_file, dst_file)
+
+#--------------------------#
+# Parameters and constants #
+#--------------------------#
+
+# Active plan #
+_active_plan = None
+
+# Operator name of renaming steps #
+RENAME_OPERATOR = "rename"
+
+# Programs that edit their last argument in place #
+IN_PLACE_PROGRAMS = ["ncatted", "ncrename"]
+
+# Template strings #
+#------------------#
+
+PLAN_HEADER_TEMPLATE = "{} steps; estimated {:.2f} GiB read, {:.2f} GiB written"
+PLAN_STEP_TEMPLATE = "[{:>4}] {:<16} read {:>10.1f} MiB, write {:>10.1f} MiB: {}"
@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import os
+import shlex
+import subprocess
+import sys
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import IO
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from climalab.netcdf_tools.command_plan import get_active_plan
+from climalab.netcdf_tools.command_telemetry import record_command, snapshot_command_files
+from climalab.netcdf_tools.cpu_budget import add_thread_option, get_cpu_budget
+from pygenutils.operative_systems.os_operations import exit_info
+
+#-------------------------#
+# Define custom functions #
+#-------------------------#
+
+# Internal Helper Functions #
+#---------------------------#
+
+def _resolve_max_workers(max_workers: int | None, n_commands: int) -> int:
+    """
+    Resolve the number of worker threads to use for a batch of commands.
+
+    Parameters
+    ----------
+    max_workers : int | None
+        Requested number of concurrent commands. If None, `DEFAULT_MAX_WORKERS`
+        is used.
+    n_commands : int
+        Number of commands in the batch. The pool is never larger than this.
+
+    Returns
+    -------
+    int
+        Number of worker threads, at least 1.
+
+    Raises
+    ------
+    ValueError
+        If `max_workers` is not a positive integer.
+    """
+    if max_workers is None:
+        max_workers = DEFAULT_MAX_WORKERS
+    elif not isinstance(max_workers, int) or max_workers < 1:
+        raise ValueError(f"'max_workers' must be a positive integer, got {max_workers!r}.")
+    return max(1, min(max_workers, n_commands))
+
+
+def _as_argv(cmd: list[str] | str) -> list[str]:
+    """
+    Return a command as an argument vector, splitting strings with shell-like syntax.
+    """
+    return shlex.split(cmd) if isinstance(cmd, str) else [str(arg) for arg in cmd]
+
+
+def _wait_with_rusage(process: subprocess.Popen) -> tuple[str | None, str | None, dict]:
+    """
+    Wait for a child process, collecting its output and its own resource usage.
+
+    On POSIX systems the child is reaped with `os.wait4`, which returns the
+    CPU times and peak memory of that child alone (unlike
+    `resource.getrusage`, which mixes every child of the Python process).
+    Elsewhere, only the output is collected.
+
+    Parameters
+    ----------
+    process : subprocess.Popen
+        A freshly started process.
+
+    Returns
+    -------
+    tuple[str | None, str | None, dict]
+        Captured standard output and error (or None), and a dictionary with
+        keys 'user_cpu_seconds', 'sys_cpu_seconds' and 'max_rss_kb'
+        (None values where not available).
+    """
+    usage = dict(user_cpu_seconds=None, sys_cpu_seconds=None, max_rss_kb=None)
+    if not hasattr(os, "wait4"):
+        stdout_data, stderr_data = process.communicate()
+        return stdout_data, stderr_data, usage
+
+    # Drain the pipes in the background, so a chatty child never blocks #
+    outputs = {}
+
+    def read_stream(name, stream):
+        outputs[name] = stream.read()
+        stream.close()
+
+    readers = [threading.Thread(target=read_stream, args=(name, stream))
+               for name, stream in (("stdout", process.stdout), ("stderr", process.stderr))
+               if stream is not None]
+    for reader in readers:
+        reader.start()
+
+    _, wait_status, rusage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(wait_status)
+    for reader in readers:
+        reader.join()
+
+    # 'ru_maxrss' is in bytes on macOS and in kibibytes elsewhere
+    max_rss_kb = rusage.ru_maxrss // 1024 if sys.platform == "darwin" else rusage.ru_maxrss
+    usage.update(user_cpu_seconds=rusage.ru_utime,
+                 sys_cpu_seconds=rusage.ru_stime,
+                 max_rss_kb=max_rss_kb)
+    return outputs.get("stdout"), outputs.get("stderr"), usage
+
+
+def _format_failure(cmd: list[str] | str, err: Exception) -> str:
+    """
+    Format a failed command and its error for batch failure reports.
+
+    Parameters
+    ----------
+    cmd : list[str] | str
+        The command that failed.
+    err : Exception
+        The error raised while checking the command's exit status.
+
+    Returns
+    -------
+    str
+        A single report entry.
+    """
+    return f"- {format_command(cmd)}\n  {err}"
+
+
+# Main functions #
+#----------------#
+
+def format_command(cmd: list[str] | str) -> str:
+    """
+    Render an argument vector as a single, shell-quoted command line, for display.
+
+    Parameters
+    ----------
+    cmd : list[str] | str
+        Argument vector, or a command line, which is returned unchanged.
+
+    Returns
+    -------
+    str
+        Command line.
+    """
+    return cmd if isinstance(cmd, str) else shlex.join(str(arg) for arg in cmd)
+
+
+def run_command(
+        cmd: list[str] | str,
+        capture_output: bool = False,
+        encoding: str = "utf-8",
+        stdout: int | IO | None = None,
+        read_only: bool = False) -> dict:
+    """
+    Run a single command from its argument vector, without a shell, and time it.
+
+    The program is executed directly, so no `/bin/sh` process is forked
+    and arguments (e.g. file paths containing spaces or quotes) reach it
+    verbatim, without any quoting. Within a
+    `command_telemetry.trace_commands` context, a telemetry record of the
+    command is also appended to the trace. Within a
+    `command_plan.plan_commands` context, the command is recorded in the
+    plan instead of being run (unless `read_only`), and a successful exit
+    is reported.
+
+    Parameters
+    ----------
+    cmd : list[str] | str
+        Argument vector, e.g. ['cdo', 'timmean', 'in.nc', 'out.nc'].
+        A string is split with shell-like syntax (`shlex.split`), but shell
+        features such as pipes or redirections are not available.
+    capture_output : bool, optional
+        Whether to capture the standard output and error. Default is False.
+    encoding : str, optional
+        Encoding to use when decoding captured output. Default is "utf-8".
+    stdout : int | IO | None, optional
+        Where to stream the standard output, e.g. an open file, the write
+        end of a pipe or `subprocess.DEVNULL`. If given, it takes
+        precedence over `capture_output` for the standard output.
+        Default is None.
+    read_only : bool, optional
+        Whether the command only inspects files (e.g. `cdo griddes`). Such
+        commands run even in plan mode, since wrappers act on their output.
+        Default is False.
+
+    Returns
+    -------
+    dict
+        Exit information, accepted by `exit_info`, with keys:
+        - 'args': the argument vector.
+        - 'stdout', 'stderr': captured output, or None.
+        - 'return_code': exit status of the command.
+        - 'errors': None.
+        - 'elapsed_seconds': wall-clock duration of the command.
+        - 'user_cpu_seconds', 'sys_cpu_seconds', 'max_rss_kb': CPU times and
+          peak resident memory of the child process, or None where the
+          platform does not provide them.
+
+    Raises
+    ------
+    RuntimeError
+        If the program cannot be found.
+
+    Examples
+    --------
+    >>> process_exit_info = run_command(['cdo', '-s', 'griddes', 'tas.nc'], capture_output=True)
+    >>> process_exit_info['elapsed_seconds']
+    0.043
+    """
+    argv = _as_argv(cmd)
+    plan = get_active_plan()
+    if plan is not None and not read_only:
+        plan.add_command(argv)
+        return {"args": argv, "stdout": "", "stderr": "", "return_code": 0, "errors": None,
+                "elapsed_seconds": 0.0, "user_cpu_seconds": None, "sys_cpu_seconds": None,
+                "max_rss_kb": None}
+
+    if stdout is None:
+        stdout = subprocess.PIPE if capture_output else None
+    stderr = subprocess.PIPE if capture_output else None
+    file_snapshot = snapshot_command_files(argv)
+
+    start_time = time.perf_counter()
+    try:
+        process = subprocess.Popen(argv, stdout=stdout, stderr=stderr, encoding=encoding)
+    except FileNotFoundError as err:
+        raise RuntimeError(f"Program '{argv[0]}' not found. Please check the command.") from err
+    stdout_data, stderr_data, usage = _wait_with_rusage(process)
+    elapsed_seconds = time.perf_counter() - start_time
+
+    process_exit_info = {
+        "args": argv,
+        "stdout": stdout_data,
+        "stderr": stderr_data,
+        "return_code": process.returncode,
+        "errors": None,
+        "elapsed_seconds": elapsed_seconds,
+        **usage
+    }
+    record_command(argv, process_exit_info, file_snapshot)
+    return process_exit_info
+
+
+def run_command_batch(
+        command_list: list[list[str] | str],
+        max_workers: int | None = None,
+        post_command_actions: list[Callable[[], None] | None] | None = None,
+        capture_output: bool = False,
+        return_output_name: bool = False,
+        encoding: str = "utf-8",
+        shell: bool = True) -> list[dict]:
+    """
+    Run independent system commands concurrently and check all their exit statuses.
+
+    Each command is launched through `run_command` on a thread pool,
+    so that up to `max_workers` child processes (e.g. one CDO call per file)
+    run at the same time. Once every command has finished, the results are
+    passed to `exit_info` strictly in the order of `command_list`, so that
+    the printed output and the reported failures do not depend on which
+    command happened to finish first.
+
+    Parameters
+    ----------
+    command_list : list[list[str] | str]
+        Argument vectors of the commands to execute (strings are split as
+        in `run_command`). They must not depend on each other's outputs.
+    max_workers : int | None, optional
+        Maximum number of commands running at the same time. If None,
+        `DEFAULT_MAX_WORKERS` (the number of available CPUs) is used, or,
+        if a CPU budget is set (see `cpu_budget.set_cpu_budget`), the number
+        it chooses together with the CDO `-P` threads of each command.
+        Use 1 to run the commands sequentially.
+    post_command_actions : list[Callable[[], None] | None] | None, optional
+        Optional callables, one per command (or None), executed in order
+        after the corresponding command has been checked successfully,
+        e.g. renaming a temporary output file to its final name.
+        Default is None.
+    capture_output : bool, optional
+        Whether to capture the command output. Default is False.
+    return_output_name : bool, optional
+        Kept for backwards compatibility; it has no effect. Default is False.
+    encoding : str, optional
+        Encoding to use when decoding command output. Default is "utf-8".
+    shell : bool, optional
+        Kept for backwards compatibility; commands never run through a shell.
+        Default is True.
+
+    Returns
+    -------
+    list[dict]
+        The exit information dictionaries returned by `run_command`
+        (including each command's 'elapsed_seconds'), in the same order
+        as `command_list`.
+
+    Raises
+    ------
+    ValueError
+        If `max_workers` is not a positive integer or if the length of
+        `post_command_actions` does not match that of `command_list`.
+    RuntimeError
+        If one or more commands exit with a non-zero status. The message
+        lists every failed command, in the order of `command_list`.
+
+    Examples
+    --------
+    >>> cmds = [['cdo', 'selyear,2000/2010', f, f'{f}.sel'] for f in ['a.nc', 'b.nc']]
+    >>> run_command_batch(cmds, max_workers=2)
+    """
+    if post_command_actions is None:
+        post_command_actions = [None] * len(command_list)
+    elif len(post_command_actions) != len(command_list):
+        raise ValueError("'post_command_actions' must have one entry per command.")
+
+    if not command_list:
+        return []
+
+    n_workers = _resolve_max_workers(max_workers, len(command_list))
+
+    # Share the CPU budget, if set, between concurrent commands and CDO threads #
+    cpu_budget = get_cpu_budget()
+    if cpu_budget is not None:
+        command_list = [_as_argv(cmd) for cmd in command_list]
+        n_workers, n_threads = cpu_budget.allocate(command_list, max_workers)
+        command_list = [add_thread_option(argv, n_threads) for argv in command_list]
+
+    def run_single_command(cmd):
+        return run_command(cmd, capture_output=capture_output, encoding=encoding)
+
+    # Run the commands; 'map' yields the results in submission order #
+    with ThreadPoolExecutor(max_workers=n_workers) as executor:
+        process_exit_info_list = list(executor.map(run_single_command, command_list))
+
+    # Check every exit status in a deterministic order #
+    failure_messages = []
+    for cmd, process_exit_info, post_action in zip(command_list,
+                                                    process_exit_info_list,
+                                                    post_command_actions):
+        try:
+            exit_info(process_exit_info,
+                check_stdout=capture_output,
+                check_stderr=capture_output,
+                check_return_code=True
+            )
+        except RuntimeError as err:
+            failure_messages.append(_format_failure(cmd, err))
+        else:
+            if post_action is not None:
+                post_action()
+
+    if failure_messages:
+        raise RuntimeError(BATCH_FAILURE_TEMPLATE.format(len(failure_messages),
+                                                         len(command_list),
+                                                         "\n".join(failure_messages)))
+
+    return process_exit_info_list
+
+
+# In-process netCDF access #
+#--------------------------#
+
+def in_process_netcdf(function: Callable) -> Callable:
+    """
+    Mark a function as opening netCDF files in Python (netCDF4 or xarray), not only through commands.
+
+    Schedulers running several functions at once (e.g.
+    `processing_pipelines.run_pipeline`) run marked functions one at a
+    time, since the HDF5 library is not thread-safe.
+
+    Parameters
+    ----------
+    function : Callable
+        Function to mark.
+
+    Returns
+    -------
+    Callable
+        The same function, with the `IN_PROCESS_NETCDF_ATTR` attribute set.
+    """
+    setattr(function, IN_PROCESS_NETCDF_ATTR, True)
+    return function
+
+
+def runs_netcdf_in_process(function: Callable) -> bool:
+    """
+    Check whether a function was marked with `in_process_netcdf`.
+    """
+    return getattr(function, IN_PROCESS_NETCDF_ATTR, False)
+
+
+#--------------------------#
+# Parameters and constants #
+#--------------------------#
+
+# Default number of concurrent commands #
+DEFAULT_MAX_WORKERS = os.cpu_count() or 1
+
+# Attribute marking functions that open netCDF files in Python #
+IN_PROCESS_NETCDF_ATTR = "in_process_netcdf"
+
+# Template strings #
+#------------------#
+
+# Error messages #
+BATCH_FAILURE_TEMPLATE = \
+"""{} out of {} commands failed:
+{}"""
@@ -0,0 +1,325 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import json
+import os
+import shlex
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+#-------------------------#
+# Define custom functions #
+#-------------------------#
+
+# Internal Helper Functions #
+#---------------------------#
+
+def _file_states(argv: list[str]) -> dict:
+    """
+    Record size and modification time of every command argument that is an existing file.
+    """
+    states = {}
+    for arg in argv[1:]:
+        try:
+            stat_result = os.stat(arg)
+        except (OSError, ValueError):
+            continue
+        if os.path.isfile(arg):
+            states[arg] = (stat_result.st_size, stat_result.st_mtime_ns)
+    return states
+
+
+def _io_bytes(argv: list[str], states_before: dict) -> tuple[int, int]:
+    """
+    Count the bytes of the input files and of the files written by a command.
+
+    Files that existed before the command and were not modified are taken
+    as inputs; files created or modified by it are taken as outputs.
+    """
+    input_bytes = output_bytes = 0
+    for arg, state_after in _file_states(argv).items():
+        state_before = states_before.get(arg)
+        if state_before == state_after:
+            input_bytes += state_after[0]
+        else:
+            output_bytes += state_after[0]
+    return input_bytes, output_bytes
+
+
+# Operator identification #
+#-------------------------#
+
+def command_operator(argv: list[str]) -> str:
+    """
+    Identify the operator run by a command, for aggregating telemetry.
+
+    For CDO commands, this is the outermost operator without its arguments
+    (e.g. 'ymonmean' for `cdo -b F64 ymonmean -selyear,2000/2010 in.nc out.nc`);
+    for any other program (e.g. NCO's 'ncap2' or 'ncatted'), the program name.
+
+    Parameters
+    ----------
+    argv : list[str]
+        Argument vector of the command.
+
+    Returns
+    -------
+    str
+        Operator name.
+    """
+    program = os.path.basename(argv[0])
+    if program != "cdo":
+        return program
+
+    args = iter(argv[1:])
+    for arg in args:
+        if arg in CDO_VALUE_OPTIONS:
+            next(args, None)
+        elif arg.startswith("--") or (arg.startswith("-") and len(arg) == 2):
+            continue
+        else:
+            return arg.lstrip("-").split(",")[0]
+    return program
+
+
+# Trace recording #
+#-----------------#
+
+@contextmanager
+def trace_commands(trace_file: str | Path):
+    """
+    Record telemetry of every CDO/NCO command run within the context.
+
+    Each command run through `command_runner` (and thus by every wrapper in
+    `cdo_tools` and `nco_tools`) appends one JSON record per line to
+    `trace_file`, with keys:
+    - 'timestamp': end time of the command, in seconds since the epoch.
+    - 'program', 'operator': the program and operator run (see `command_operator`).
+    - 'command': the command line.
+    - 'return_code': the exit status.
+    - 'wall_seconds': wall-clock duration.
+    - 'user_cpu_seconds', 'sys_cpu_seconds': CPU time of the child process.
+    - 'max_rss_kb': peak resident set size of the child process, in KiB.
+    - 'input_bytes', 'output_bytes': size of the files read and written.
+    CPU and memory figures are None where the platform does not provide
+    per-process resource usage. The peak RSS of very light commands may
+    reflect the brief copy of the Python process made before the program
+    starts rather than the program itself.
+
+    Parameters
+    ----------
+    trace_file : str | Path
+        JSON-lines file where records are appended.
+
+    Examples
+    --------
+    >>> with trace_commands('run_trace.jsonl'):
+    ...     cdo_periodic_statistics('tas_day_ERA5.nc', 'mean', True, 'monthly')
+    >>> print(format_trace_summary(summarise_trace('run_trace.jsonl')))
+    """
+    global _active_trace_file
+    previous_trace_file = _active_trace_file
+    _active_trace_file = Path(trace_file)
+    try:
+        yield _active_trace_file
+    finally:
+        _active_trace_file = previous_trace_file
+
+
+def is_tracing() -> bool:
+    """
+    Return whether command telemetry is currently being recorded.
+
+    Returns
+    -------
+    bool
+        True within a `trace_commands` context.
+    """
+    return _active_trace_file is not None
+
+
+def snapshot_command_files(argv: list[str]) -> dict | None:
+    """
+    Take the file snapshot needed to count a command's I/O, if tracing.
+
+    Parameters
+    ----------
+    argv : list[str]
+        Argument vector of the command about to run.
+
+    Returns
+    -------
+    dict | None
+        Opaque snapshot to pass to `record_command`, or None if not tracing.
+    """
+    return _file_states(argv) if is_tracing() else None
+
+
+def record_command(argv: list[str], process_exit_info: dict, file_snapshot: dict | None) -> None:
+    """
+    Append the telemetry record of a finished command to the active trace, if any.
+
+    Parameters
+    ----------
+    argv : list[str]
+        Argument vector of the command.
+    process_exit_info : dict
+        Exit information, as returned by `command_runner.run_command`.
+    file_snapshot : dict | None
+        Snapshot taken by `snapshot_command_files` before the command ran.
+
+    Returns
+    -------
+    None
+    """
+    trace_file = _active_trace_file
+    if trace_file is None or file_snapshot is None:
+        return
+
+    input_bytes, output_bytes = _io_bytes(argv, file_snapshot)
+    record = {
+        "timestamp": time.time(),
+        "program": os.path.basename(argv[0]),
+        "operator": command_operator(argv),
+        "command": shlex.join(argv),
+        "return_code": process_exit_info.get("return_code"),
+        "wall_seconds": process_exit_info.get("elapsed_seconds"),
+        "user_cpu_seconds": process_exit_info.get("user_cpu_seconds"),
+        "sys_cpu_seconds": process_exit_info.get("sys_cpu_seconds"),
+        "max_rss_kb": process_exit_info.get("max_rss_kb"),
+        "input_bytes": input_bytes,
+        "output_bytes": output_bytes
+    }
+
+    with _trace_lock:
+        with open(trace_file, "a", encoding="utf-8") as trace_obj:
+            trace_obj.write(json.dumps(record) + "\n")
+
+
+# Trace analysis #
+#----------------#
+
+def summarise_trace(trace_file: str | Path, sort_by: str = "wall_seconds") -> list[dict]:
+    """
+    Aggregate a command trace into per-operator hot-spot statistics.
+
+    Parameters
+    ----------
+    trace_file : str | Path
+        JSON-lines trace written through `trace_commands`.
+    sort_by : str, optional
+        Aggregate to sort the operators by, in descending order.
+        One of `SUMMARY_SORT_KEYS`. Default is 'wall_seconds'.
+
+    Returns
+    -------
+    list[dict]
+        One entry per operator, with keys 'operator', 'calls',
+        'wall_seconds' (total), 'mean_wall_seconds', 'max_wall_seconds',
+        'wall_share' (fraction of the total wall time of the trace),
+        'cpu_seconds' (user + system), 'max_rss_kb', 'input_bytes',
+        'output_bytes' and 'failures'.
+
+    Raises
+    ------
+    ValueError
+        If `sort_by` is not supported.
+    """
+    if sort_by not in SUMMARY_SORT_KEYS:
+        raise ValueError(f"Unsupported sort key '{sort_by}'. Options are {SUMMARY_SORT_KEYS}")
+
+    summary = {}
+    with open(trace_file, encoding="utf-8") as trace_obj:
+        for line in trace_obj:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            entry = summary.setdefault(record["operator"], dict(
+                operator=record["operator"],
+                calls=0,
+                wall_seconds=0.0,
+                max_wall_seconds=0.0,
+                cpu_seconds=0.0,
+                max_rss_kb=0,
+                input_bytes=0,
+                output_bytes=0,
+                failures=0
+            ))
+            wall_seconds = record.get("wall_seconds") or 0.0
+            entry["calls"] += 1
+            entry["wall_seconds"] += wall_seconds
+            entry["max_wall_seconds"] = max(entry["max_wall_seconds"], wall_seconds)
+            entry["cpu_seconds"] += (record.get("user_cpu_seconds") or 0.0) \
+                                    + (record.get("sys_cpu_seconds") or 0.0)
+            entry["max_rss_kb"] = max(entry["max_rss_kb"], record.get("max_rss_kb") or 0)
+            entry["input_bytes"] += record.get("input_bytes") or 0
+            entry["output_bytes"] += record.get("output_bytes") or 0
+            entry["failures"] += int(record.get("return_code") not in (0, None))
+
+    total_wall_seconds = sum(entry["wall_seconds"] for entry in summary.values())
+    for entry in summary.values():
+        entry["mean_wall_seconds"] = entry["wall_seconds"] / entry["calls"]
+        entry["wall_share"] = entry["wall_seconds"] / total_wall_seconds if total_wall_seconds else 0.0
+
+    return sorted(summary.values(), key=lambda entry: entry[sort_by], reverse=True)
+
+
+def format_trace_summary(summary: list[dict]) -> str:
+    """
+    Format the result of `summarise_trace` as a plain-text table.
+
+    Parameters
+    ----------
+    summary : list[dict]
+        Per-operator statistics, as returned by `summarise_trace`.
+
+    Returns
+    -------
+    str
+        The hot-spot table, one operator per row.
+    """
+    lines = [SUMMARY_HEADER_TEMPLATE.format(*SUMMARY_COLUMNS)]
+    for entry in summary:
+        lines.append(SUMMARY_ROW_TEMPLATE.format(
+            entry["operator"],
+            entry["calls"],
+            entry["wall_seconds"],
+            entry["wall_share"] * 100,
+            entry["mean_wall_seconds"],
+            entry["cpu_seconds"],
+            entry["max_rss_kb"] / 1024,
+            entry["input_bytes"] / 1024**3,
+            entry["output_bytes"] / 1024**3
+        ))
+    return "\n".join(lines)
+
+#--------------------------#
+# Parameters and constants #
+#--------------------------#
+
+# Active trace and its lock (commands may run concurrently) #
+_active_trace_file = None
+_trace_lock = threading.Lock()
+
+# CDO options that take a value #
+CDO_VALUE_OPTIONS = ["-b", "-f", "-k", "-P", "-t", "-z", "--chunkspec", "--nsb", "--seed", "--timestat_date"]
+
+# Summary sort keys #
+SUMMARY_SORT_KEYS = [
+    "wall_seconds", "mean_wall_seconds", "max_wall_seconds", "cpu_seconds",
+    "calls", "max_rss_kb", "input_bytes", "output_bytes"
+]
+
+# Template strings #
+#------------------#
+
+# Hot-spot table #
+SUMMARY_COLUMNS = ["operator", "calls", "wall (s)", "wall %", "mean (s)", "cpu (s)", "peak RSS (MiB)", "read (GiB)", "written (GiB)"]
+SUMMARY_HEADER_TEMPLATE = "{:<20} {:>7} {:>10} {:>7} {:>9} {:>10} {:>15} {:>11} {:>14}"
+SUMMARY_ROW_TEMPLATE = "{:<20} {:>7d} {:>10.1f} {:>7.1f} {:>9.2f} {:>10.1f} {:>15.1f} {:>11.2f} {:>14.2f}"
@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import os
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from climalab.netcdf_tools.command_telemetry import CDO_VALUE_OPTIONS
+
+#-------------------------#
+# Define custom functions #
+#-------------------------#
+
+# Internal Helper Functions #
+#---------------------------#
+
+def _cdo_operators(argv: list[str]) -> list[str]:
+    """
+    List the operator names of a CDO command, including those chained with a leading dash.
+    """
+    operators = []
+    args = iter(argv[1:-1])
+    for arg in args:
+        if arg in CDO_VALUE_OPTIONS:
+            next(args, None)
+        elif arg.startswith("--") or (arg.startswith("-") and len(arg) == 2):
+            continue
+        elif arg.startswith("-") or not operators:
+            operators.append(arg.lstrip("-").split(",")[0])
+    return operators
+
+
+def _input_bytes(argv: list[str]) -> int:
+    """
+    Total size of the arguments of a command that are existing files, except the output (last argument).
+    """
+    return sum(os.path.getsize(arg) for arg in argv[1:-1] if os.path.isfile(arg))
+
+
+# CPU budget #
+#------------#
+
+class CpuBudget:
+    """
+    Share a fixed number of CPUs between concurrent CDO commands and their OpenMP threads.
+
+    CDO can run some operators on several threads (`-P n`), while the
+    wrappers run independent commands concurrently. Given a batch of
+    commands, the budget chooses both numbers so that their product does
+    not exceed `total_cpus`:
+    - Commands running a threaded operator (`THREADED_CDO_OPERATORS`, e.g.
+      remapping or weight generation, anywhere in an operator chain) on
+      inputs of at least `min_threaded_file_bytes` split the CPUs evenly,
+      with at most `max_threads_per_command` threads each; e.g. 4 remaps on
+      64 CPUs run at once with 16 threads each.
+    - Any other command (e.g. `selyear`, `mergetime`, or NCO programs), or
+      threaded operators on small files, for which thread start-up
+      outweighs the gain, run single-threaded, one per CPU; e.g. 64
+      `selyear` commands run at once.
+
+    Set a budget for every wrapper with `set_cpu_budget`.
+
+    Parameters
+    ----------
+    total_cpus : int | None, optional
+        Number of CPUs to use. If None, all available CPUs. Default is None.
+    max_threads_per_command : int | None, optional
+        Maximum number of threads of a single command. If None,
+        `DEFAULT_MAX_THREADS_PER_COMMAND`. Default is None.
+    min_threaded_file_bytes : int | None, optional
+        Minimum input size of a command for it to be run threaded. If None,
+        `DEFAULT_MIN_THREADED_FILE_BYTES`. Default is None.
+
+    Raises
+    ------
+    ValueError
+        If a CPU or thread count is not a positive integer.
+
+    Examples
+    --------
+    >>> budget = CpuBudget(64)
+    >>> budget.allocate([['cdo', 'remapbil,grid.txt', f, f'r_{f}'] for f in files[:4]])
+    (4, 16)
+    """
+
+    def __init__(self,
+                 total_cpus: int | None = None,
+                 max_threads_per_command: int | None = None,
+                 min_threaded_file_bytes: int | None = None) -> None:
+        if total_cpus is None:
+            total_cpus = os.cpu_count() or 1
+        if max_threads_per_command is None:
+            max_threads_per_command = DEFAULT_MAX_THREADS_PER_COMMAND
+        if min_threaded_file_bytes is None:
+            min_threaded_file_bytes = DEFAULT_MIN_THREADED_FILE_BYTES
+
+        for arg_name, arg_value in (("total_cpus", total_cpus),
+                                    ("max_threads_per_command", max_threads_per_command)):
+            if not isinstance(arg_value, int) or arg_value < 1:
+                raise ValueError(f"'{arg_name}' must be a positive integer, got {arg_value!r}.")
+
+        self.total_cpus = total_cpus
+        self.max_threads_per_command = max_threads_per_command
+        self.min_threaded_file_bytes = min_threaded_file_bytes
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}(total_cpus={self.total_cpus}, "
+                f"max_threads_per_command={self.max_threads_per_command})")
+
+    def is_threaded(self, argv: list[str]) -> bool:
+        """
+        Check whether a command benefits from CDO threading.
+
+        Parameters
+        ----------
+        argv : list[str]
+            Argument vector of the command.
+
+        Returns
+        -------
+        bool
+            True for CDO commands running a threaded operator on inputs of
+            at least `min_threaded_file_bytes`.
+        """
+        if os.path.basename(argv[0]) != "cdo":
+            return False
+        operators = _cdo_operators(argv)
+        return (any(operator.startswith(THREADED_CDO_OPERATORS) for operator in operators)
+                and _input_bytes(argv) >= self.min_threaded_file_bytes)
+
+    def allocate(self, command_list: list[list[str]], max_workers: int | None = None) -> tuple[int, int]:
+        """
+        Choose the number of concurrent commands and of threads per command for a batch.
+
+        Parameters
+        ----------
+        command_list : list[list[str]]
+            Argument vectors of the batch. Threads are only given if every
+            command benefits from them.
+        max_workers : int | None, optional
+            Number of concurrent commands requested by the caller. If given,
+            it is kept (within the budget) and the threads are chosen to
+            fill the remaining CPUs. Default is None.
+
+        Returns
+        -------
+        tuple[int, int]
+            Number of concurrent commands and number of threads per command.
+        """
+        n_commands = max(1, len(command_list))
+        if max_workers is not None:
+            max_workers = max(1, min(max_workers, n_commands, self.total_cpus))
+
+        if not command_list or not all(self.is_threaded(argv) for argv in command_list):
+            return max_workers or min(n_commands, self.total_cpus), 1
+
+        n_workers = max_workers or n_commands
+        n_threads = max(1, min(self.total_cpus // n_workers, self.max_threads_per_command))
+        if max_workers is None:
+            n_workers = max(1, min(n_commands, self.total_cpus // n_threads))
+        return n_workers, n_threads
+
+
+# Global budget #
+#---------------#
+
+def set_cpu_budget(
+        total_cpus: int | None = None,
+        max_threads_per_command: int | None = None,
+        min_threaded_file_bytes: int | None = None) -> CpuBudget:
+    """
+    Set the CPU budget used by every CDO/NCO wrapper.
+
+    Once set, batches of commands run through `command_runner` choose their
+    concurrency and CDO `-P` threads with the budget (see `CpuBudget`), and
+    single CDO commands use as many threads as the budget allows. Without a
+    budget, no `-P` option is added and batches run one command per CPU.
+
+    Parameters
+    ----------
+    total_cpus : int | None, optional
+        Number of CPUs to use. If None, all available CPUs. Default is None.
+    max_threads_per_command : int | None, optional
+        Maximum number of threads of a single command. If None,
+        `DEFAULT_MAX_THREADS_PER_COMMAND`. Default is None.
+    min_threaded_file_bytes : int | None, optional
+        Minimum input size of a command for it to be run threaded. If None,
+        `DEFAULT_MIN_THREADED_FILE_BYTES`. Default is None.
+
+    Returns
+    -------
+    CpuBudget
+        The budget now in use.
+
+    Examples
+    --------
+    >>> set_cpu_budget(64)
+    >>> cdo_remap(file_list, 'grid.txt', 'tas', 'day', 'EC-Earth3', 'historical',
+    ...           'remap', '1981-2010', 'europe', 'nc', remap_proc='conservative1')
+    """
+    global _cpu_budget
+    _cpu_budget = CpuBudget(total_cpus, max_threads_per_command, min_threaded_file_bytes)
+    return _cpu_budget
+
+
+def get_cpu_budget() -> CpuBudget | None:
+    """
+    Return the CPU budget in use, if any.
+
+    Returns
+    -------
+    CpuBudget | None
+        The budget set with `set_cpu_budget`, or None.
+    """
+    return _cpu_budget
+
+
+def clear_cpu_budget() -> None:
+    """
+    Stop using a CPU budget, going back to one command per CPU and no CDO threading.
+
+    Returns
+    -------
+    None
+    """
+    global _cpu_budget
+    _cpu_budget = None
+
+
+def add_thread_option(argv: list[str], n_threads: int) -> list[str]:
+    """
+    Add the CDO `-P` threading option to a command, unless it is 1 or already given.
+
+    Parameters
+    ----------
+    argv : list[str]
+        Argument vector of the command. Commands of programs other than
+        CDO are returned unchanged.
+    n_threads : int
+        Number of threads.
+
+    Returns
+    -------
+    list[str]
+        The argument vector with the option.
+    """
+    if n_threads <= 1 or os.path.basename(argv[0]) != "cdo" or "-P" in argv:
+        return argv
+    return [argv[0], "-P", str(n_threads), *argv[1:]]
+
+#--------------------------#
+# Parameters and constants #
+#--------------------------#
+
+# Global budget #
+_cpu_budget = None
+
+# CDO operators (name prefixes) that run on several OpenMP threads #
+THREADED_CDO_OPERATORS = ("remap", "gen", "intlevel", "ml2pl", "ml2hl", "sp2gp", "gp2sp")
+
+# Default limits #
+DEFAULT_MAX_THREADS_PER_COMMAND = 16
+DEFAULT_MIN_THREADED_FILE_BYTES = 64 * 1024**2
@@ -0,0 +1,742 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+from datetime import timedelta
+import itertools
+
+import cftime
+import netCDF4
+import numpy as np
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from climalab.netcdf_tools.command_plan import get_active_plan
+from climalab.netcdf_tools.time_coverage import find_time_variable, read_time_coverage
+from paramlib.global_parameters import BASIC_ARITHMETIC_OPERATORS
+
+#-------------------------#
+# Define custom functions #
+#-------------------------#
+
+# Internal Helper Functions #
+#---------------------------#
+
+def _record_edit(operator: str, file: str, metadata_only: bool = True) -> bool:
+    """
+    Record an in-place edit in the active plan, if any, and return whether one was recorded.
+    """
+    plan = get_active_plan()
+    if plan is None:
+        return False
+    plan.add_step(operator, [file], [file], metadata_only=metadata_only)
+    return True
+
+
+def _parse_time_unit(unit_str: str) -> str:
+    """
+    Return the time unit (one of `TIME_UNITS`) that a unit name or abbreviation stands for.
+    """
+    unit_str = unit_str.strip().lower()
+    for unit in TIME_UNITS:
+        if unit_str and unit.startswith(unit_str.rstrip("s") if len(unit_str) > 1 else unit_str):
+            return unit
+    raise ValueError(f"Unsupported time unit '{unit_str}'. Options are {TIME_UNITS}")
+
+
+def _parse_time_interval(interval: str) -> tuple[int, str]:
+    """
+    Split a CDO time interval such as '-6hours', '+1day' or '3months' into its count and unit.
+    """
+    interval = interval.strip()
+    n_digits = len(interval) - len(interval.lstrip("+-0123456789"))
+    if n_digits == 0 or interval[:n_digits] in ("+", "-"):
+        raise ValueError(f"Time interval '{interval}' must start with an integer count, e.g. '-6hours'.")
+    return int(interval[:n_digits]), _parse_time_unit(interval[n_digits:])
+
+
+def _add_months(date: cftime.datetime, n_months: int) -> cftime.datetime:
+    """
+    Add calendar months to a date, clipping the day to the length of the resulting month.
+    """
+    year, month_idx = divmod(date.year * 12 + date.month - 1 + n_months, 12)
+    first_day = date.replace(year=year, month=month_idx + 1, day=1)
+    return first_day.replace(day=min(date.day, first_day.daysinmonth))
+
+
+def _add_interval(date: cftime.datetime, n: int, unit: str) -> cftime.datetime:
+    """
+    Add `n` time units to a date, in the calendar of the date.
+    """
+    if unit in CALENDAR_TIME_UNITS:
+        return _add_months(date, n * CALENDAR_TIME_UNITS[unit])
+    return date + timedelta(seconds=n * TIME_UNIT_SECONDS[unit])
+
+
+def _read_time_seconds(variable: netCDF4.Variable, units: str) -> np.ndarray:
+    """
+    Read time values, in the given units, as whole seconds since their reference date.
+    """
+    unit = _parse_time_unit(units.partition(" since ")[0])
+    if " since " not in units or unit not in TIME_UNIT_SECONDS:
+        raise ValueError(f"Time units '{units}' are not a fixed unit since a reference date.")
+    values = np.ma.filled(variable[:], np.nan).astype("d")
+    return np.rint(values * TIME_UNIT_SECONDS[unit]).astype("int64")
+
+
+def _encode_time_axis(time_var: netCDF4.Variable,
+                      bounds_var: netCDF4.Variable | None,
+                      time_seconds: np.ndarray,
+                      bounds_seconds: np.ndarray | None) -> list[tuple[str, np.ndarray, str | None]]:
+    """
+    Encode new time values and bounds, in seconds since their reference date, in the data type of their variables.
+
+    The units are kept if they represent every value exactly; otherwise the
+    coarsest finer unit that does, with the same reference date, is used.
+    Nothing is written, so a ValueError leaves the file untouched.
+    """
+    unit_str, _, reference_date = time_var.units.partition(" since ")
+    current_unit = _parse_time_unit(unit_str)
+    variables = [(time_var, time_seconds)]
+    if bounds_var is not None:
+        variables.append((bounds_var, bounds_seconds))
+
+    unit = current_unit
+    if any(np.dtype(variable.dtype).kind != "f" for variable, _ in variables):
+        candidate_units = [unit for unit in TIME_UNITS[TIME_UNITS.index(current_unit)::-1]
+                           if unit in TIME_UNIT_SECONDS]
+        unit = next((unit for unit in candidate_units
+                     if not any(np.any(seconds % TIME_UNIT_SECONDS[unit]) for _, seconds in variables)), None)
+        if unit is None:
+            raise ValueError(f"New time values of '{time_var.name}' cannot be stored as integers.")
+
+    encoded_axis = []
+    for variable, seconds in variables:
+        dtype = np.dtype(variable.dtype)
+        if dtype.kind == "f":
+            values = (seconds / TIME_UNIT_SECONDS[unit]).astype(dtype)
+        else:
+            values = seconds // TIME_UNIT_SECONDS[unit]
+            dtype_info = np.iinfo(dtype)
+            if values.size and (values.min() < dtype_info.min or values.max() > dtype_info.max):
+                raise ValueError(f"New time values of '{variable.name}' in {unit} overflow {dtype}.")
+        new_units = None
+        if unit != current_unit and (variable is time_var or "units" in variable.ncattrs()):
+            new_units = f"{unit} since {reference_date.strip()}"
+        encoded_axis.append((variable.name, values, new_units))
+    return encoded_axis
+
+
+def _write_time_axis(dataset: netCDF4.Dataset, encoded_axis: list[tuple[str, np.ndarray, str | None]]) -> None:
+    """
+    Write a time axis encoded by `_encode_time_axis` to an open dataset.
+    """
+    for var_name, values, new_units in encoded_axis:
+        variable = dataset.variables[var_name]
+        variable[:] = values
+        if new_units is not None:
+            variable.units = new_units
+
+
+def _iter_blocks(variable: netCDF4.Variable, max_memory_bytes: int):
+    """
+    Yield hyperslabs of a variable aligned to its on-disk chunks and within the memory budget.
+
+    Blocks are made of whole chunks (single elements for contiguous or
+    netCDF classic storage), grown over the trailing axes first, so contiguous variables
+    are read in blocks of whole time steps.
+    """
+    shape = variable.shape
+    chunking = variable.chunking()
+    chunk_shape = list(chunking) if isinstance(chunking, list) else [1] * len(shape)
+    block_shape = list(chunk_shape)
+    itemsize = np.dtype(variable.dtype).itemsize
+
+    for axis in reversed(range(len(shape))):
+        block_shape[axis] = 1
+        unit_bytes = itemsize * int(np.prod(block_shape)) * chunk_shape[axis]
+        n_chunks = max(1, max_memory_bytes // unit_bytes)
+        block_shape[axis] = max(1, min(shape[axis], chunk_shape[axis] * n_chunks))
+        if block_shape[axis] < shape[axis]:
+            break
+
+    for block_start in itertools.product(*(range(0, size, step) for size, step in zip(shape, block_shape))):
+        yield tuple(slice(start, min(start + step, size))
+                    for start, step, size in zip(block_start, block_shape, shape))
+
+
+def _time_axis_variables(dataset: netCDF4.Dataset) -> tuple[netCDF4.Variable, netCDF4.Variable | None]:
+    """
+    Return the time variable of a dataset and its bounds variable, if any.
+    """
+    time_var = dataset.variables[find_time_variable(dataset)]
+    bounds_name = getattr(time_var, "bounds", None) or getattr(time_var, "climatology", None)
+    return time_var, dataset.variables.get(bounds_name) if bounds_name else None
+
+
+def _check_appendable(merged_dataset: netCDF4.Dataset,
+                      new_dataset: netCDF4.Dataset,
+                      time_dim: str) -> None:
+    """
+    Check that a dataset has the variables, dimensions and grid of a merged dataset.
+
+    Variables without the time dimension (coordinates and static fields)
+    must have equal values.
+    """
+    new_file = new_dataset.filepath()
+    if set(new_dataset.variables) != set(merged_dataset.variables):
+        raise ValueError(f"Variables of '{new_file}' {sorted(new_dataset.variables)} differ from "
+                         f"those of the merged file {sorted(merged_dataset.variables)}.")
+
+    for var_name, merged_var in merged_dataset.variables.items():
+        new_var = new_dataset.variables[var_name]
+        if new_var.dimensions != merged_var.dimensions:
+            raise ValueError(f"Dimensions of '{var_name}' in '{new_file}' {new_var.dimensions} differ "
+                             f"from those in the merged file {merged_var.dimensions}.")
+        if time_dim in merged_var.dimensions:
+            time_axis = merged_var.dimensions.index(time_dim)
+            if new_var.shape[:time_axis] + new_var.shape[time_axis + 1:] != \
+                    merged_var.shape[:time_axis] + merged_var.shape[time_axis + 1:]:
+                raise ValueError(f"Shape of '{var_name}' in '{new_file}' {new_var.shape} does not match "
+                                 f"that in the merged file {merged_var.shape}.")
+        elif new_var.shape != merged_var.shape or not np.ma.allequal(new_var[:], merged_var[:]):
+            raise ValueError(f"'{var_name}' in '{new_file}' differs from the merged file "
+                             "(different grids or static fields).")
+
+
+# File formats #
+#--------------#
+
+def is_editable_in_place(file: str) -> bool:
+    """
+    Check whether a file can be edited in place with the netCDF4 library.
+
+    netCDF classic (CDF-1, CDF-2 and CDF-5) and netCDF4/HDF5 files are
+    recognised by their format signature; any other format (e.g. GRIB)
+    has to be rewritten by CDO.
+
+    Parameters
+    ----------
+    file : str
+        File path.
+
+    Returns
+    -------
+    bool
+        True if the file is a netCDF file.
+    """
+    try:
+        with open(file, "rb") as file_obj:
+            signature = file_obj.read(len(HDF5_SIGNATURE))
+    except OSError:
+        return False
+    return signature.startswith(NETCDF_SIGNATURES)
+
+
+def find_data_variables(dataset: netCDF4.Dataset) -> list[str]:
+    """
+    List the data variables of an open netCDF dataset.
+
+    Coordinate variables (named after a dimension), and variables referenced
+    by the 'bounds', 'climatology' or 'coordinates' attributes of others, or
+    by their 'grid_mapping', are excluded.
+
+    Parameters
+    ----------
+    dataset : netCDF4.Dataset
+        Open dataset.
+
+    Returns
+    -------
+    list[str]
+        Names of the data variables, in file order.
+    """
+    auxiliary_vars = set(dataset.dimensions)
+    for variable in dataset.variables.values():
+        for attr in AUXILIARY_VARIABLE_ATTRS:
+            auxiliary_vars.update(str(getattr(variable, attr, "")).split())
+    return [var_name for var_name in dataset.variables if var_name not in auxiliary_vars]
+
+
+# Metadata edits #
+#----------------#
+
+def rename_variable_in_place(file: str, var_name: str, new_var_name: str) -> None:
+    """
+    Rename a variable of a netCDF file in place, without copying its data.
+
+    Only the file header is rewritten. In plan mode (see
+    `command_plan.plan_commands`), the edit is recorded instead.
+
+    Parameters
+    ----------
+    file : str
+        netCDF file path (see `is_editable_in_place`).
+    var_name : str
+        Current variable name.
+    new_var_name : str
+        New variable name.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ValueError
+        If `var_name` is not in the file or `new_var_name` already is.
+    """
+    if _record_edit(RENAME_VARIABLE_OPERATOR, file):
+        return
+
+    with netCDF4.Dataset(file, "a") as dataset:
+        if var_name not in dataset.variables:
+            raise ValueError(f"Variable '{var_name}' not found in '{file}'.")
+        if new_var_name in dataset.variables:
+            raise ValueError(f"Variable '{new_var_name}' already exists in '{file}'.")
+        dataset.renameVariable(var_name, new_var_name)
+
+
+# Coordinate edits #
+#------------------#
+
+def modify_coordinate_in_place(
+        file: str,
+        coord_name: str,
+        operator: str,
+        value: int | float,
+        threshold: int | float | None = None,
+        threshold_mode: str = "max") -> bool:
+    """
+    Apply an arithmetic operation to the values of a coordinate variable in place.
+
+    Only the coordinate variable (usually a few KB) is read and written,
+    with the same result as the ncap2 scripts of `nco_tools`: with a
+    threshold, only the values below it ('max' mode) or above it ('min'
+    mode) are modified.
+
+    Parameters
+    ----------
+    file : str
+        File path.
+    coord_name : str
+        Name of the coordinate variable.
+    operator : {'+', '-', '*', '/'}
+        Mathematical operator to apply.
+    value : int | float
+        Numerical value to use with the operator.
+    threshold : int | float | None, optional
+        If given, only the values beyond it are modified. Default is None.
+    threshold_mode : {'max', 'min'}, optional
+        'max' modifies the values below `threshold`, 'min' those above it.
+        Default is 'max'.
+
+    Returns
+    -------
+    bool
+        True if the edit was applied (or recorded, in plan mode); False if
+        it cannot be done in place, i.e. the file is not a netCDF file, the
+        coordinate is packed, or the new values cannot be stored in its
+        integer data type. The file is then left untouched.
+
+    Raises
+    ------
+    ValueError
+        If the operator or threshold mode is not supported, or the
+        coordinate is not in the file.
+    """
+    if operator not in BASIC_ARITHMETIC_OPERATORS:
+        raise ValueError(f"Unsupported operator '{operator}'. Options are {BASIC_ARITHMETIC_OPERATORS}")
+    if threshold_mode not in THRESHOLD_COMPARISON_DICT:
+        raise ValueError(f"Unsupported threshold mode '{threshold_mode}'. "
+                         f"Options are {list(THRESHOLD_COMPARISON_DICT)}")
+    if not is_editable_in_place(file):
+        return False
+
+    with netCDF4.Dataset(file) as dataset:
+        if coord_name not in dataset.variables:
+            raise ValueError(f"Variable '{coord_name}' not found in '{file}'.")
+        variable = dataset.variables[coord_name]
+        if {"scale_factor", "add_offset"} & set(variable.ncattrs()):
+            return False
+        dtype = np.dtype(variable.dtype)
+        values = variable[:]
+
+    new_values = NUMPY_OPERATOR_DICT[operator](values.astype("d"), value)
+    if threshold is not None:
+        to_modify = np.ma.filled(THRESHOLD_COMPARISON_DICT[threshold_mode](values, threshold), False)
+        new_values = np.ma.where(to_modify, new_values, values)
+
+    if dtype.kind in "iu":
+        dtype_info = np.iinfo(dtype)
+        filled_values = np.ma.filled(new_values, 0)
+        if (np.any(filled_values % 1)
+                or filled_values.min(initial=0) < dtype_info.min
+                or filled_values.max(initial=0) > dtype_info.max):
+            return False
+
+    if _record_edit(MODIFY_COORDINATE_OPERATOR, file):
+        return True
+    with netCDF4.Dataset(file, "a") as dataset:
+        dataset.variables[coord_name][:] = new_values.astype(dtype)
+    return True
+
+
+# Data value edits #
+#------------------#
+
+def modify_variable_values_in_place(
+        file: str,
+        var_names: str | list[str],
+        operator: str,
+        value: int | float,
+        new_unit: str | None = None,
+        max_memory_bytes: int | None = None) -> bool:
+    """
+    Apply an arithmetic operation to the values of data variables in place, block by block.
+
+    The variables are read and rewritten one block of whole on-disk chunks
+    at a time (whole time steps for contiguous storage), so neither a
+    temporary copy of the file nor more than `max_memory_bytes` of data
+    in memory are needed. As with ncap2, values equal to the `_FillValue`
+    of a variable are left unchanged.
+
+    Parameters
+    ----------
+    file : str
+        File path.
+    var_names : str | list[str]
+        Name of the variable to modify, or list of variables.
+    operator : {'+', '-', '*', '/'}
+        Mathematical operator to apply.
+    value : int | float
+        Numerical value to use with the operator.
+    new_unit : str | None, optional
+        If given, new units attribute of the variables. Default is None.
+    max_memory_bytes : int | None, optional
+        Memory budget for the data read at once. If None,
+        `DEFAULT_MAX_MEMORY_BYTES`. Default is None.
+
+    Returns
+    -------
+    bool
+        True if the edit was applied (or recorded, in plan mode); False if
+        it cannot be done in place, i.e. the file is not a netCDF file, or
+        a variable is not a floating-point one (its data type would change)
+        or is packed. The file is then left untouched.
+
+    Raises
+    ------
+    ValueError
+        If the operator is not supported, or a variable is not in the file.
+    """
+    if operator not in BASIC_ARITHMETIC_OPERATORS:
+        raise ValueError(f"Unsupported operator '{operator}'. Options are {BASIC_ARITHMETIC_OPERATORS}")
+    if not isinstance(var_names, list):
+        var_names = [var_names]
+    if max_memory_bytes is None:
+        max_memory_bytes = DEFAULT_MAX_MEMORY_BYTES
+    if not is_editable_in_place(file):
+        return False
+
+    with netCDF4.Dataset(file) as dataset:
+        for var_name in var_names:
+            if var_name not in dataset.variables:
+                raise ValueError(f"Variable '{var_name}' not found in '{file}'.")
+            variable = dataset.variables[var_name]
+            if (np.dtype(variable.dtype).kind != "f"
+                    or {"scale_factor", "add_offset"} & set(variable.ncattrs())):
+                return False
+
+    if _record_edit(MODIFY_VALUES_OPERATOR, file, metadata_only=False):
+        return True
+
+    with netCDF4.Dataset(file, "a") as dataset:
+        # Work on the stored values, so only the _FillValue marks missing data
+        dataset.set_auto_maskandscale(False)
+        for var_name in var_names:
+            variable = dataset.variables[var_name]
+            fill_value = getattr(variable, "_FillValue", None)
+            for block_idx in _iter_blocks(variable, max_memory_bytes):
+                values = variable[block_idx]
+                new_values = NUMPY_OPERATOR_DICT[operator](values, value, dtype=values.dtype)
+                if fill_value is not None:
+                    new_values = np.where(values == fill_value, values, new_values)
+                variable[block_idx] = new_values
+            if new_unit is not None:
+                variable.units = new_unit
+    return True
+
+
+# Time axis edits #
+#-----------------#
+
+def shift_time_axis_in_place(file: str, shift_val: str) -> bool:
+    """
+    Shift the time axis of a netCDF file in place, as CDO's shifttime operator does.
+
+    Only the time variable and its bounds (and, if needed, their units) are
+    rewritten. Shifts in seconds, minutes, hours or days are added exactly
+    (e.g. time zone shifts of hourly data); shifts in months or years move
+    dates by calendar months, clipping the day to the month length, in the
+    calendar of the file.
+
+    Parameters
+    ----------
+    file : str
+        File path.
+    shift_val : str
+        Time shift with sign and unit (e.g. '+1day', '-6hours', '+3months').
+
+    Returns
+    -------
+    bool
+        True if the shift was applied (or recorded, in plan mode); False if
+        it cannot be done in place, i.e. the file is not a netCDF file, its
+        time units are not a fixed unit since a reference date (e.g.
+        'months since'), or the shifted values cannot be stored in the data
+        type of the time variable. The file is then left untouched.
+
+    Raises
+    ------
+    ValueError
+        If the shift is not supported.
+    """
+    n, unit = _parse_time_interval(shift_val)
+    if not is_editable_in_place(file):
+        return False
+
+    with netCDF4.Dataset(file) as dataset:
+        try:
+            time_var, bounds_var = _time_axis_variables(dataset)
+            units = time_var.units
+            calendar = getattr(time_var, "calendar", DEFAULT_CALENDAR)
+            ref_units = f"seconds since {units.partition(' since ')[2].strip()}"
+
+            new_seconds = []
+            for variable in filter(None, (time_var, bounds_var)):
+                seconds = _read_time_seconds(variable, units)
+                if unit in TIME_UNIT_SECONDS:
+                    seconds = seconds + n * TIME_UNIT_SECONDS[unit]
+                else:
+                    dates = cftime.num2date(seconds.ravel(), ref_units, calendar)
+                    shifted_dates = [_add_interval(date, n, unit) for date in dates]
+                    seconds = np.rint(cftime.date2num(shifted_dates, ref_units, calendar)).astype("int64")
+                new_seconds.append(seconds.reshape(variable.shape))
+            encoded_axis = _encode_time_axis(time_var, bounds_var, new_seconds[0],
+                                             new_seconds[-1] if bounds_var is not None else None)
+        except ValueError:
+            return False
+
+    if _record_edit(SHIFT_TIME_OPERATOR, file):
+        return True
+    with netCDF4.Dataset(file, "a") as dataset:
+        _write_time_axis(dataset, encoded_axis)
+    return True
+
+
+def set_time_axis_in_place(file: str, start_date: str, time_step: str) -> bool:
+    """
+    Set the time axis of a netCDF file in place, as CDO's settaxis operator does.
+
+    The i-th time step is set to `start_date` plus i times `time_step`, in
+    the calendar of the file; time bounds, if any, are moved along with
+    their time steps. Only the time variable and its bounds (and, if
+    needed, their units) are rewritten.
+
+    Parameters
+    ----------
+    file : str
+        File path.
+    start_date : str
+        First time step, as 'YYYY-MM-DD hh:mm:ss'.
+    time_step : str
+        Time step with unit (e.g. '6hour', '1day', '1month').
+
+    Returns
+    -------
+    bool
+        True if the time axis was set (or recorded, in plan mode); False if
+        it cannot be done in place, i.e. the file is not a netCDF file, its
+        time units are not a fixed unit since a reference date (e.g.
+        'months since'), or the new values cannot be stored in the data
+        type of the time variable. The file is then left untouched.
+
+    Raises
+    ------
+    ValueError
+        If the time step is not supported.
+    """
+    n, unit = _parse_time_interval(time_step)
+    date_str, _, clock_str = start_date.strip().partition(" ")
+    date_fields = [int(field) for field in date_str.split("-")]
+    clock_fields = [int(float(field)) for field in clock_str.split(":")] if clock_str else []
+    if not is_editable_in_place(file):
+        return False
+
+    with netCDF4.Dataset(file) as dataset:
+        try:
+            time_var, bounds_var = _time_axis_variables(dataset)
+            units = time_var.units
+            calendar = getattr(time_var, "calendar", DEFAULT_CALENDAR)
+            ref_units = f"seconds since {units.partition(' since ')[2].strip()}"
+            seconds = _read_time_seconds(time_var, units)
+
+            date = cftime.datetime(*date_fields, *clock_fields, calendar=calendar)
+            new_dates = [_add_interval(date, i * n, unit) for i in range(seconds.size)]
+            new_seconds = np.rint(cftime.date2num(new_dates, ref_units, calendar)).astype("int64")
+
+            # Bounds keep their offsets from their time steps
+            bounds_seconds = None
+            if bounds_var is not None:
+                bounds_seconds = _read_time_seconds(bounds_var, units) + (new_seconds - seconds)[:, np.newaxis]
+            encoded_axis = _encode_time_axis(time_var, bounds_var, new_seconds, bounds_seconds)
+        except ValueError:
+            return False
+
+    if _record_edit(SET_TIME_AXIS_OPERATOR, file):
+        return True
+    with netCDF4.Dataset(file, "a") as dataset:
+        _write_time_axis(dataset, encoded_axis)
+    return True
+
+
+# Time series appends #
+#---------------------#
+
+def append_time_steps(merged_file: str, file_list: list[str]) -> None:
+    """
+    Append the time steps of new files to a merged netCDF file in place.
+
+    Only the new data are read and written, so the cost of an update does
+    not depend on the length of the merged time series. Before anything is
+    written, the new files are checked against the merged file: same
+    variables and dimensions, same grid and static fields, same calendar,
+    and time steps strictly after the last merged one, without overlaps
+    between the new files. The new files are appended in time order; their
+    time values (and bounds) are converted to the units of the merged file.
+
+    Parameters
+    ----------
+    merged_file : str
+        Merged netCDF file, whose time dimension must be unlimited.
+    file_list : list[str]
+        netCDF files with the time steps to append.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ValueError
+        If the files are not compatible with the merged file, their time
+        steps overlap it or each other, or the time dimension of the merged
+        file is not unlimited.
+    """
+    merged_coverage = read_time_coverage(merged_file)
+    new_coverages = sorted((read_time_coverage(file) for file in file_list),
+                           key=lambda coverage: coverage["start_seconds"])
+
+    previous_coverage = merged_coverage
+    for coverage in new_coverages:
+        if coverage["calendar"] != merged_coverage["calendar"] and \
+                {coverage["calendar"], merged_coverage["calendar"]} - STANDARD_CALENDARS:
+            raise ValueError(f"Calendar '{coverage['calendar']}' of '{coverage['file']}' differs from "
+                             f"that of the merged file ('{merged_coverage['calendar']}').")
+        if coverage["start_seconds"] <= previous_coverage["end_seconds"]:
+            raise ValueError(f"Time steps of '{coverage['file']}' ({coverage['start']} to {coverage['end']}) "
+                             f"overlap those of '{previous_coverage['file']}', which end at "
+                             f"{previous_coverage['end']}.")
+        previous_coverage = coverage
+
+    plan = get_active_plan()
+    if plan is not None:
+        plan.add_step(APPEND_OPERATOR, [coverage["file"] for coverage in new_coverages], [merged_file])
+        return
+
+    with netCDF4.Dataset(merged_file, "a") as merged_dataset:
+        time_var, bounds_var = _time_axis_variables(merged_dataset)
+        time_dim = time_var.dimensions[0]
+        if not merged_dataset.dimensions[time_dim].isunlimited():
+            raise ValueError(f"Time dimension '{time_dim}' of '{merged_file}' is not unlimited; "
+                             "time steps cannot be appended to it.")
+        time_var_names = [variable.name for variable in filter(None, (time_var, bounds_var))]
+
+        # Check every file, and convert its time values, before writing anything
+        new_time_values = []
+        for coverage in new_coverages:
+            with netCDF4.Dataset(coverage["file"]) as new_dataset:
+                _check_appendable(merged_dataset, new_dataset, time_dim)
+                new_time_var = new_dataset.variables[time_var.name]
+                new_units = new_time_var.units
+                new_calendar = getattr(new_time_var, "calendar", DEFAULT_CALENDAR)
+
+                file_time_values = {}
+                for var_name in time_var_names:
+                    merged_var = merged_dataset.variables[var_name]
+                    dates = cftime.num2date(np.ma.getdata(new_dataset.variables[var_name][:]),
+                                            new_units, new_calendar)
+                    values = cftime.date2num(dates, time_var.units, merged_coverage["calendar"])
+                    if np.dtype(merged_var.dtype).kind != "f" and np.any(values % 1):
+                        raise ValueError(f"Time steps of '{coverage['file']}' cannot be stored "
+                                         f"in '{time_var.units}' as {merged_var.dtype}.")
+                    file_time_values[var_name] = values
+                new_time_values.append(file_time_values)
+
+        for coverage, file_time_values in zip(new_coverages, new_time_values):
+            n_merged = len(merged_dataset.dimensions[time_dim])
+            with netCDF4.Dataset(coverage["file"]) as new_dataset:
+                for var_name, merged_var in merged_dataset.variables.items():
+                    if time_dim not in merged_var.dimensions:
+                        continue
+                    if var_name in file_time_values:
+                        values = file_time_values[var_name]
+                    else:
+                        values = new_dataset.variables[var_name][:]
+                    time_axis = merged_var.dimensions.index(time_dim)
+                    time_slice = slice(n_merged, n_merged + values.shape[time_axis])
+                    merged_var[(slice(None),) * time_axis + (time_slice,)] = values
+
+#--------------------------#
+# Parameters and constants #
+#--------------------------#
+
+# Time units #
+TIME_UNITS = ["seconds", "minutes", "hours", "days", "months", "years"]
+TIME_UNIT_SECONDS = {"seconds": 1, "minutes": 60, "hours": 3600, "days": 86400}
+CALENDAR_TIME_UNITS = {"months": 1, "years": 12}
+DEFAULT_CALENDAR = "standard"
+STANDARD_CALENDARS = {"standard", "gregorian"}
+
+# Arithmetic operators and threshold comparisons #
+NUMPY_OPERATOR_DICT = {
+    BASIC_ARITHMETIC_OPERATORS[0] : np.add,
+    BASIC_ARITHMETIC_OPERATORS[1] : np.subtract,
+    BASIC_ARITHMETIC_OPERATORS[2] : np.multiply,
+    BASIC_ARITHMETIC_OPERATORS[3] : np.true_divide
+}
+THRESHOLD_COMPARISON_DICT = {"max": np.less, "min": np.greater}
+
+# Memory budget for the data read at once #
+DEFAULT_MAX_MEMORY_BYTES = 512 * 1024**2
+
+# File format signatures #
+HDF5_SIGNATURE = b"\x89HDF\r\n\x1a\n"
+NETCDF_SIGNATURES = (b"CDF\x01", b"CDF\x02", b"CDF\x05", HDF5_SIGNATURE)
+
+# Attributes referencing auxiliary variables #
+AUXILIARY_VARIABLE_ATTRS = ["bounds", "climatology", "coordinates", "grid_mapping"]
+
+# Operator names of in-place edits, as recorded in command plans #
+RENAME_VARIABLE_OPERATOR = "renameVariable"
+SHIFT_TIME_OPERATOR = "shifttime"
+SET_TIME_AXIS_OPERATOR = "settaxis"
+APPEND_OPERATOR = "append"
+MODIFY_COORDINATE_OPERATOR = "modify_coordinate"
+MODIFY_VALUES_OPERATOR = "modify_values"
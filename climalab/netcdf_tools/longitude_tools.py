@@ -0,0 +1,254 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import netCDF4
+import numpy as np
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from climalab.netcdf_tools.command_plan import get_active_plan, rename_output
+from climalab.netcdf_tools.command_runner import in_process_netcdf, run_command
+from climalab.netcdf_tools.in_place_editing import DEFAULT_MAX_MEMORY_BYTES, is_editable_in_place
+from climalab.netcdf_tools.time_coverage import find_time_variable
+from pygenutils.operative_systems.os_operations import exit_info
+from pygenutils.strings.string_handler import add_to_path
+from pygenutils.strings.text_formatters import print_format_string
+
+#-------------------------#
+# Define custom functions #
+#-------------------------#
+
+# Internal Helper Functions #
+#---------------------------#
+
+def _find_longitude_variable(dataset: netCDF4.Dataset) -> str:
+    """
+    Find the name of the longitude coordinate variable of an open netCDF dataset.
+    """
+    for var_name, variable in dataset.variables.items():
+        if getattr(variable, "standard_name", None) == "longitude" or getattr(variable, "axis", None) == "X":
+            return var_name
+    for var_name in LONGITUDE_VARIABLE_NAMES:
+        if var_name in dataset.variables:
+            return var_name
+    raise ValueError(f"No longitude variable found in '{dataset.filepath()}'.")
+
+
+def _find_time_dimension(dataset: netCDF4.Dataset) -> str | None:
+    """
+    Return the time dimension of an open netCDF dataset, or None if it has none.
+    """
+    try:
+        return dataset.variables[find_time_variable(dataset)].dimensions[0]
+    except (ValueError, IndexError):
+        return None
+
+
+def _convert_longitudes(lon_values: np.ndarray, convention: str) -> np.ndarray:
+    """
+    Map longitudes onto the range of a convention, e.g. 350 to -10 for '-180_180'.
+    """
+    lon_min = LONGITUDE_CONVENTIONS[convention][0]
+    return (np.asarray(lon_values, dtype="d") - lon_min) % 360 + lon_min
+
+
+def _time_block_size(variable: netCDF4.Variable, time_axis: int, max_memory_bytes: int) -> int:
+    """
+    Number of time steps of a variable that fit in the memory budget (at least one).
+    """
+    time_step_bytes = np.dtype(variable.dtype).itemsize * int(np.prod(
+        [size for axis, size in enumerate(variable.shape) if axis != time_axis]))
+    return max(1, max_memory_bytes // max(1, time_step_bytes))
+
+
+def _reorder_variable(
+        variable: netCDF4.Variable,
+        lon_axis: int,
+        order: np.ndarray,
+        time_dim: str | None,
+        max_memory_bytes: int) -> None:
+    """
+    Reorder a variable along its longitude axis in place, one block of time steps at a time.
+    """
+    if time_dim not in variable.dimensions:
+        variable[:] = np.take(variable[:], order, axis=lon_axis)
+        return
+
+    time_axis = variable.dimensions.index(time_dim)
+    n_times = variable.shape[time_axis]
+    block_size = _time_block_size(variable, time_axis, max_memory_bytes)
+    for block_start in range(0, n_times, block_size):
+        block_idx = ((slice(None),) * time_axis
+                     + (slice(block_start, min(block_start + block_size, n_times)),))
+        variable[block_idx] = np.take(variable[block_idx], order, axis=lon_axis)
+
+
+def _convert_with_cdo(file_name: str, convention: str, capture_output: bool, encoding: str) -> None:
+    """
+    Convert the longitudes of a file that cannot be edited in place with CDO's sellonlatbox.
+    """
+    lon_min, lon_max = LONGITUDE_CONVENTIONS[convention]
+    temp_file = add_to_path(file_name, str2add=TEMP_FILE_SUFFIX)
+    process_exit_info = run_command(
+        ["cdo", f"sellonlatbox,{lon_min},{lon_max},-90,90", file_name, temp_file],
+        capture_output=capture_output,
+        encoding=encoding
+    )
+    exit_info(process_exit_info,
+        check_stdout=capture_output,
+        check_stderr=capture_output,
+        check_return_code=True
+    )
+    rename_output(temp_file, file_name)
+
+
+# Main functions #
+#----------------#
+
+@in_process_netcdf
+def convert_longitude_convention(
+        file_list: str | list[str],
+        convention: str = "-180_180",
+        lon_name: str | None = None,
+        max_memory_bytes: int | None = None,
+        capture_output: bool = False,
+        encoding: str = "utf-8") -> None:
+    """
+    Convert the longitudes of files between the 0..360 and -180..180 conventions, reordering the data.
+
+    Unlike shifting the longitude values alone (e.g. with
+    `nco_tools.modify_coordinate_values_by_threshold`), which leaves a
+    non-monotonic grid, the data of every variable on the longitude axis
+    (including the longitude bounds) is reordered together with the
+    coordinate, so the output grid is monotonically increasing and later
+    `cdo_sellonlatbox` or remapping calls read contiguous longitude ranges.
+
+    netCDF files are rewritten in place, one block of time steps at a time,
+    so memory stays within `max_memory_bytes` whatever the file size; other
+    formats are converted by CDO's sellonlatbox.
+
+    Parameters
+    ----------
+    file_list : str | list[str]
+        Single file path or list of file paths to convert.
+    convention : {'-180_180', '0_360'}, optional
+        Target longitude convention. Default is '-180_180'.
+    lon_name : str | None, optional
+        Name of the longitude coordinate variable. If None, it is looked up
+        by its 'standard_name' or 'axis' attribute, then among
+        `LONGITUDE_VARIABLE_NAMES`. Default is None.
+    max_memory_bytes : int | None, optional
+        Memory budget for the data read at once. If None,
+        `DEFAULT_MAX_MEMORY_BYTES`. Default is None.
+    capture_output : bool, optional
+        Whether to capture the output of CDO, if used. Default is False.
+    encoding : str, optional
+        Encoding to use when decoding command output. Default is "utf-8".
+
+    Returns
+    -------
+    None
+        The files are modified in place.
+
+    Raises
+    ------
+    ValueError
+        If the convention is not supported, the longitude coordinate is
+        not found or is not one-dimensional, or the converted longitudes
+        are not unique.
+
+    Examples
+    --------
+    >>> # ERA5 files on 0..360 longitudes to -180..180, in longitude order
+    >>> convert_longitude_convention(['tas_2000.nc', 'tas_2001.nc'])
+    """
+    if not isinstance(file_list, list):
+        file_list = [file_list]
+    if convention not in LONGITUDE_CONVENTIONS:
+        raise ValueError(f"Unsupported longitude convention '{convention}'. "
+                         f"Options are {list(LONGITUDE_CONVENTIONS)}")
+    if max_memory_bytes is None:
+        max_memory_bytes = DEFAULT_MAX_MEMORY_BYTES
+    lfl = len(file_list)
+
+    for file_num, file_name in enumerate(file_list, start=1):
+        print_format_string(PREFMT_STR_PROGRESS_CONVERT, (convention, file_num, lfl))
+
+        if not is_editable_in_place(file_name):
+            _convert_with_cdo(file_name, convention, capture_output, encoding)
+            continue
+
+        # Compute the new coordinate and its order from the header and coordinate only
+        with netCDF4.Dataset(file_name) as dataset:
+            file_lon_name = lon_name or _find_longitude_variable(dataset)
+            lon_var = dataset.variables[file_lon_name]
+            if lon_var.dimensions != (file_lon_name,):
+                raise ValueError(f"Longitude '{file_lon_name}' of '{file_name}' is not a 1-D coordinate "
+                                 f"variable; dimensions are {lon_var.dimensions}.")
+            lon_values = lon_var[:]
+
+        converted_lon_values = _convert_longitudes(lon_values, convention)
+        order = np.argsort(converted_lon_values, kind="stable")
+        new_lon_values = converted_lon_values[order]
+        if np.any(np.diff(new_lon_values) <= 0):
+            raise ValueError(f"Converted longitudes of '{file_name}' are not unique.")
+        if np.array_equal(order, np.arange(order.size)) and np.array_equal(new_lon_values, lon_values):
+            continue
+
+        plan = get_active_plan()
+        if plan is not None:
+            plan.add_step(CONVERT_LONGITUDE_OPERATOR, [file_name], [file_name])
+            continue
+
+        with netCDF4.Dataset(file_name, "a") as dataset:
+            time_dim = _find_time_dimension(dataset)
+            lon_var = dataset.variables[file_lon_name]
+            lon_dim = lon_var.dimensions[0]
+            bounds_name = getattr(lon_var, "bounds", None)
+
+            # Move the stored values, without unpacking or masking them
+            dataset.set_auto_maskandscale(False)
+            for var_name, variable in dataset.variables.items():
+                if var_name == file_lon_name or lon_dim not in variable.dimensions:
+                    continue
+                if var_name == bounds_name:
+                    # Cells move as a whole, so bounds stay contiguous across the new edges
+                    lon_shifts = converted_lon_values - np.asarray(lon_values, dtype="d")
+                    variable[:] = (variable[:] + lon_shifts[:, np.newaxis])[order].astype(variable.dtype)
+                    continue
+                _reorder_variable(variable, variable.dimensions.index(lon_dim), order,
+                                  time_dim, max_memory_bytes)
+
+            lon_var[:] = new_lon_values.astype(lon_var.dtype)
+            if "valid_range" in lon_var.ncattrs():
+                lon_var.valid_range = np.array(LONGITUDE_CONVENTIONS[convention], dtype=lon_var.dtype)
+
+#--------------------------#
+# Parameters and constants #
+#--------------------------#
+
+# Longitude conventions and their ranges #
+LONGITUDE_CONVENTIONS = {"-180_180": (-180, 180), "0_360": (0, 360)}
+
+# Common longitude variable names #
+LONGITUDE_VARIABLE_NAMES = ["lon", "longitude", "nav_lon"]
+
+# Suffix of the temporary files written by CDO #
+TEMP_FILE_SUFFIX = "_temp"
+
+# Operator name of conversions, as recorded in command plans #
+CONVERT_LONGITUDE_OPERATOR = "convert_longitude"
+
+# Template strings #
+#------------------#
+
+# Progress verbose #
+PREFMT_STR_PROGRESS_CONVERT = \
+"""Converting longitudes to the {} convention for file
+{} out of {}..."""
@@ -1,42 +1,161 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+#----------------#
+# Import modules #
+#----------------#
+
+from functools import partial
+
 #------------------------#
 # Import project modules #
 #------------------------#
 
-from filewise.file_operations.ops_handler import add_to_path, rename_objects
+from climalab.netcdf_tools.command_plan import rename_output
+from climalab.netcdf_tools.command_runner import in_process_netcdf, run_command, run_command_batch
+from climalab.netcdf_tools.in_place_editing import (
+    modify_coordinate_in_place,
+    modify_variable_values_in_place
+)
+from filewise.file_operations.ops_handler import add_to_path
 from paramlib.global_parameters import BASIC_ARITHMETIC_OPERATORS
-from pygenutils.operative_systems.os_operations import run_system_command, exit_info
+from pygenutils.operative_systems.os_operations import exit_info
 from pygenutils.strings.text_formatters import format_string, print_format_string
 
 #-------------------------#
 # Define custom functions #
 #-------------------------#
 
+# Internal Helper Functions #
+#---------------------------#
+
+def _get_value_script(variable_name: str, operator: str, value: int | float) -> str:
+    """
+    Return the ncap2 statement applying an arithmetic operation to every value of a variable.
+    """
+    if operator not in BASIC_ARITHMETIC_OPERATORS:
+        raise ValueError(INVALID_OPERATOR_ERR_TEMPLATE)
+    is_whole_number = (abs(value-int(value)) == 0)
+    use_integer_format = int(is_whole_number)
+    format_args = (variable_name, variable_name, value)
+    return format_string(VARVAL_MOD_COMMAND_TEMPLATES_UV
+                         .get(operator)
+                         .get(use_integer_format),
+                         format_args)
+
+
+def _get_threshold_script(
+        dimension_name: str,
+        threshold: int | float,
+        operator: str,
+        value: int | float,
+        threshold_mode: str) -> str:
+    """
+    Return the ncap2 statement applying an arithmetic operation to the coordinate values beyond a threshold.
+    """
+    if operator not in BASIC_ARITHMETIC_OPERATORS:
+        raise ValueError(INVALID_OPERATOR_ERR_TEMPLATE)
+    if threshold_mode not in THRESHOLD_MODE_OPTS:
+        raise ValueError(format_string(INVALID_THRESHOLD_MODE_ERR_TEMPLATE, THRESHOLD_MODE_OPTS))
+    is_whole_number = (abs(value-int(value)) == 0)
+    use_integer_format = int(is_whole_number)
+    format_args = (dimension_name, threshold, dimension_name, dimension_name, value)
+    return format_string(VARVAL_MOD_COMMAND_TEMPLATES_BTH
+                         .get(operator)
+                         .get(threshold_mode)
+                         .get(use_integer_format),
+                         format_args)
+
+
+def _get_all_values_script(
+        dimension_name: str,
+        operator: str,
+        value: int | float,
+        threshold_mode: str = "max") -> str:
+    """
+    Return the ncap2 statement applying an arithmetic operation to every coordinate value.
+    """
+    if operator not in BASIC_ARITHMETIC_OPERATORS:
+        raise ValueError(INVALID_OPERATOR_ERR_TEMPLATE)
+    if threshold_mode not in THRESHOLD_MODE_OPTS:
+        raise ValueError(format_string(INVALID_THRESHOLD_MODE_ERR_TEMPLATE, THRESHOLD_MODE_OPTS))
+    is_whole_number = (abs(value-int(value)) == 0)
+    use_integer_format = int(is_whole_number)
+    format_args = (dimension_name, dimension_name, value)
+    return format_string(VARVAL_MOD_COMMAND_TEMPLATES_ALL
+                         .get(operator)
+                         .get(threshold_mode)
+                         .get(use_integer_format),
+                         format_args)
+
+
+def _get_units_script(variable_name: str, new_unit: str) -> str:
+    """
+    Return the ncap2 statement overwriting the units attribute of a variable.
+    """
+    return format_string(UNITS_ATT_COMMAND_TEMPLATE, (variable_name, new_unit))
+
+
+def _run_ncap2_script(
+        file_name: str,
+        script: str,
+        capture_output: bool = False,
+        encoding: str = "utf-8") -> None:
+    """
+    Run an ncap2 script on a file, writing a temporary file that then replaces it.
+    """
+    temp_file = add_to_path(file_name, str2add=file_name)
+
+    # Execute the command #
+    process_exit_info = run_command(
+        NCAP2_BASE_ARGS + [script, file_name, temp_file],
+        capture_output=capture_output,
+        encoding=encoding
+    )
+
+    # Call exit_info with parameters based on capture_output
+    exit_info(process_exit_info,
+        check_stdout=capture_output,
+        check_stderr=capture_output,
+        check_return_code=capture_output
+    )
+
+    # Rename the temporary file to the given file
+    rename_output(temp_file, file_name)
+
+
+# Main functions #
+#----------------#
+
+@in_process_netcdf
 def modify_variable_units_and_values(
         file_list: str | list[str],
-        variable_name: str,
+        variable_name: str | list[str],
         operator: str,
         value: int | float,
         new_unit: str,
         capture_output: bool = False,
         return_output_name: bool = False,
         encoding: str = "utf-8",
-        shell: bool = True) -> None:
+        shell: bool = True,
+        max_memory_bytes: int | None = None) -> None:
     """
     Modify variable units and values in NetCDF files using NCO tools.
     
-    This function changes both the units attribute and numerical values of a specified
-    variable in NetCDF files. It uses ncatted to modify units and ncap2 to perform
-    mathematical operations on the variable values.
+    This function changes both the units attribute and numerical values of
+    one or more variables in NetCDF files. Floating-point variables of
+    netCDF files are modified in place, block by block, through
+    `modify_variable_values_in_place`, with no temporary copy of the file.
+    Otherwise, the attribute change and the arithmetic of every variable
+    are fused into a single ncap2 script, so each file is rewritten only once.
     
     Parameters
     ----------
     file_list : str | list[str]
         Single file path or list of NetCDF file paths to modify.
-    variable_name : str
-        Name of the variable to modify.
+    variable_name : str | list[str]
+        Name of the variable to modify, or list of variables to which the
+        same operation and units apply (e.g. ['tas', 'tasmax', 'tasmin']).
     operator : {'+', '-', '*', '/'}
         Mathematical operator to apply.
     value : int | float
@@ -46,11 +165,15 @@ def modify_variable_units_and_values(
     capture_output : bool, optional
         Whether to capture the command output. Default is False.
     return_output_name : bool, optional
-        Whether to return file descriptor names. Default is False.
+        Kept for backwards compatibility; it has no effect. Default is False.
     encoding : str, optional
         Encoding to use when decoding command output. Default is "utf-8".
     shell : bool, optional
-        Whether to execute the command through the shell. Default is True.
+        Kept for backwards compatibility; commands never run through a shell.
+        Default is True.
+    max_memory_bytes : int | None, optional
+        Memory budget for the data read at once by in-place edits. If None,
+        `in_place_editing.DEFAULT_MAX_MEMORY_BYTES`. Default is None.
         
     Raises
     ------
@@ -59,8 +182,9 @@ def modify_variable_units_and_values(
         
     Notes
     -----
-    This function creates temporary files during processing and automatically
-    cleans them up by renaming them back to the original filenames.
+    When ncap2 is used, this function creates temporary files during
+    processing and automatically cleans them up by renaming them back to
+    the original filenames.
     
     Examples
     --------
@@ -73,78 +197,41 @@ def modify_variable_units_and_values(
     >>> modify_variable_units_and_values(
     ...     ['precip1.nc', 'precip2.nc'], 'pr', '*', 86400, 'mm/day'
     ... )
+
+    >>> # Convert several temperature variables from Kelvin to Celsius at once
+    >>> modify_variable_units_and_values(
+    ...     'temperature.nc', ['tas', 'tasmax', 'tasmin'], '-', 273.15, 'celsius'
+    ... )
     """
     
     if not isinstance(file_list, list):
         file_list = [file_list]
-    lfl = len(file_list)    
+    if not isinstance(variable_name, list):
+        variable_name = [variable_name]
+    lfl = len(file_list)
+
+    # Get the scripts from the corresponding switch case dictionary #
+    varval_mod_script = STATEMENT_DELIM.join(
+        f"{_get_value_script(var_name, operator, value)}{STATEMENT_DELIM}"
+        f"{_get_units_script(var_name, new_unit)}"
+        for var_name in variable_name
+    )
         
     for file_num, file_name in enumerate(file_list, start=1): 
-        temp_file = add_to_path(file_name, str2add=file_name)
-        
-        is_whole_number = (abs(value-int(value)) == 0)
-        use_integer_format = int(is_whole_number)
-        
-        var_chunit_formatted\
-        = f"ncatted -a units,{variable_name},o,c,'{new_unit}' '{file_name}'"   
-
-        # Run the command
-        process_exit_info = run_system_command(
-            var_chunit_formatted,
-            capture_output=True,
-            return_output_name=True,
-            encoding="utf-8",
-            shell=True
-        )
+        # Print progress information #
+        operator_gerund = OPERATOR_GERUND_DICT.get(operator)
+        format_args_print = (operator_gerund, value, "', '".join(variable_name), 
+                             file_num, lfl)
+        print_format_string(PREFMT_STR_PROGRESS_UV, format_args_print)
 
-        # Call exit_info with parameters based on capture_output
-        exit_info(process_exit_info,
-            check_stdout=True,
-            check_stderr=True,
-            check_return_code=True
-        )
-        
-        if operator not in BASIC_ARITHMETIC_OPERATORS:
-            raise ValueError(INVALID_OPERATOR_ERR_TEMPLATE)
-        else:            
-            # Print progress information #
-            operator_gerund = OPERATOR_GERUND_DICT.get(operator)
-            format_args_print = (NCAP2_BASE_ARGS, 
-                                 operator_gerund, value, variable_name, 
-                                 file_num, lfl)
-            print_format_string(PREFMT_STR_PROGRESS_UV, format_args_print)
-            
-            # Get the command from the corresponding switch case dictionary #
-            format_args = (NCAP2_BASE_ARGS,
-                           variable_name, variable_name, value,
-                           file_name, temp_file)
-            
-            varval_mod_formatted = \
-            format_string(VARVAL_MOD_COMMAND_TEMPLATES_UV
-                          .get(operator)
-                          .get(use_integer_format),
-                          format_args)
-        
-            # Execute the command through the shell #
-            process_exit_info = run_system_command(
-                varval_mod_formatted,
-                capture_output=capture_output,
-                return_output_name=return_output_name,
-                encoding=encoding,
-                shell=shell
-            )        
-
-            # Call exit_info with parameters based on capture_output
-            exit_info(process_exit_info,
-                check_stdout=capture_output,
-                check_stderr=capture_output,
-                check_return_code=capture_output
-            )
-            
-            # Rename the temporary file to the given file
-            rename_objects(temp_file, file_name)
+        # Change the values and units in place, or else in a single rewrite #
+        if modify_variable_values_in_place(file_name, variable_name, operator, value,
+                                           new_unit, max_memory_bytes):
+            continue
+        _run_ncap2_script(file_name, varval_mod_script, capture_output, encoding)
             
 
+@in_process_netcdf
 def modify_coordinate_values_by_threshold(
         file_list: str | list[str],
         dimension_name: str,
@@ -182,11 +269,12 @@ def modify_coordinate_values_by_threshold(
     capture_output : bool, optional
         Whether to capture the command output. Default is False.
     return_output_name : bool, optional
-        Whether to return file descriptor names. Default is False.
+        Kept for backwards compatibility; it has no effect. Default is False.
     encoding : str, optional
         Encoding to use when decoding command output. Default is "utf-8".
     shell : bool, optional
-        Whether to execute the command through the shell. Default is True.
+        Kept for backwards compatibility; commands never run through a shell.
+        Default is True.
         
     Raises
     ------
@@ -197,8 +285,10 @@ def modify_coordinate_values_by_threshold(
         
     Notes
     -----
-    This function creates temporary files during processing and automatically
-    cleans them up by renaming them back to the original filenames.
+    In netCDF files, only the coordinate variable is rewritten, in place
+    (see `in_place_editing.modify_coordinate_in_place`). ncap2 is used
+    otherwise, e.g. for integer coordinates given non-integer values; it
+    creates temporary files and renames them back to the original filenames.
     
     Examples
     --------
@@ -217,62 +307,28 @@ def modify_coordinate_values_by_threshold(
         file_list = [file_list]
     lfl = len(file_list) 
     
+    # Get the script from the corresponding switch case dictionary #
+    dimval_mod_script = _get_threshold_script(dimension_name, threshold, operator, value, threshold_mode)
+    
     for file_num, file_name in enumerate(file_list, start=1):
-        temp_file = add_to_path(file_name, str2add=file_name)
-        
-        is_whole_number = (abs(value-int(value)) == 0)
-        use_integer_format = int(is_whole_number)
-        
-        if operator not in BASIC_ARITHMETIC_OPERATORS:
-            raise ValueError(INVALID_OPERATOR_ERR_TEMPLATE)
-        else:
-            if threshold_mode not in THRESHOLD_MODE_OPTS:
-                raise ValueError(format_string(INVALID_THRESHOLD_MODE_ERR_TEMPLATE,
-                                               THRESHOLD_MODE_OPTS))
+        # Print progress information #
+        operator_gerund = OPERATOR_GERUND_DICT.get(operator)
             
-            else:
-                # Print progress information #
-                operator_gerund = OPERATOR_GERUND_DICT.get(operator)
-                    
-                format_args_print = (NCAP2_BASE_ARGS, 
-                                     operator_gerund, value, dimension_name, 
-                                     file_num, lfl)
-                
-                print_format_string(PREFMT_STR_PROGRESS_BTH, format_args_print)
-                
-                # Get the command from the corresponding switch case dictionary #
-                format_args = (NCAP2_BASE_ARGS,
-                               dimension_name, threshold,
-                               dimension_name, dimension_name, value,
-                               file_name, temp_file)
+        format_args_print = (operator_gerund, value, dimension_name, 
+                             file_num, lfl)
         
-                dimval_mod_formatted = \
-                format_string(VARVAL_MOD_COMMAND_TEMPLATES_BTH
-                              .get(operator)
-                              .get(threshold_mode)
-                              .get(use_integer_format),
-                              format_args)
-            
-                # Execute the command through the shell #
-                process_exit_info = run_system_command(
-                    dimval_mod_formatted,
-                    capture_output=capture_output,
-                    return_output_name=return_output_name,
-                    encoding=encoding,
-                    shell=shell
-                )
-                
-                # Call exit_info with parameters based on capture_output
-                exit_info(process_exit_info,
-                    check_stdout=capture_output,
-                    check_stderr=capture_output,
-                    check_return_code=capture_output
-                )
-                
-                # Rename the temporary file to the given file
-                rename_objects(temp_file, file_name)
+        print_format_string(PREFMT_STR_PROGRESS_BTH, format_args_print)
+
+        # Edit only the coordinate variable if possible #
+        if modify_coordinate_in_place(file_name, dimension_name, operator, value,
+                                      threshold=threshold, threshold_mode=threshold_mode):
+            continue
+    
+        # Execute the command #
+        _run_ncap2_script(file_name, dimval_mod_script, capture_output, encoding)
             
 
+@in_process_netcdf
 def modify_coordinate_all_values(
         file_list: str | list[str],
         dimension_name: str,
@@ -307,11 +363,12 @@ def modify_coordinate_all_values(
     capture_output : bool, optional
         Whether to capture the command output. Default is False.
     return_output_name : bool, optional
-        Whether to return file descriptor names. Default is False.
+        Kept for backwards compatibility; it has no effect. Default is False.
     encoding : str, optional
         Encoding to use when decoding command output. Default is "utf-8".
     shell : bool, optional
-        Whether to execute the command through the shell. Default is True.
+        Kept for backwards compatibility; commands never run through a shell.
+        Default is True.
         
     Raises
     ------
@@ -322,8 +379,10 @@ def modify_coordinate_all_values(
         
     Notes
     -----
-    This function creates temporary files during processing and automatically
-    cleans them up by renaming them back to the original filenames.
+    In netCDF files, only the coordinate variable is rewritten, in place
+    (see `in_place_editing.modify_coordinate_in_place`). ncap2 is used
+    otherwise, e.g. for integer coordinates given non-integer values; it
+    creates temporary files and renames them back to the original filenames.
     
     The threshold_mode parameter is maintained for API consistency but doesn't
     affect the operation since all coordinate values are modified regardless.
@@ -350,59 +409,257 @@ def modify_coordinate_all_values(
         file_list = [file_list]
     lfl = len(file_list) 
     
+    # Get the script from the corresponding switch case dictionary #
+    dimval_mod_script = _get_all_values_script(dimension_name, operator, value, threshold_mode)
+    
     for file_num, file_name in enumerate(file_list, start=1): 
-        temp_file = add_to_path(file_name, str2add=file_name)
-        
-        is_whole_number = (abs(value-int(value)) == 0)
-        use_integer_format = int(is_whole_number)
-        
-        if operator not in BASIC_ARITHMETIC_OPERATORS:
-            raise ValueError(INVALID_OPERATOR_ERR_TEMPLATE)
-        else:
-            if threshold_mode not in THRESHOLD_MODE_OPTS:
-                raise ValueError(format_string(INVALID_THRESHOLD_MODE_ERR_TEMPLATE,
-                                               THRESHOLD_MODE_OPTS))
-            
-            else:
-                # Print progress information #
-                operator_gerund = OPERATOR_GERUND_DICT.get(operator)
-                    
-                format_args_print = (NCAP2_BASE_ARGS,
-                                     operator_gerund, value, dimension_name, 
-                                     file_num, lfl)
-                
-                print_format_string(PREFMT_STR_PROGRESS_BTH, format_args_print)
-                
-                # Get the command from the corresponding switch case dictionary #
-                format_args = (NCAP2_BASE_ARGS,
-                               dimension_name, dimension_name, value,
-                               file_name, temp_file)
-                
-                dimval_mod_formatted = \
-                format_string(VARVAL_MOD_COMMAND_TEMPLATES_ALL
-                              .get(operator)
-                              .get(threshold_mode)
-                              .get(use_integer_format),
-                              format_args)
+        # Print progress information #
+        operator_gerund = OPERATOR_GERUND_DICT.get(operator)
             
-                # Execute the command through the shell #
-                process_exit_info = run_system_command(
-                    dimval_mod_formatted,
-                    capture_output=capture_output,
-                    return_output_name=return_output_name,
-                    encoding=encoding,
-                    shell=shell
-                )
-                
-                # Call exit_info with parameters based on capture_output
-                exit_info(process_exit_info,
-                    check_stdout=capture_output,
-                    check_stderr=capture_output,
-                    check_return_code=capture_output
-                )
-                
-                # Rename the temporary file to the given file
-                rename_objects(temp_file, file_name)
+        format_args_print = (operator_gerund, value, dimension_name, 
+                             file_num, lfl)
+        
+        print_format_string(PREFMT_STR_PROGRESS_ALL, format_args_print)
+
+        # Edit only the coordinate variable if possible #
+        if modify_coordinate_in_place(file_name, dimension_name, operator, value):
+            continue
+    
+        # Execute the command #
+        _run_ncap2_script(file_name, dimval_mod_script, capture_output, encoding)
+
+
+# Edit batches #
+#--------------#
+
+class NcoEditBatch:
+    """
+    Queue NCO edits per file and apply them with a single ncap2 rewrite of each file.
+
+    Each method queues the edit of the function of the same name for the
+    given files, in the order the edits are to be applied, and returns the
+    batch itself so that calls can be chained. When run, the queued
+    statements of each file (built from the same templates as the
+    functions) are joined into one ncap2 script, and the files are
+    rewritten concurrently, once each, instead of once per edit.
+
+    Used as a context manager, the batch is run on exit, unless an
+    exception was raised.
+
+    Examples
+    --------
+    >>> with NcoEditBatch() as batch:
+    ...     batch.modify_variable_units_and_values(file_list, ['tas', 'tasmax'], '-', 273.15, 'celsius')
+    ...     batch.modify_coordinate_values_by_threshold(file_list, 'lon', 180, '-', 360, threshold_mode='min')
+    >>> batch.get_script(file_list[0])
+    'tas=tas-273.15f;tas@units="celsius";tasmax=tasmax-273.15f;tasmax@units="celsius";where(lon>180) lon=lon-360'
+    """
+
+    def __init__(self) -> None:
+        self.edits = {}
+
+    def __repr__(self) -> str:
+        n_statements = sum(len(statements) for statements in self.edits.values())
+        return f"{type(self).__name__}(n_files={len(self.edits)}, n_statements={n_statements})"
+
+    def __enter__(self) -> "NcoEditBatch":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        if exc_type is None:
+            self.run()
+
+    def _queue(self, file_list: str | list[str], statements: list[str]) -> "NcoEditBatch":
+        if not isinstance(file_list, list):
+            file_list = [file_list]
+        for file_name in file_list:
+            self.edits.setdefault(file_name, []).extend(statements)
+        return self
+
+    # Edits #
+    #~~~~~~~#
+
+    def modify_variable_units_and_values(
+            self,
+            file_list: str | list[str],
+            variable_name: str | list[str],
+            operator: str,
+            value: int | float,
+            new_unit: str) -> "NcoEditBatch":
+        """
+        Queue a change of variable units and values (see `modify_variable_units_and_values`).
+
+        Parameters
+        ----------
+        file_list : str | list[str]
+            Single file path or list of NetCDF file paths to modify.
+        variable_name : str | list[str]
+            Name of the variable to modify, or list of variables.
+        operator : {'+', '-', '*', '/'}
+            Mathematical operator to apply.
+        value : int | float
+            Numerical value to use with the operator.
+        new_unit : str
+            New unit string to assign to the variables.
+
+        Returns
+        -------
+        NcoEditBatch
+            The batch itself.
+
+        Raises
+        ------
+        ValueError
+            If the operator is not one of the basic four mathematical rules.
+        """
+        if not isinstance(variable_name, list):
+            variable_name = [variable_name]
+        statements = []
+        for var_name in variable_name:
+            statements += [_get_value_script(var_name, operator, value),
+                           _get_units_script(var_name, new_unit)]
+        return self._queue(file_list, statements)
+
+    def modify_coordinate_values_by_threshold(
+            self,
+            file_list: str | list[str],
+            dimension_name: str,
+            threshold: int | float,
+            operator: str,
+            value: int | float,
+            threshold_mode: str = "max") -> "NcoEditBatch":
+        """
+        Queue a conditional change of coordinate values (see `modify_coordinate_values_by_threshold`).
+
+        Parameters
+        ----------
+        file_list : str | list[str]
+            Single file path or list of NetCDF file paths to modify.
+        dimension_name : str
+            Name of the dimension/coordinate to modify.
+        threshold : int | float
+            Threshold value for the conditional operation.
+        operator : {'+', '-', '*', '/'}
+            Mathematical operator to apply.
+        value : int | float
+            Numerical value to use with the operator.
+        threshold_mode : str, optional
+            Threshold comparison mode, 'max' or 'min'. Default is 'max'.
+
+        Returns
+        -------
+        NcoEditBatch
+            The batch itself.
+
+        Raises
+        ------
+        ValueError
+            If the operator or the threshold mode is not supported.
+        """
+        statement = _get_threshold_script(dimension_name, threshold, operator, value, threshold_mode)
+        return self._queue(file_list, [statement])
+
+    def modify_coordinate_all_values(
+            self,
+            file_list: str | list[str],
+            dimension_name: str,
+            operator: str,
+            value: int | float,
+            threshold_mode: str = "max") -> "NcoEditBatch":
+        """
+        Queue a change of all coordinate values (see `modify_coordinate_all_values`).
+
+        Parameters
+        ----------
+        file_list : str | list[str]
+            Single file path or list of NetCDF file paths to modify.
+        dimension_name : str
+            Name of the dimension/coordinate whose values will be modified.
+        operator : {'+', '-', '*', '/'}
+            Mathematical operator to apply.
+        value : int | float
+            Numerical value to use with the operator.
+        threshold_mode : str, optional
+            Kept for consistency with `modify_coordinate_all_values`.
+            Default is 'max'.
+
+        Returns
+        -------
+        NcoEditBatch
+            The batch itself.
+
+        Raises
+        ------
+        ValueError
+            If the operator or the threshold mode is not supported.
+        """
+        statement = _get_all_values_script(dimension_name, operator, value, threshold_mode)
+        return self._queue(file_list, [statement])
+
+    # Execution #
+    #~~~~~~~~~~~#
+
+    def get_script(self, file_name: str) -> str:
+        """
+        Return the ncap2 script compiled from the edits queued for a file.
+
+        Parameters
+        ----------
+        file_name : str
+            File path, as given when queueing the edits.
+
+        Returns
+        -------
+        str
+            The ncap2 script, with statements in queueing order.
+        """
+        return STATEMENT_DELIM.join(self.edits.get(file_name, []))
+
+    def run(
+            self,
+            max_workers: int | None = None,
+            capture_output: bool = False,
+            encoding: str = "utf-8") -> None:
+        """
+        Rewrite every file once with its compiled script, concurrently across files.
+
+        The queue is emptied once all files have been rewritten.
+
+        Parameters
+        ----------
+        max_workers : int | None, optional
+            Maximum number of files processed concurrently. If None, as many
+            files as available CPUs are processed at once. Default is None.
+        capture_output : bool, optional
+            Whether to capture the command output. Default is False.
+        encoding : str, optional
+            Encoding to use when decoding command output. Default is "utf-8".
+
+        Returns
+        -------
+        None
+        """
+        cmd_list = []
+        post_command_actions = []
+        lfl = len(self.edits)
+        for file_num, file_name in enumerate(self.edits, start=1):
+            print_format_string(PREFMT_STR_PROGRESS_BATCH,
+                                (len(self.edits[file_name]), file_num, lfl))
+            temp_file = add_to_path(file_name, str2add=file_name)
+            cmd_list.append(NCAP2_BASE_ARGS + [self.get_script(file_name), file_name, temp_file])
+
+            # Rename the temporary file to the given file once the command succeeds
+            post_command_actions.append(partial(rename_output, temp_file, file_name))
+
+        # Run the commands concurrently and check their exit statuses in order
+        run_command_batch(
+            cmd_list,
+            max_workers=max_workers,
+            post_command_actions=post_command_actions,
+            capture_output=capture_output,
+            encoding=encoding
+        )
+        self.edits.clear()
 
 #--------------------------#
 # Parameters and constants #
@@ -412,7 +669,8 @@ def modify_coordinate_all_values(
 #------------------#
 
 # NCAP2 command #
-NCAP2_BASE_ARGS = "ncap2 -O -s"
+NCAP2_BASE_ARGS = ["ncap2", "-O", "-s"]
+STATEMENT_DELIM = ";"
 
 # Progress verbose #
 PREFMT_STR_PROGRESS_UV = \
@@ -427,37 +685,44 @@ PREFMT_STR_PROGRESS_ALL = \
 """{} the value of {} to '{}' dimension's values for file
 {} out of {}..."""
 
-# NCAP2 command's argument syntaxes, for all values or dimensions #
-ADDVALUE_COMMAND_TEMPLATE = """{} '{}={}+{}' '{}' '{}'"""
-SUBTRVALUE_COMMAND_TEMPLATE = """{} '{}={}-{}' '{}' '{}'"""
-MULTVALUE_COMMAND_TEMPLATE = """{} '{}={}*{}' '{}' '{}'"""
-DIVVALUE_COMMAND_TEMPLATE = """{} '{}={}/{}' '{}' '{}'"""
-
-ADDVALUE_FLOAT_COMMAND_TEMPLATE = """{} '{}={}+{}.0f' '{}' '{}'"""
-SUBTRVALUE_FLOAT_COMMAND_TEMPLATE = """{} '{}={}-{}.0f' '{}' '{}'"""
-MULTVALUE_FLOAT_COMMAND_TEMPLATE = """{} '{}={}*{}.0f' '{}' '{}'"""
-DIVVALUE_FLOAT_COMMAND_TEMPLATE = """{} '{}={}/{}.0f' '{}' '{}'"""
-
-# NCAP2 command's argument syntaxes, conditional #
-ADDVALUE_WHERE_MAX_COMMAND_TEMPLATE = """{} 'where({}<{}) {}={}+{}' '{}' '{}'"""
-SUBTRVALUE_WHERE_MAX_COMMAND_TEMPLATE = """{} 'where({}<{}) {}={}-{}' '{}' '{}'"""
-MULTVALUE_WHERE_MAX_COMMAND_TEMPLATE = """{} 'where({}<{}) {}={}*{}' '{}' '{}'"""
-DIVVALUE_WHERE_MAX_COMMAND_TEMPLATE = """{} 'where({}<{}) {}={}/{}' '{}' '{}'"""
-
-ADDVALUE_WHERE_MAX_FLOAT_COMMAND_TEMPLATE = """{} 'where({}<{}) {}={}+{}.0f' '{}' '{}'"""
-SUBTRVALUE_WHERE_MAX_FLOAT_COMMAND_TEMPLATE = """{} 'where({}<{}) {}={}-{}.0f' '{}' '{}'"""
-MULTVALUE_WHERE_MAX_FLOAT_COMMAND_TEMPLATE = """{} 'where({}<{}) {}={}*{}.0f' '{}' '{}'"""
-DIVVALUE_WHERE_MAX_FLOAT_COMMAND_TEMPLATE = """{} 'where({}<{}) {}={}/{}.0f' '{}' '{}'"""
-
-ADDVALUE_WHERE_MIN_COMMAND_TEMPLATE = """{} 'where({}>{}) {}={}+{}' '{}' '{}'"""
-SUBTRVALUE_WHERE_MIN_COMMAND_TEMPLATE = """{} 'where({}>{}) {}={}-{}' '{}' '{}'"""
-MULTVALUE_WHERE_MIN_COMMAND_TEMPLATE = """{} 'where({}>{}) {}={}*{}' '{}' '{}'"""
-DIVVALUE_WHERE_MIN_COMMAND_TEMPLATE = """{} 'where({}>{}) {}={}/{}' '{}' '{}'"""
-
-ADDVALUE_WHERE_MIN_FLOAT_COMMAND_TEMPLATE = """{} 'where({}>{}) {}={}+{}.0f' '{}' '{}'"""
-SUBTRVALUE_WHERE_MIN_FLOAT_COMMAND_TEMPLATE = """{} 'where({}>{}) {}={}-{}.0f' '{}' '{}'"""
-MULTVALUE_WHERE_MIN_FLOAT_COMMAND_TEMPLATE = """{} 'where({}>{}) {}={}*{}.0f' '{}' '{}'"""
-DIVVALUE_WHERE_MIN_FLOAT_COMMAND_TEMPLATE = """{} 'where({}>{}) {}={}/{}.0f' '{}' '{}'"""
+PREFMT_STR_PROGRESS_BATCH = \
+"""Applying {} queued NCO edits in a single rewrite for file
+{} out of {}..."""
+
+# NCAP2 scripts, for all values or dimensions #
+ADDVALUE_COMMAND_TEMPLATE = "{}={}+{}"
+SUBTRVALUE_COMMAND_TEMPLATE = "{}={}-{}"
+MULTVALUE_COMMAND_TEMPLATE = "{}={}*{}"
+DIVVALUE_COMMAND_TEMPLATE = "{}={}/{}"
+
+ADDVALUE_FLOAT_COMMAND_TEMPLATE = "{}={}+{}f"
+SUBTRVALUE_FLOAT_COMMAND_TEMPLATE = "{}={}-{}f"
+MULTVALUE_FLOAT_COMMAND_TEMPLATE = "{}={}*{}f"
+DIVVALUE_FLOAT_COMMAND_TEMPLATE = "{}={}/{}f"
+
+# NCAP2 scripts, attributes #
+UNITS_ATT_COMMAND_TEMPLATE = '{}@units="{}"'
+
+# NCAP2 scripts, conditional #
+ADDVALUE_WHERE_MAX_COMMAND_TEMPLATE = "where({}<{}) {}={}+{}"
+SUBTRVALUE_WHERE_MAX_COMMAND_TEMPLATE = "where({}<{}) {}={}-{}"
+MULTVALUE_WHERE_MAX_COMMAND_TEMPLATE = "where({}<{}) {}={}*{}"
+DIVVALUE_WHERE_MAX_COMMAND_TEMPLATE = "where({}<{}) {}={}/{}"
+
+ADDVALUE_WHERE_MAX_FLOAT_COMMAND_TEMPLATE = "where({}<{}) {}={}+{}f"
+SUBTRVALUE_WHERE_MAX_FLOAT_COMMAND_TEMPLATE = "where({}<{}) {}={}-{}f"
+MULTVALUE_WHERE_MAX_FLOAT_COMMAND_TEMPLATE = "where({}<{}) {}={}*{}f"
+DIVVALUE_WHERE_MAX_FLOAT_COMMAND_TEMPLATE = "where({}<{}) {}={}/{}f"
+
+ADDVALUE_WHERE_MIN_COMMAND_TEMPLATE = "where({}>{}) {}={}+{}"
+SUBTRVALUE_WHERE_MIN_COMMAND_TEMPLATE = "where({}>{}) {}={}-{}"
+MULTVALUE_WHERE_MIN_COMMAND_TEMPLATE = "where({}>{}) {}={}*{}"
+DIVVALUE_WHERE_MIN_COMMAND_TEMPLATE = "where({}>{}) {}={}/{}"
+
+ADDVALUE_WHERE_MIN_FLOAT_COMMAND_TEMPLATE = "where({}>{}) {}={}+{}f"
+SUBTRVALUE_WHERE_MIN_FLOAT_COMMAND_TEMPLATE = "where({}>{}) {}={}-{}f"
+MULTVALUE_WHERE_MIN_FLOAT_COMMAND_TEMPLATE = "where({}>{}) {}={}*{}f"
+DIVVALUE_WHERE_MIN_FLOAT_COMMAND_TEMPLATE = "where({}>{}) {}={}/{}f"
 
 # Fixed strings #
 #---------------#
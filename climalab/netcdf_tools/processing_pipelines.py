@@ -0,0 +1,532 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import glob
+import importlib
+import json
+import os
+import re
+import threading
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pathlib import Path
+
+import yaml
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from climalab.netcdf_tools.command_runner import DEFAULT_MAX_WORKERS, runs_netcdf_in_process
+from climalab.netcdf_tools.result_cache import file_fingerprint, fingerprint_digest
+
+#-------------------------#
+# Define custom functions #
+#-------------------------#
+
+# Internal Helper Functions #
+#---------------------------#
+
+def _fill_placeholders(template: str, values: dict) -> str:
+    """
+    Replace the '{key}' placeholders of a template whose key is in `values`, leaving the others.
+    """
+    return PLACEHOLDER_PATTERN.sub(
+        lambda match: str(values[match.group(1)]) if match.group(1) in values else match.group(0),
+        template
+    )
+
+
+def _fill_nested(obj: object, values: dict) -> object:
+    """
+    Fill the placeholders of every string in a (possibly nested) list or dictionary.
+    """
+    if isinstance(obj, str):
+        return _fill_placeholders(obj, values)
+    if isinstance(obj, list):
+        return [_fill_nested(item, values) for item in obj]
+    if isinstance(obj, dict):
+        return {key: _fill_nested(val, values) for key, val in obj.items()}
+    return obj
+
+
+def _expand_file_spec(spec: str, params: dict, step_outputs: dict) -> list[tuple[str, dict]]:
+    """
+    Expand a file specification into (path, fields) pairs.
+
+    A specification is either '@step_name', for the outputs of an earlier
+    step, or a path. Placeholders of a path that are not pipeline
+    parameters act as wildcards, whose matched values are returned as the
+    fields of each file; e.g. 'tas_day_ERA5_{year}.nc' matches
+    'tas_day_ERA5_2000.nc' with fields {'year': '2000'}. Paths with
+    neither wildcards nor glob characters are returned as they are.
+    """
+    if spec.startswith(STEP_REFERENCE_PREFIX):
+        step_name = spec[len(STEP_REFERENCE_PREFIX):]
+        if step_name not in step_outputs:
+            raise ValueError(f"'{spec}' does not refer to an earlier step.")
+        return step_outputs[step_name]
+
+    spec = _fill_placeholders(spec, params)
+    field_names = PLACEHOLDER_PATTERN.findall(spec)
+    if not field_names and not glob.has_magic(spec):
+        return [(spec, {})]
+
+    # Build the glob pattern and a regex capturing the fields #
+    glob_pattern = PLACEHOLDER_PATTERN.sub("*", spec)
+    regex_parts = []
+    seen_fields = set()
+    for literal_part, field_name in re.findall(r"([^{]*)(?:\{(\w+)\})?", spec):
+        regex_parts.append(re.escape(literal_part).replace(r"\*", "[^/]*").replace(r"\?", "[^/]"))
+        if field_name:
+            regex_parts.append(f"(?P={field_name})" if field_name in seen_fields
+                               else f"(?P<{field_name}>[^/]+?)")
+            seen_fields.add(field_name)
+    file_regex = re.compile("".join(regex_parts))
+
+    matches = []
+    for path in sorted(glob.glob(glob_pattern)):
+        match = file_regex.fullmatch(path)
+        if match:
+            matches.append((path, match.groupdict()))
+    return matches
+
+
+def _resolve_function(function_name: str):
+    """
+    Return the pipeline function with the given name.
+
+    Plain names are looked up in `PIPELINE_FUNCTION_MODULES`, in order;
+    'module.function' names refer to any `climalab.netcdf_tools` module.
+    """
+    if "." in function_name:
+        module_name, function_name = function_name.rsplit(".", 1)
+        module_names = [module_name]
+    else:
+        module_names = PIPELINE_FUNCTION_MODULES
+
+    for module_name in module_names:
+        module = importlib.import_module(f"climalab.netcdf_tools.{module_name}")
+        function = getattr(module, function_name, None)
+        if callable(function):
+            return function
+    raise ValueError(f"Function '{function_name}' not found in modules {module_names}.")
+
+
+def _runs_in_process(function, args: dict) -> bool:
+    """
+    Check whether a task reads netCDF files in Python rather than through CDO/NCO commands.
+    """
+    return runs_netcdf_in_process(function) or args.get("engine", "cdo") != "cdo"
+
+
+def _task_signature(task: dict) -> str:
+    """
+    Digest of everything defining a task besides its input file contents.
+    """
+    return fingerprint_digest(task["function"], task["args"], task.get("positional"),
+                              task["inputs"], task["outputs"])
+
+
+def _is_up_to_date(task: dict, state_entry: dict | None) -> bool:
+    """
+    Check whether a task's outputs exist and its definition and inputs are as in its last run.
+    """
+    if state_entry is None or state_entry.get("signature") != _task_signature(task):
+        return False
+    if not all(os.path.exists(output) for output in task["outputs"]):
+        return False
+    for input_file in task["inputs"]:
+        if not os.path.exists(input_file):
+            return False
+        if state_entry["inputs"].get(input_file) != fingerprint_digest(file_fingerprint(input_file)):
+            return False
+    return True
+
+
+def _read_state(state_file: str) -> dict:
+    if not os.path.exists(state_file):
+        return {}
+    with open(state_file, encoding="utf-8") as state_obj:
+        return json.load(state_obj)
+
+
+def _write_state(state_file: str, state: dict) -> None:
+    # Write to a temporary name, so an interrupted run never leaves a partial state file
+    temp_state_file = f"{state_file}.tmp"
+    with open(temp_state_file, "w", encoding="utf-8") as state_obj:
+        json.dump(state, state_obj, indent=1)
+    os.replace(temp_state_file, state_file)
+
+
+def _run_task(task: dict, state: dict, state_file: str, state_lock: threading.Lock, force: bool) -> str:
+    """
+    Run a task unless it is up to date, then record its inputs in the state file.
+
+    Returns 'run' or 'skipped'.
+    """
+    with state_lock:
+        state_entry = state.get(task["id"])
+    if not force and _is_up_to_date(task, state_entry):
+        return "skipped"
+
+    print(f"Running pipeline task '{task['id']}'")
+    function = _resolve_function(task["function"])
+    positional_args = [task["positional"]] if "positional" in task else []
+    if _runs_in_process(function, task["args"]):
+        with _in_process_lock:
+            function(*positional_args, **task["args"])
+    else:
+        function(*positional_args, **task["args"])
+
+    missing_outputs = [output for output in task["outputs"] if not os.path.exists(output)]
+    if missing_outputs:
+        raise RuntimeError(f"Task '{task['id']}' did not produce {missing_outputs}.")
+
+    # Fingerprints are taken after the run, so files edited in place count as unchanged
+    with state_lock:
+        state[task["id"]] = dict(
+            signature=_task_signature(task),
+            inputs={input_file: fingerprint_digest(file_fingerprint(input_file))
+                    for input_file in task["inputs"]}
+        )
+        _write_state(state_file, state)
+    return "run"
+
+
+# Main functions #
+#----------------#
+
+def load_pipeline_config(config_path: str | Path) -> dict:
+    """
+    Load a processing pipeline configuration from a YAML file.
+
+    Top-level string parameters may refer to other top-level parameters,
+    as in the download configuration files, e.g.
+    `project_dir: "{repo_path}/data_downloads/{project_name}"`.
+
+    Parameters
+    ----------
+    config_path : str | Path
+        Path to the YAML configuration file.
+
+    Returns
+    -------
+    dict
+        Configuration with the references between parameters resolved.
+
+    Raises
+    ------
+    ValueError
+        If the configuration has no list of steps.
+
+    Examples
+    --------
+    >>> config = load_pipeline_config('config/era5_postprocessing_pipeline.yaml')
+    """
+    with open(config_path, encoding="utf-8") as config_obj:
+        config = yaml.safe_load(config_obj)
+
+    if not isinstance(config.get("steps"), list):
+        raise ValueError(f"Pipeline configuration '{config_path}' has no list of 'steps'.")
+
+    # Resolve references between parameters until nothing changes #
+    params = {key: val for key, val in config.items() if key != "steps"}
+    for _ in range(len(params)):
+        resolved_params = _fill_nested(params, params)
+        if resolved_params == params:
+            break
+        params = resolved_params
+    config.update(params)
+    return config
+
+
+def build_pipeline_tasks(config: dict) -> list[dict]:
+    """
+    Expand the steps of a pipeline configuration into a dependency graph of tasks.
+
+    Each step is a dictionary with keys:
+    - 'name': unique step name.
+    - 'function': name of the function to call, looked up in `cdo_tools`
+      and `nco_tools` (or 'module.function' for other `netcdf_tools` modules).
+    - 'inputs' (optional): file specifications, passed to the function as
+      its first argument (a single path, or a list of paths).
+    - 'foreach' (optional): a file specification; instead of 'inputs', one
+      task is created per matching file, which is passed as the first
+      argument.
+    - 'extra_inputs' (optional): file specifications the function reads but
+      which are not passed as its first argument (e.g. a climatology given
+      in 'args').
+    - 'outputs': the files the function writes, which must be declared
+      since the wrappers name their outputs themselves.
+    - 'args' (optional): keyword arguments of the function.
+
+    A file specification is '@step_name', for the outputs of an earlier
+    step, or a path, in which placeholders that are not pipeline parameters
+    act as wildcards (see the 'foreach' example below). In 'outputs' and
+    'args', '{input}', '{name}' (file name without extension), '{output}'
+    (first output) and the wildcard fields of the current 'foreach' file
+    can be used, e.g.:
+
+        - name: "sellonlatbox"
+          function: "cdo_sellonlatbox"
+          foreach: "{input_data_dir}/tas_day_ERA5_{year}.nc"
+          outputs:
+            - "tas_day_ERA5_reanalysis_sellonlatbox_{region}_{year}-{year}.nc"
+          args:
+            coords: "-4,-1,42,44"
+            ...
+
+    Outputs of a 'foreach' step keep the fields of their input file, so a
+    later 'foreach' over '@sellonlatbox' can still use '{year}'. Tasks
+    depend on the tasks that write their inputs; since steps may only refer
+    to earlier steps, the graph has no cycles.
+
+    Parameters
+    ----------
+    config : dict
+        Pipeline configuration, as returned by `load_pipeline_config`.
+
+    Returns
+    -------
+    list[dict]
+        Tasks in declaration order, with keys 'id', 'step', 'function',
+        'args', 'inputs', 'outputs', 'dependencies' and, if the function
+        takes input files, 'positional'.
+
+    Raises
+    ------
+    ValueError
+        If a step is malformed, refers to an unknown step, or writes a file
+        already written by another task without reading it (files edited
+        in place are allowed).
+    """
+    params = {key: val for key, val in config.items() if key != "steps"}
+    tasks = []
+    step_outputs = {}
+    producers = {}
+
+    for step in config["steps"]:
+        missing_keys = [key for key in STEP_REQUIRED_KEYS if key not in step]
+        if missing_keys:
+            raise ValueError(f"Pipeline step {step.get('name', step)!r} lacks keys {missing_keys}.")
+        step_name = step["name"]
+        if step_name in step_outputs:
+            raise ValueError(f"Duplicate pipeline step name '{step_name}'.")
+        if "foreach" in step and "inputs" in step:
+            raise ValueError(f"Pipeline step '{step_name}' cannot have both 'foreach' and 'inputs'.")
+
+        extra_inputs = [path
+                        for spec in step.get("extra_inputs", [])
+                        for path, _ in _expand_file_spec(spec, params, step_outputs)]
+
+        # One task per 'foreach' file, or a single task #
+        if "foreach" in step:
+            items = [(f"{step_name}[{Path(path).stem}]", path, fields)
+                     for path, fields in _expand_file_spec(step["foreach"], params, step_outputs)]
+        else:
+            items = [(step_name, None, {})]
+
+        step_outputs[step_name] = []
+        for task_id, input_file, fields in items:
+            values = {**params, **fields}
+            task = dict(id=task_id, step=step_name, function=step["function"])
+
+            if input_file is not None:
+                values.update(input=input_file, name=Path(input_file).stem)
+                task["positional"] = input_file
+                input_files = [input_file]
+            elif "inputs" in step:
+                input_files = [path
+                               for spec in step["inputs"]
+                               for path, _ in _expand_file_spec(spec, params, step_outputs)]
+                task["positional"] = input_files[0] if len(input_files) == 1 else input_files
+            else:
+                input_files = []
+
+            task["outputs"] = [_fill_placeholders(output, values) for output in step["outputs"]]
+            if task["outputs"]:
+                values["output"] = task["outputs"][0]
+            task["args"] = _fill_nested(step.get("args") or {}, values)
+            task["inputs"] = input_files + [path for path in extra_inputs if path not in input_files]
+            task["dependencies"] = sorted({producers[os.path.normpath(path)]
+                                           for path in task["inputs"]
+                                           if os.path.normpath(path) in producers})
+
+            for output in task["outputs"]:
+                output_key = os.path.normpath(output)
+                if output_key in producers and output not in task["inputs"]:
+                    raise ValueError(f"Output '{output}' of task '{task_id}' is already "
+                                     f"written by task '{producers[output_key]}'.")
+                producers[output_key] = task_id
+                step_outputs[step_name].append((output, fields))
+            tasks.append(task)
+
+    return tasks
+
+
+def run_pipeline(
+        config: dict | str | Path,
+        max_workers: int | None = None,
+        dry_run: bool = False,
+        force: bool = False) -> dict[str, str]:
+    """
+    Run a processing pipeline incrementally, with dependency-aware parallelism.
+
+    Like `make`, a task is only run if it has never run, if its definition
+    changed, if one of its outputs is missing, or if one of its input files
+    changed (by size or modification time) since its last successful run,
+    which is recorded in the pipeline state file. A rebuilt output thus
+    causes its dependents to be rebuilt, and adding one new year of data
+    to a 'foreach' step only runs that year's tasks and the tasks that
+    read all years (e.g. a merge). Up to `max_workers` tasks whose
+    dependencies have finished run at the same time, except that tasks
+    reading netCDF files in Python (functions marked with
+    `command_runner.in_process_netcdf`, or wrappers called with an 'engine'
+    other than 'cdo') run one at a time, since the HDF5 library is not
+    thread-safe. A failed task does not stop independent tasks, but its
+    dependents are not run.
+
+    Pipeline parameters used by the scheduler:
+    - 'work_dir' (optional): directory where the pipeline runs, so that
+      relative paths (including the outputs of the wrappers, which write
+      to the working directory) are relative to it.
+    - 'state_file' (optional): JSON file recording the last successful run
+      of every task. Default is `DEFAULT_STATE_FILE_NAME`.
+    - 'max_workers' (optional): default for `max_workers`.
+
+    Parameters
+    ----------
+    config : dict | str | Path
+        Pipeline configuration, or path to its YAML file
+        (see `load_pipeline_config` and `build_pipeline_tasks`).
+    max_workers : int | None, optional
+        Maximum number of tasks running at the same time. If None, the
+        'max_workers' parameter of the pipeline, or the number of available
+        CPUs, is used. Default is None.
+    dry_run : bool, optional
+        Whether to only report which tasks would run, without running them.
+        Default is False.
+    force : bool, optional
+        Whether to run every task, whether up to date or not. Default is False.
+
+    Returns
+    -------
+    dict[str, str]
+        Status of every task, in declaration order: 'run', 'skipped'
+        (up to date) or, in a dry run, 'run' for the tasks that would run.
+
+    Raises
+    ------
+    RuntimeError
+        If one or more tasks fail. The message lists the failed tasks and
+        those not run because of them.
+
+    Examples
+    --------
+    >>> run_pipeline('config/era5_postprocessing_pipeline.yaml', dry_run=True)
+    {'sellonlatbox[tas_day_ERA5_2024]': 'run', 'mergetime': 'run', ...}
+    """
+    if not isinstance(config, dict):
+        config = load_pipeline_config(config)
+    if max_workers is None:
+        max_workers = config.get("max_workers", DEFAULT_MAX_WORKERS)
+
+    original_dir = os.getcwd()
+    if config.get("work_dir"):
+        os.makedirs(config["work_dir"], exist_ok=True)
+        os.chdir(config["work_dir"])
+
+    try:
+        tasks = build_pipeline_tasks(config)
+        state_file = config.get("state_file", DEFAULT_STATE_FILE_NAME)
+        state = _read_state(state_file)
+
+        # Dry run: a task runs if it is out of date or depends on a task that runs #
+        if dry_run:
+            statuses = {}
+            for task in tasks:
+                runs = (force
+                        or not _is_up_to_date(task, state.get(task["id"]))
+                        or any(statuses[dep_id] == "run" for dep_id in task["dependencies"]))
+                statuses[task["id"]] = "run" if runs else "skipped"
+            return statuses
+
+        task_dict = {task["id"]: task for task in tasks}
+        pending_dependencies = {task["id"]: set(task["dependencies"]) for task in tasks}
+        dependents = {task["id"]: [] for task in tasks}
+        for task in tasks:
+            for dep_id in task["dependencies"]:
+                dependents[dep_id].append(task["id"])
+
+        statuses = {}
+        failure_messages = []
+        state_lock = threading.Lock()
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            running = {}
+
+            def submit(task_id):
+                future = executor.submit(_run_task, task_dict[task_id], state, state_file, state_lock, force)
+                running[future] = task_id
+
+            for task in tasks:
+                if not task["dependencies"]:
+                    submit(task["id"])
+
+            while running:
+                done_futures, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done_futures:
+                    task_id = running.pop(future)
+                    try:
+                        statuses[task_id] = future.result()
+                    except Exception as err:
+                        failure_messages.append(f"- {task_id}\n  {err}")
+                        continue
+                    for dependent_id in dependents[task_id]:
+                        pending_dependencies[dependent_id].discard(task_id)
+                        if not pending_dependencies[dependent_id]:
+                            submit(dependent_id)
+
+        if failure_messages:
+            blocked_tasks = [task["id"] for task in tasks
+                             if task["id"] not in statuses and pending_dependencies[task["id"]]]
+            raise RuntimeError(PIPELINE_FAILURE_TEMPLATE.format(len(failure_messages),
+                                                                len(tasks),
+                                                                "\n".join(failure_messages),
+                                                                blocked_tasks))
+
+        return {task["id"]: statuses[task["id"]] for task in tasks}
+
+    finally:
+        os.chdir(original_dir)
+
+#--------------------------#
+# Parameters and constants #
+#--------------------------#
+
+# Modules searched for pipeline step functions, in order #
+PIPELINE_FUNCTION_MODULES = ["cdo_tools", "nco_tools"]
+
+# Lock shared by the tasks reading netCDF files in Python #
+_in_process_lock = threading.Lock()
+
+# Pipeline specification #
+STEP_REQUIRED_KEYS = ["name", "function", "outputs"]
+STEP_REFERENCE_PREFIX = "@"
+DEFAULT_STATE_FILE_NAME = ".pipeline_state.json"
+
+# Placeholders in file specifications and arguments #
+PLACEHOLDER_PATTERN = re.compile(r"\{(\w+)\}")
+
+# Template strings #
+#------------------#
+
+# Error messages #
+PIPELINE_FAILURE_TEMPLATE = \
+"""{} out of {} pipeline tasks failed:
+{}
+Tasks not run because of these failures: {}"""
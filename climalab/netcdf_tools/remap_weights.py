@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import json
+import os
+from pathlib import Path
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from climalab.netcdf_tools.command_plan import is_planning
+from climalab.netcdf_tools.command_runner import run_command, run_command_batch
+from climalab.netcdf_tools.result_cache import file_fingerprint, fingerprint_digest
+from pygenutils.operative_systems.os_operations import exit_info
+
+#-------------------------#
+# Define custom functions #
+#-------------------------#
+
+def get_grid_signature(nc_file: str, encoding: str = "utf-8") -> str:
+    """
+    Compute a signature of the horizontal grid of a file from CDO's grid description.
+
+    Two files share a signature if and only if `cdo griddes` describes
+    their grids identically, which is what determines whether they can
+    share interpolation weights.
+
+    Parameters
+    ----------
+    nc_file : str
+        Path to the netCDF (or any CDO-readable) file.
+    encoding : str, optional
+        Encoding to use when decoding command output. Default is "utf-8".
+
+    Returns
+    -------
+    str
+        Hexadecimal digest of the grid description.
+
+    Raises
+    ------
+    RuntimeError
+        If `cdo griddes` fails.
+    """
+    process_exit_info = run_command(["cdo", "-s", "griddes", nc_file],
+                                    capture_output=True,
+                                    encoding=encoding,
+                                    read_only=True)
+
+    exit_info(process_exit_info,
+        check_stdout=False,
+        check_stderr=True,
+        check_return_code=True
+    )
+    return fingerprint_digest(process_exit_info["stdout"])
+
+
+class RemapWeightsStore:
+    """
+    Persistent store of CDO interpolation weights, reused across files and runs.
+
+    Weights are generated once per (source grid signature, target grid,
+    method) with the matching CDO `gen*` operator and saved in `store_dir`.
+    A registry file records the generated weights and the grid signature of
+    every file seen so far (keyed by the file's fingerprint), so later runs
+    over unchanged files skip both `cdo griddes` and weight generation.
+
+    Parameters
+    ----------
+    store_dir : str | Path
+        Directory holding the weights files and the registry.
+        It is created if it does not exist.
+
+    Examples
+    --------
+    >>> store = RemapWeightsStore('/scratch/remap_weights')
+    >>> cdo_remap(file_list, 'grid_0.11.txt', 'tas', 'daily', 'CORDEX', 'historical',
+    ...           'remapped', '1981-2010', 'europe', 'nc',
+    ...           remap_proc='conservative1', weights_store=store)
+    """
+
+    def __init__(self, store_dir: str | Path) -> None:
+        self.store_dir = Path(store_dir)
+        self.store_dir.mkdir(parents=True, exist_ok=True)
+        self._registry_file = self.store_dir / REGISTRY_FILE_NAME
+        self._registry = self._read_registry()
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(store_dir={str(self.store_dir)!r})"
+
+    def _read_registry(self) -> dict:
+        if not self._registry_file.exists():
+            return dict(grid_signatures={}, weights={})
+        with open(self._registry_file, encoding="utf-8") as registry_obj:
+            return json.load(registry_obj)
+
+    def _write_registry(self) -> None:
+        temp_registry_file = self._registry_file.with_suffix(".tmp")
+        with open(temp_registry_file, "w", encoding="utf-8") as registry_obj:
+            json.dump(self._registry, registry_obj, indent=1)
+        os.replace(temp_registry_file, self._registry_file)
+
+    @staticmethod
+    def _target_grid_key(remap_str: str) -> str:
+        # A grid description file is identified by its contents, not its name
+        if os.path.isfile(remap_str):
+            return file_fingerprint(remap_str, use_hash=True)["sha256"]
+        return remap_str
+
+    def grid_signature(self, nc_file: str) -> str:
+        """
+        Return the grid signature of a file, computing it only if the file changed.
+
+        Parameters
+        ----------
+        nc_file : str
+            Path to the input file.
+
+        Returns
+        -------
+        str
+            Grid signature, as returned by `get_grid_signature`.
+        """
+        file_key = fingerprint_digest(file_fingerprint(nc_file))
+        signatures = self._registry["grid_signatures"]
+        if file_key not in signatures:
+            signatures[file_key] = get_grid_signature(nc_file)
+            self._write_registry()
+        return signatures[file_key]
+
+    def get_weights(
+            self,
+            file_list: list[str],
+            remap_str: str,
+            gen_operator: str,
+            capture_output: bool = False,
+            return_output_name: bool = False,
+            encoding: str = "utf-8",
+            shell: bool = True,
+            max_workers: int | None = None) -> list[str]:
+        """
+        Return the weights file for each input file, generating missing weights.
+
+        Weights are generated once per distinct source grid among `file_list`
+        that has no registered weights for this target grid and method.
+
+        Parameters
+        ----------
+        file_list : list[str]
+            Input files to be remapped.
+        remap_str : str
+            Target grid specification or grid description file path.
+        gen_operator : str
+            CDO weight generation operator (e.g., 'genbil', 'gencon').
+        capture_output : bool, optional
+            Whether to capture the command output. Default is False.
+        return_output_name : bool, optional
+            Kept for backwards compatibility; it has no effect. Default is False.
+        encoding : str, optional
+            Encoding to use when decoding command output. Default is "utf-8".
+        shell : bool, optional
+            Kept for backwards compatibility; commands never run through a shell.
+            Default is True.
+        max_workers : int | None, optional
+            Maximum number of weight files generated concurrently. Default is None.
+
+        Returns
+        -------
+        list[str]
+            Path of the weights file to use for each file in `file_list`.
+        """
+        target_key = self._target_grid_key(remap_str)
+        weights_registry = self._registry["weights"]
+
+        weights_file_list = []
+        pending_weights = {}
+        for file in file_list:
+            weights_key = fingerprint_digest(self.grid_signature(file), target_key, gen_operator)
+            weights_file = str(self.store_dir / f"{gen_operator}_{weights_key[:20]}.nc")
+            weights_file_list.append(weights_file)
+
+            if (weights_key not in weights_registry or not os.path.exists(weights_file)) \
+                and weights_key not in pending_weights:
+                pending_weights[weights_key] = (file, weights_file)
+
+        if pending_weights:
+            cmd_list = [["cdo", f"{gen_operator},{remap_str}", file, weights_file]
+                        for file, weights_file in pending_weights.values()]
+            run_command_batch(
+                cmd_list,
+                max_workers=max_workers,
+                capture_output=capture_output,
+                return_output_name=return_output_name,
+                encoding=encoding,
+                shell=shell
+            )
+            if is_planning():
+                return weights_file_list
+            for weights_key, (file, weights_file) in pending_weights.items():
+                weights_registry[weights_key] = dict(
+                    weights_file=weights_file,
+                    target_grid=remap_str,
+                    gen_operator=gen_operator,
+                    source_file=str(Path(file).resolve())
+                )
+            self._write_registry()
+
+        return weights_file_list
+
+#--------------------------#
+# Parameters and constants #
+#--------------------------#
+
+# Registry file name #
+REGISTRY_FILE_NAME = "weights_registry.json"
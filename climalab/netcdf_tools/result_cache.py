@@ -0,0 +1,323 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import time
+from pathlib import Path
+
+#-------------------------#
+# Define custom functions #
+#-------------------------#
+
+# File fingerprints #
+#-------------------#
+
+def file_fingerprint(file: str | Path, use_hash: bool = False) -> dict:
+    """
+    Describe a file's identity by its absolute path, size and modification time.
+
+    Parameters
+    ----------
+    file : str | Path
+        Path to the file.
+    use_hash : bool, optional
+        Whether to also compute the SHA-256 digest of the file contents.
+        This detects changes that preserve size and modification time,
+        at the cost of reading the whole file. Default is False.
+
+    Returns
+    -------
+    dict
+        Dictionary with keys 'path', 'size', 'mtime_ns' and, if `use_hash`
+        is True, 'sha256'.
+
+    Raises
+    ------
+    FileNotFoundError
+        If the file does not exist.
+
+    Examples
+    --------
+    >>> file_fingerprint('tas_day_ERA5.nc')
+    {'path': '/data/tas_day_ERA5.nc', 'size': 104857600, 'mtime_ns': 1760000000000000000}
+    """
+    file_path = Path(file).resolve()
+    stat_result = file_path.stat()
+    fingerprint = {
+        "path": str(file_path),
+        "size": stat_result.st_size,
+        "mtime_ns": stat_result.st_mtime_ns
+    }
+
+    if use_hash:
+        sha256 = hashlib.sha256()
+        with open(file_path, "rb") as file_obj:
+            for block in iter(lambda: file_obj.read(HASH_BLOCK_SIZE), b""):
+                sha256.update(block)
+        fingerprint["sha256"] = sha256.hexdigest()
+
+    return fingerprint
+
+
+def fingerprint_digest(*key_parts: object) -> str:
+    """
+    Return a stable SHA-256 hex digest of JSON-serialisable key parts.
+
+    Parameters
+    ----------
+    *key_parts : object
+        Operator strings, fingerprints or any other JSON-serialisable objects.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest.
+    """
+    key_str = json.dumps(key_parts, sort_keys=True, default=str)
+    return hashlib.sha256(key_str.encode("utf-8")).hexdigest()
+
+
+# Result cache #
+#--------------#
+
+class ResultCache:
+    """
+    Opt-in on-disk cache of CDO/NCO output files, addressed by their inputs.
+
+    Each entry is keyed on the operator string and the fingerprints
+    (size, modification time and, optionally, content hash) of the input
+    files, so a product is only recomputed when the operation or any of its
+    inputs changes. Cached files are materialised at the requested output
+    path by hard link or copy. When the total size of the cache exceeds
+    `max_bytes`, the least recently used entries are evicted.
+
+    Parameters
+    ----------
+    cache_dir : str | Path
+        Directory where cached files and the cache index are stored.
+        It is created if it does not exist.
+    max_bytes : int | None, optional
+        Byte budget of the cache. If None, entries are never evicted.
+        Default is None.
+    use_hash : bool, optional
+        Whether input fingerprints include a SHA-256 of the file contents.
+        Default is False.
+    link_mode : {'copy', 'hardlink'}, optional
+        How cached files are materialised. 'hardlink' avoids any data copy
+        but shares the inode with the cache entry, so in-place edits of the
+        output (e.g. through `nco_tools`) would also alter the cached entry.
+        If hard linking fails (e.g. across file systems), a copy is made.
+        Default is 'copy'.
+
+    Examples
+    --------
+    >>> cache = ResultCache('/scratch/climalab_cache', max_bytes=200 * 1024**3)
+    >>> cdo_periodic_statistics('tas_day_ERA5.nc', 'mean', True, 'monthly', cache=cache)
+    """
+
+    def __init__(
+            self,
+            cache_dir: str | Path,
+            max_bytes: int | None = None,
+            use_hash: bool = False,
+            link_mode: str = "copy") -> None:
+        if link_mode not in LINK_MODE_OPTS:
+            raise ValueError(f"Unsupported link mode '{link_mode}'. Options are {LINK_MODE_OPTS}")
+        if max_bytes is not None and max_bytes < 0:
+            raise ValueError("'max_bytes' must be a non-negative integer or None.")
+
+        self.cache_dir = Path(cache_dir)
+        self.max_bytes = max_bytes
+        self.use_hash = use_hash
+        self.link_mode = link_mode
+
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self._index_file = self.cache_dir / INDEX_FILE_NAME
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}(cache_dir={str(self.cache_dir)!r}, "
+                f"max_bytes={self.max_bytes!r}, use_hash={self.use_hash!r}, "
+                f"link_mode={self.link_mode!r})")
+
+    # Index handling #
+    #~~~~~~~~~~~~~~~~#
+
+    def _read_index(self) -> dict:
+        if not self._index_file.exists():
+            return {}
+        with open(self._index_file, encoding="utf-8") as index_obj:
+            return json.load(index_obj)
+
+    def _write_index(self, index: dict) -> None:
+        temp_index_file = self._index_file.with_suffix(".tmp")
+        with open(temp_index_file, "w", encoding="utf-8") as index_obj:
+            json.dump(index, index_obj, indent=1)
+        os.replace(temp_index_file, self._index_file)
+
+    def _materialise(self, source: Path, target: Path) -> None:
+        target = Path(target)
+        if target.exists() or target.is_symlink():
+            target.unlink()
+        if self.link_mode == "hardlink":
+            try:
+                os.link(source, target)
+                return
+            except OSError:
+                pass
+        shutil.copy2(source, target)
+
+    # Public interface #
+    #~~~~~~~~~~~~~~~~~~#
+
+    def make_key(self, operator_str: str, input_files: list[str]) -> str:
+        """
+        Compute the cache key of an operation.
+
+        Parameters
+        ----------
+        operator_str : str
+            The operator chain applied to the inputs, without file names.
+        input_files : list[str]
+            Input files, in the order they are passed to the operator.
+
+        Returns
+        -------
+        str
+            Hexadecimal key.
+        """
+        fingerprints = [file_fingerprint(f, use_hash=self.use_hash) for f in input_files]
+        return fingerprint_digest(operator_str, fingerprints)
+
+    def fetch(self, key: str, output_file: str | Path) -> bool:
+        """
+        Materialise a cached result at `output_file`, if present.
+
+        Parameters
+        ----------
+        key : str
+            Cache key, as returned by `make_key`.
+        output_file : str | Path
+            Path where the cached result is to be placed.
+
+        Returns
+        -------
+        bool
+            True on a cache hit, False otherwise.
+        """
+        with self._lock:
+            index = self._read_index()
+            entry = index.get(key)
+            if entry is None:
+                return False
+
+            cached_file = self.cache_dir / entry["file"]
+            if not cached_file.exists():
+                del index[key]
+                self._write_index(index)
+                return False
+
+            self._materialise(cached_file, output_file)
+            entry["last_access"] = time.time()
+            self._write_index(index)
+            return True
+
+    def store(self, key: str, output_file: str | Path) -> None:
+        """
+        Add a freshly computed output file to the cache and enforce the byte budget.
+
+        Parameters
+        ----------
+        key : str
+            Cache key, as returned by `make_key`.
+        output_file : str | Path
+            Path of the computed output file.
+        """
+        output_file = Path(output_file)
+        size = output_file.stat().st_size
+        if self.max_bytes is not None and size > self.max_bytes:
+            return
+
+        cached_file_name = f"{key}{output_file.suffix}"
+        with self._lock:
+            cached_file = self.cache_dir / cached_file_name
+            if cached_file.exists():
+                cached_file.unlink()
+            if self.link_mode == "hardlink":
+                try:
+                    os.link(output_file, cached_file)
+                except OSError:
+                    shutil.copy2(output_file, cached_file)
+            else:
+                shutil.copy2(output_file, cached_file)
+
+            index = self._read_index()
+            index[key] = dict(file=cached_file_name, size=size, last_access=time.time())
+            self._evict(index)
+            self._write_index(index)
+
+    def _evict(self, index: dict) -> None:
+        if self.max_bytes is None:
+            return
+        total_size = sum(entry["size"] for entry in index.values())
+        lru_keys = sorted(index, key=lambda k: index[k]["last_access"])
+        for key in lru_keys:
+            if total_size <= self.max_bytes:
+                break
+            entry = index.pop(key)
+            (self.cache_dir / entry["file"]).unlink(missing_ok=True)
+            total_size -= entry["size"]
+
+    def evict(self) -> None:
+        """
+        Evict least recently used entries until the cache fits in `max_bytes`.
+        """
+        with self._lock:
+            index = self._read_index()
+            self._evict(index)
+            self._write_index(index)
+
+    def clear(self) -> None:
+        """
+        Remove every cached entry.
+        """
+        with self._lock:
+            for entry in self._read_index().values():
+                (self.cache_dir / entry["file"]).unlink(missing_ok=True)
+            self._write_index({})
+
+    def total_size(self) -> int:
+        """
+        Return the total size in bytes of the cached entries.
+
+        Returns
+        -------
+        int
+            Total size in bytes.
+        """
+        with self._lock:
+            return sum(entry["size"] for entry in self._read_index().values())
+
+#--------------------------#
+# Parameters and constants #
+#--------------------------#
+
+# Cache index file name #
+INDEX_FILE_NAME = "cache_index.json"
+
+# Block size for content hashing, in bytes #
+HASH_BLOCK_SIZE = 16 * 1024 * 1024
+
+# Supported options #
+#-------------------#
+
+# Ways of materialising cached files #
+LINK_MODE_OPTS = ["copy", "hardlink"]
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import numpy as np
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from climalab.netcdf_tools.command_telemetry import CDO_VALUE_OPTIONS
+
+#-------------------------#
+# Define custom functions #
+#-------------------------#
+
+# Internal Helper Functions #
+#---------------------------#
+
+def _first_operator_index(argv: list[str]) -> int:
+    """
+    Return the index of the first (outermost) operator of a CDO command.
+    """
+    idx = 1
+    while idx < len(argv):
+        arg = argv[idx]
+        if arg in CDO_VALUE_OPTIONS:
+            idx += 2
+        elif arg.startswith("--") or (arg.startswith("-") and len(arg) == 2):
+            idx += 1
+        else:
+            return idx
+    raise ValueError(f"No CDO operator found in {argv}.")
+
+
+def _option_index(argv: list[str], option: str) -> int | None:
+    """
+    Return the index of an option among the options of a CDO command, if present.
+    """
+    first_operator_idx = _first_operator_index(argv)
+    return argv.index(option) if option in argv[1:first_operator_idx] else None
+
+
+# Storage policies #
+#------------------#
+
+class StoragePolicy:
+    """
+    How netCDF outputs are stored: precision, compression, chunking and bit-rounding.
+
+    A policy is accepted by every writer in `cdo_tools` (through the
+    `storage_policy` argument) and by the in-process engines, and is
+    translated into the CDO options `-b`, `-f`, `-z`, `--shuffle`,
+    `--chunkspec` and `--nsb`, or into netCDF4/xarray encodings.
+    Writers given no policy keep their former behaviour.
+
+    Parameters
+    ----------
+    precision : str | None, optional
+        Data type of the (floating-point) data variables, one of
+        `PRECISION_OPTS`: 'F32', 'F64', or 'packed_int16' (16-bit integers
+        with `scale_factor` and `add_offset`, as written by CDO's `pack`
+        operator). If None, the input data type is kept. Default is None.
+    compression : str | None, optional
+        netCDF4 compression filter, one of `COMPRESSION_OPTS` ('deflate' or
+        'zstd'), or None for no compression. Default is None.
+    level : int | None, optional
+        Compression level (1-9 for deflate, 1-19 for zstd). If None,
+        `DEFAULT_COMPRESSION_LEVELS`. Default is None.
+    shuffle : bool, optional
+        Whether to apply the byte shuffle filter before compression, which
+        usually improves the compression of floating-point data.
+        Default is False.
+    chunk_shape : dict[str, int] | None, optional
+        Chunk size per axis, with CDO's axis names 't', 'z', 'y' and 'x',
+        e.g. {'t': 1, 'y': 180, 'x': 360}. Axes not given are not chunked
+        (one chunk spans the whole axis). If None, the library defaults
+        are used. Default is None.
+    significant_bits : int | None, optional
+        If given, floating-point values are bit-rounded to this number of
+        significant mantissa bits, which makes them much more compressible.
+        Default is None.
+    file_format : str, optional
+        CDO output format, 'nc4' or 'nc4c' (netCDF4 classic model).
+        Default is 'nc4'.
+
+    Raises
+    ------
+    ValueError
+        If an option is not supported.
+
+    Examples
+    --------
+    >>> policy = StoragePolicy('F32', compression='zstd', level=5, shuffle=True,
+    ...                        chunk_shape={'t': 1}, significant_bits=12)
+    >>> policy.cdo_options()
+    ['-b', 'F32', '-f', 'nc4', '-z', 'zstd_5', '--shuffle', '--chunkspec', 't=1', '--nsb', '12']
+    """
+
+    def __init__(self,
+                 precision: str | None = None,
+                 compression: str | None = None,
+                 level: int | None = None,
+                 shuffle: bool = False,
+                 chunk_shape: dict[str, int] | None = None,
+                 significant_bits: int | None = None,
+                 file_format: str = "nc4") -> None:
+        if precision is not None and precision not in PRECISION_OPTS:
+            raise ValueError(f"Unsupported precision '{precision}'. Options are {PRECISION_OPTS}")
+        if compression is not None and compression not in COMPRESSION_OPTS:
+            raise ValueError(f"Unsupported compression '{compression}'. Options are {COMPRESSION_OPTS}")
+        if file_format not in FILE_FORMAT_OPTS:
+            raise ValueError(f"Unsupported file format '{file_format}'. Options are {FILE_FORMAT_OPTS}")
+        if chunk_shape is not None and not set(chunk_shape).issubset(CHUNK_AXES):
+            raise ValueError(f"Unsupported chunk axes {sorted(set(chunk_shape) - set(CHUNK_AXES))}. "
+                             f"Options are {CHUNK_AXES}")
+        if compression is not None:
+            if level is None:
+                level = DEFAULT_COMPRESSION_LEVELS[compression]
+            min_level, max_level = COMPRESSION_LEVEL_RANGES[compression]
+            if not min_level <= level <= max_level:
+                raise ValueError(f"'{compression}' compression level must be between "
+                                 f"{min_level} and {max_level}, got {level}.")
+
+        self.precision = precision
+        self.compression = compression
+        self.level = level
+        self.shuffle = shuffle
+        self.chunk_shape = chunk_shape
+        self.significant_bits = significant_bits
+        self.file_format = file_format
+
+    def __repr__(self) -> str:
+        return (f"{type(self).__name__}(precision={self.precision!r}, "
+                f"compression={self.compression!r}, level={self.level!r}, "
+                f"shuffle={self.shuffle!r}, chunk_shape={self.chunk_shape!r}, "
+                f"significant_bits={self.significant_bits!r}, file_format={self.file_format!r})")
+
+    # CDO commands #
+    #~~~~~~~~~~~~~~#
+
+    def cdo_options(self) -> list[str]:
+        """
+        Return the CDO options implementing the policy.
+
+        Returns
+        -------
+        list[str]
+            Options to place right after the `cdo` program name.
+        """
+        options = []
+        if self.precision is not None:
+            options += ["-b", CDO_PRECISION_DICT[self.precision]]
+        options += ["-f", self.file_format]
+        if self.compression is not None:
+            options += ["-z", f"{CDO_COMPRESSION_DICT[self.compression]}_{self.level}"]
+        if self.shuffle:
+            options.append("--shuffle")
+        if self.chunk_shape:
+            options += ["--chunkspec", ",".join(f"{axis}={size}" for axis, size in self.chunk_shape.items())]
+        if self.significant_bits is not None:
+            options += ["--nsb", str(self.significant_bits)]
+        return options
+
+    def apply_to_cdo_command(self, argv: list[str]) -> list[str]:
+        """
+        Apply the policy to a CDO command.
+
+        Options of the policy replace those given in the command (e.g. a
+        hard-coded `-b F64`); for 'packed_int16', the `pack` operator is
+        added as the outermost operator.
+
+        Parameters
+        ----------
+        argv : list[str]
+            Argument vector of a CDO command.
+
+        Returns
+        -------
+        list[str]
+            The argument vector with the policy applied.
+        """
+        argv = list(argv)
+        policy_options = self.cdo_options()
+        for option in POLICY_CDO_OPTIONS:
+            option_idx = _option_index(argv, option)
+            if option_idx is not None:
+                del argv[option_idx:option_idx + (2 if option in CDO_VALUE_OPTIONS else 1)]
+
+        if self.precision == PRECISION_OPTS[2]:
+            first_operator_idx = _first_operator_index(argv)
+            argv[first_operator_idx] = f"-{argv[first_operator_idx].lstrip('-')}"
+            argv.insert(first_operator_idx, CDO_PACK_OPERATOR)
+        return [argv[0], *policy_options, *argv[1:]]
+
+    # In-process writers #
+    #~~~~~~~~~~~~~~~~~~~~#
+
+    def variable_encoding(self,
+                          dims: tuple[str, ...],
+                          shape: tuple[int, ...],
+                          time_dim: str | None = "time",
+                          values: np.ndarray | None = None) -> dict:
+        """
+        Return the xarray encoding implementing the policy for a floating-point variable.
+
+        The keys are those of xarray's netCDF4 backend ('dtype',
+        'compression', 'complevel', 'shuffle', 'chunksizes',
+        'significant_digits', 'quantize_mode', 'scale_factor',
+        'add_offset', '_FillValue').
+
+        Parameters
+        ----------
+        dims : tuple[str, ...]
+            Dimension names of the variable.
+        shape : tuple[int, ...]
+            Shape of the variable.
+        time_dim : str | None, optional
+            Name of the time dimension, mapped to the 't' chunk axis. The
+            last two other dimensions are mapped to 'y' and 'x', and any
+            other one to 'z'. Default is 'time'.
+        values : numpy.ndarray | None, optional
+            Values of the variable, required to compute the packing
+            parameters of 'packed_int16'. Default is None.
+
+        Returns
+        -------
+        dict
+            Variable encoding.
+
+        Raises
+        ------
+        ValueError
+            If 'packed_int16' is requested without `values`.
+        """
+        encoding = {}
+        if self.precision in PRECISION_OPTS[:2]:
+            encoding["dtype"] = NUMPY_PRECISION_DICT[self.precision]
+        elif self.precision == PRECISION_OPTS[2]:
+            if values is None:
+                raise ValueError("The values of the variable are needed to pack it.")
+            encoding.update(packing_parameters(values))
+
+        if self.compression is not None:
+            encoding.update(compression=NETCDF4_COMPRESSION_DICT[self.compression], complevel=self.level)
+        encoding["shuffle"] = self.shuffle
+        if self.chunk_shape:
+            spatial_dims = [dim for dim in dims if dim != time_dim]
+            chunk_sizes = []
+            for dim, size in zip(dims, shape):
+                if dim == time_dim:
+                    axis = "t"
+                elif dim in spatial_dims[-2:]:
+                    axis = "xy"[spatial_dims[::-1].index(dim)]
+                else:
+                    axis = "z"
+                chunk_sizes.append(max(1, min(self.chunk_shape.get(axis, size), size)))
+            encoding["chunksizes"] = tuple(chunk_sizes)
+        if self.significant_bits is not None and self.precision != PRECISION_OPTS[2]:
+            encoding.update(significant_digits=self.significant_bits, quantize_mode="BitRound")
+        return encoding
+
+
+# Packing #
+#---------#
+
+def packing_parameters(values: np.ndarray) -> dict:
+    """
+    Compute the 16-bit integer packing of a floating-point array.
+
+    The valid range of the data is mapped onto [-32766, 32767], and
+    -32767 is reserved as the fill value, as done by CDO's `pack` operator.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        Data to pack, with NaN (or masked) for missing values.
+
+    Returns
+    -------
+    dict
+        Encoding with keys 'dtype', 'scale_factor', 'add_offset' and '_FillValue'.
+    """
+    values = np.ma.filled(np.ma.asarray(values, dtype="d"), np.nan)
+    if np.all(np.isnan(values)):
+        min_value = max_value = 0.0
+    else:
+        min_value, max_value = float(np.nanmin(values)), float(np.nanmax(values))
+
+    n_levels = PACKED_INT16_VALID_MAX - PACKED_INT16_VALID_MIN
+    scale_factor = (max_value - min_value) / n_levels if max_value > min_value else 1.0
+    add_offset = min_value - PACKED_INT16_VALID_MIN * scale_factor
+    return {"dtype": "int16",
+            "scale_factor": scale_factor,
+            "add_offset": add_offset,
+            "_FillValue": PACKED_INT16_FILL_VALUE}
+
+#--------------------------#
+# Parameters and constants #
+#--------------------------#
+
+# Options #
+PRECISION_OPTS = ["F32", "F64", "packed_int16"]
+COMPRESSION_OPTS = ["deflate", "zstd"]
+FILE_FORMAT_OPTS = ["nc4", "nc4c"]
+CHUNK_AXES = ["t", "z", "y", "x"]
+
+# Compression levels #
+DEFAULT_COMPRESSION_LEVELS = {"deflate": 4, "zstd": 3}
+COMPRESSION_LEVEL_RANGES = {"deflate": (1, 9), "zstd": (1, 19)}
+
+# Switch dictionaries #
+#---------------------#
+
+CDO_PRECISION_DICT = {"F32": "F32", "F64": "F64", "packed_int16": "I16"}
+CDO_COMPRESSION_DICT = {"deflate": "zip", "zstd": "zstd"}
+NUMPY_PRECISION_DICT = {"F32": "float32", "F64": "float64"}
+NETCDF4_COMPRESSION_DICT = {"deflate": "zlib", "zstd": "zstd"}
+
+# CDO options set by a policy, and its packing operator #
+POLICY_CDO_OPTIONS = ["-b", "-f", "-z", "--shuffle", "--chunkspec", "--nsb"]
+CDO_PACK_OPERATOR = "pack"
+
+# Packed 16-bit integers #
+PACKED_INT16_VALID_MIN = -32766
+PACKED_INT16_VALID_MAX = 32767
+PACKED_INT16_FILL_VALUE = -32767
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import cftime
+import netCDF4
+import numpy as np
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from climalab.netcdf_tools.command_runner import in_process_netcdf
+from climalab.netcdf_tools.storage_policy import StoragePolicy
+from climalab.netcdf_tools.time_coverage import find_time_variable
+
+#-------------------------#
+# Define custom functions #
+#-------------------------#
+
+# Running accumulators #
+#----------------------#
+
+class RunningStatistics:
+    """
+    Per-grid-cell running statistics, updated one time slice at a time.
+
+    The mean and variance are accumulated with Welford's algorithm, which
+    is numerically stable in a single pass, together with the minimum,
+    maximum and sum. Missing values (NaN) are skipped cell by cell, except
+    for 'avg', which is missing wherever any time step was, as in CDO.
+    Memory use is that of a few arrays shaped like one time slice.
+
+    Parameters
+    ----------
+    shape : tuple[int, ...]
+        Shape of a single time slice.
+
+    Examples
+    --------
+    >>> stats = RunningStatistics((180, 360))
+    >>> for time_slice in slices:
+    ...     stats.update(time_slice)
+    >>> stats.result('std1')
+    """
+
+    def __init__(self, shape: tuple[int, ...]) -> None:
+        self.shape = tuple(shape)
+        self.count = np.zeros(self.shape, dtype="i8")
+        self.mean = np.zeros(self.shape, dtype="d")
+        self.m2 = np.zeros(self.shape, dtype="d")
+        self.sum = np.zeros(self.shape, dtype="d")
+        self.min = np.full(self.shape, np.inf, dtype="d")
+        self.max = np.full(self.shape, -np.inf, dtype="d")
+        self.any_missing = np.zeros(self.shape, dtype=bool)
+        self.n_slices = 0
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}(shape={self.shape!r}, n_slices={self.n_slices})"
+
+    def update(self, time_slice: np.ndarray) -> None:
+        """
+        Add one time slice to the accumulators.
+
+        Parameters
+        ----------
+        time_slice : numpy.ndarray
+            Values of one time step, with missing values as NaN (or masked).
+
+        Raises
+        ------
+        ValueError
+            If the slice shape does not match the accumulator shape.
+        """
+        values = np.ma.filled(np.ma.asarray(time_slice, dtype="d"), np.nan)
+        if values.shape != self.shape:
+            raise ValueError(f"Time slice shape {values.shape} does not match {self.shape}.")
+
+        valid = ~np.isnan(values)
+        self.any_missing |= ~valid
+        self.count += valid
+        self.n_slices += 1
+
+        delta = np.where(valid, values - self.mean, 0.0)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            self.mean += np.where(valid, delta / self.count, 0.0)
+        self.m2 += np.where(valid, delta * (values - self.mean), 0.0)
+
+        self.sum += np.where(valid, values, 0.0)
+        np.fmin(self.min, values, out=self.min)
+        np.fmax(self.max, values, out=self.max)
+
+    def result(self, statistic: str) -> np.ndarray:
+        """
+        Return the accumulated statistic, with NaN where it is undefined.
+
+        Parameters
+        ----------
+        statistic : str
+            One of `STREAMING_STATISTICS`.
+
+        Returns
+        -------
+        numpy.ndarray
+            Statistic per grid cell, as float64.
+
+        Raises
+        ------
+        ValueError
+            If the statistic is not supported.
+        """
+        if statistic not in STREAMING_STATISTICS:
+            raise ValueError(f"Unsupported statistic {statistic}. Options are {STREAMING_STATISTICS}")
+
+        no_data = self.count == 0
+        with np.errstate(invalid="ignore", divide="ignore"):
+            if statistic == "mean":
+                result = self.mean.copy()
+            elif statistic == "avg":
+                result = np.where(self.any_missing, np.nan, self.mean)
+            elif statistic in ("var", "std"):
+                result = self.m2 / self.count
+            elif statistic in ("var1", "std1"):
+                result = np.where(self.count > 1, self.m2 / (self.count - 1), np.nan)
+            elif statistic == "sum":
+                result = self.sum.copy()
+            elif statistic == "min":
+                result = self.min.copy()
+            else:
+                result = self.max.copy()
+
+        if statistic.startswith("std"):
+            result = np.sqrt(result)
+        result[no_data] = np.nan
+        return result
+
+
+# Internal Helper Functions #
+#---------------------------#
+
+def _time_dependent_variables(dataset: netCDF4.Dataset, time_var: str) -> list[str]:
+    """
+    List the data variables that have the time dimension, excluding time bounds.
+    """
+    time_dim = dataset.variables[time_var].dimensions[0]
+    bounds_var = getattr(dataset.variables[time_var], "bounds", None)
+    return [var_name for var_name, variable in dataset.variables.items()
+            if time_dim in variable.dimensions and var_name not in (time_var, bounds_var)]
+
+
+def _iter_time_slices(variable: netCDF4.Variable, time_dim: str):
+    """
+    Yield the time slices of a variable one at a time, as float64 with NaN for missing values.
+    """
+    time_axis = variable.dimensions.index(time_dim)
+    for time_idx in range(variable.shape[time_axis]):
+        index = [slice(None)] * variable.ndim
+        index[time_axis] = time_idx
+        yield np.ma.filled(np.ma.asarray(variable[tuple(index)], dtype="d"), np.nan)
+
+
+def _copy_variable(src_dataset: netCDF4.Dataset,
+                   dst_dataset: netCDF4.Dataset,
+                   var_name: str,
+                   values: np.ndarray | None = None,
+                   storage_policy: StoragePolicy | None = None,
+                   time_dim: str | None = None) -> None:
+    """
+    Create a variable in `dst_dataset` like the one in `src_dataset`, then write its values.
+
+    If a storage policy is given, it replaces the data type and filters of
+    floating-point variables.
+    """
+    src_var = src_dataset.variables[var_name]
+    fill_value = getattr(src_var, "_FillValue", None)
+    filters = src_var.filters() or {}
+    var_kwargs = dict(
+        zlib=bool(filters.get("zlib", False)),
+        complevel=filters.get("complevel", 4) or 4,
+        shuffle=bool(filters.get("shuffle", False)),
+        fill_value=fill_value
+    )
+    datatype = src_var.datatype
+    skipped_attrs = ["_FillValue"]
+    packing_attrs = {}
+
+    if storage_policy is not None and np.dtype(datatype).kind == "f":
+        shape = np.shape(values) if values is not None else src_var.shape
+        encoding = storage_policy.variable_encoding(src_var.dimensions, shape, time_dim=time_dim,
+                                                    values=src_var[:] if values is None else values)
+        datatype = encoding.pop("dtype", datatype)
+        var_kwargs["fill_value"] = encoding.pop("_FillValue", fill_value)
+        packing_attrs = {attr: encoding.pop(attr) for attr in ("scale_factor", "add_offset") if attr in encoding}
+        if "compression" in encoding:
+            del var_kwargs["zlib"]
+        var_kwargs.update(encoding)
+        skipped_attrs += ["scale_factor", "add_offset"]
+
+    dst_var = dst_dataset.createVariable(var_name, datatype, src_var.dimensions, **var_kwargs)
+    dst_var.setncatts({attr: src_var.getncattr(attr) for attr in src_var.ncattrs()
+                       if attr not in skipped_attrs})
+    dst_var.setncatts(packing_attrs)
+    dst_var[:] = src_var[:] if values is None else values
+
+
+# Main functions #
+#----------------#
+
+@in_process_netcdf
+def stream_time_statistic(
+        file_list: str | list[str],
+        output_file: str,
+        calc_proc: str,
+        storage_policy: StoragePolicy | None = None) -> None:
+    """
+    Compute a CDO-equivalent whole-period statistic over several files in one pass.
+
+    The files are read in the given order, one time slice at a time, and
+    each time-dependent variable is reduced with `RunningStatistics`. No
+    merged intermediate file is written and memory scales with a single
+    time slice, whatever the length of the record. The output has the
+    layout of the `tim<statistic>` CDO product: one time step stamped with
+    the last input time (time bounds, if any, spanning the whole record),
+    data variables keeping their input data type, and non time-dependent
+    variables copied from the first file.
+
+    Parameters
+    ----------
+    file_list : str | list[str]
+        Input netCDF files, sorted in time order and sharing the same grid
+        and variables.
+    output_file : str
+        Path to the output netCDF file.
+    calc_proc : str
+        CDO operator name, e.g. 'timmean', 'timstd1' or 'timmax'.
+    storage_policy : StoragePolicy | None, optional
+        Precision, compression and chunking of the output data variables.
+        If None, those of the first file are kept. Default is None.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ValueError
+        If the operator is not supported, if no file has time-dependent
+        variables, or if the files do not share the same variables and grid.
+
+    Examples
+    --------
+    >>> stream_time_statistic(sorted(glob('tas_day_*_19*.nc')), 'tas_timstd.nc', 'timstd')
+    """
+    if not isinstance(file_list, list):
+        file_list = [file_list]
+    if not file_list:
+        raise ValueError("No input files given.")
+
+    calc_proc = calc_proc.lstrip("-")
+    statistic = calc_proc[len("tim"):] if calc_proc.startswith("tim") else None
+    if statistic not in STREAMING_STATISTICS:
+        raise ValueError(f"Unsupported operator '{calc_proc}'. "
+                         f"Options are {['tim' + stat for stat in STREAMING_STATISTICS]}")
+
+    # Accumulate every time-dependent variable, file by file #
+    accumulators = {}
+    last_time = None
+    first_bound = last_bound = None
+
+    for file in file_list:
+        with netCDF4.Dataset(file) as dataset:
+            time_var = find_time_variable(dataset)
+            time_variable = dataset.variables[time_var]
+            time_dim = time_variable.dimensions[0]
+            var_names = _time_dependent_variables(dataset, time_var)
+
+            if not accumulators:
+                template_file = file
+                template_vars = var_names
+                accumulators = {var_name: RunningStatistics(
+                                    tuple(size for dim, size in zip(dataset.variables[var_name].dimensions,
+                                                                    dataset.variables[var_name].shape)
+                                          if dim != time_dim))
+                                for var_name in var_names}
+            elif sorted(var_names) != sorted(template_vars):
+                raise ValueError(f"Variables of '{file}' {sorted(var_names)} do not match "
+                                 f"those of '{template_file}' {sorted(template_vars)}.")
+
+            for var_name in var_names:
+                for time_slice in _iter_time_slices(dataset.variables[var_name], time_dim):
+                    if time_slice.shape != accumulators[var_name].shape:
+                        raise ValueError(f"Grid of '{var_name}' in '{file}' {time_slice.shape} does not "
+                                         f"match that of '{template_file}' {accumulators[var_name].shape}.")
+                    accumulators[var_name].update(time_slice)
+
+            # Keep the time stamps as dates, since units may differ across files
+            units = time_variable.units
+            calendar = getattr(time_variable, "calendar", "standard")
+            time_values = np.ma.getdata(time_variable[:])
+            last_time = cftime.num2date(time_values[-1], units, calendar=calendar)
+
+            bounds_var = getattr(time_variable, "bounds", None)
+            if bounds_var in dataset.variables:
+                bounds_values = np.ma.getdata(dataset.variables[bounds_var][:])
+                if first_bound is None:
+                    first_bound = cftime.num2date(bounds_values[0, 0], units, calendar=calendar)
+                last_bound = cftime.num2date(bounds_values[-1, -1], units, calendar=calendar)
+
+    if not accumulators:
+        raise ValueError("None of the input files has time-dependent variables.")
+
+    # Write the product with the layout of the first file #
+    with netCDF4.Dataset(template_file) as src_dataset, \
+         netCDF4.Dataset(output_file, "w", format=src_dataset.data_model) as dst_dataset:
+        time_var = find_time_variable(src_dataset)
+        time_variable = src_dataset.variables[time_var]
+        time_dim = time_variable.dimensions[0]
+        bounds_var = getattr(time_variable, "bounds", None)
+
+        dst_dataset.setncatts({attr: src_dataset.getncattr(attr) for attr in src_dataset.ncattrs()})
+        for dim_name, dimension in src_dataset.dimensions.items():
+            dst_dataset.createDimension(dim_name, None if dim_name == time_dim else len(dimension))
+
+        units = time_variable.units
+        calendar = getattr(time_variable, "calendar", "standard")
+        _copy_variable(src_dataset, dst_dataset, time_var,
+                       values=[cftime.date2num(last_time, units, calendar=calendar)])
+        if bounds_var in src_dataset.variables and first_bound is not None:
+            _copy_variable(src_dataset, dst_dataset, bounds_var,
+                           values=[cftime.date2num([first_bound, last_bound], units, calendar=calendar)])
+
+        for var_name, variable in src_dataset.variables.items():
+            if var_name in (time_var, bounds_var):
+                continue
+            if var_name in accumulators:
+                result = accumulators[var_name].result(statistic)
+                time_axis = variable.dimensions.index(time_dim)
+                result = np.ma.masked_invalid(np.expand_dims(result, time_axis))
+                _copy_variable(src_dataset, dst_dataset, var_name, values=result,
+                               storage_policy=storage_policy, time_dim=time_dim)
+            else:
+                _copy_variable(src_dataset, dst_dataset, var_name)
+
+#--------------------------#
+# Parameters and constants #
+#--------------------------#
+
+# Statistics that can be computed in a single pass #
+STREAMING_STATISTICS = [
+    "max", "min", "sum",
+    "mean", "avg",
+    "var", "var1",
+    "std", "std1"
+]
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import json
+import os
+from pathlib import Path
+import tempfile
+
+import cftime
+import netCDF4
+import numpy as np
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from climalab.netcdf_tools.result_cache import file_fingerprint
+
+#-------------------------#
+# Define custom functions #
+#-------------------------#
+
+# Internal Helper Functions #
+#---------------------------#
+
+def _read_index_file(index_file: Path) -> dict:
+    if not index_file.exists():
+        return {}
+    try:
+        with open(index_file, encoding="utf-8") as index_obj:
+            return json.load(index_obj)
+    except (OSError, ValueError):
+        # A corrupt or unreadable sidecar is simply rebuilt
+        return {}
+
+
+def _write_index_file(index_file: Path, index: dict) -> None:
+    # A unique temporary file, so concurrent writers in one directory do not clash
+    try:
+        index_obj = tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=index_file.parent,
+                                                prefix=f"{index_file.name}.", suffix=".tmp",
+                                                delete=False)
+    except OSError:
+        # Read-only data directories just do not get a sidecar
+        return
+    try:
+        with index_obj:
+            json.dump(index, index_obj, indent=1)
+        os.replace(index_obj.name, index_file)
+    except OSError:
+        os.remove(index_obj.name)
+
+
+def _normalise_calendar(calendar: str) -> str:
+    # CF calendar names which are aliases of one another compare equal
+    calendar = calendar.lower()
+    return CALENDAR_ALIASES.get(calendar, calendar)
+
+
+# Time variable lookup #
+#----------------------#
+
+def find_time_variable(dataset: netCDF4.Dataset) -> str:
+    """
+    Find the name of the time coordinate variable of an open netCDF dataset.
+
+    The variable is looked up, in this order, by its 'axis' ('T') or
+    'standard_name' ('time') attribute, by the common names listed in
+    `TIME_VARIABLE_NAMES`, and finally as the coordinate variable of the
+    unlimited dimension.
+
+    Parameters
+    ----------
+    dataset : netCDF4.Dataset
+        Open dataset.
+
+    Returns
+    -------
+    str
+        Name of the time variable.
+
+    Raises
+    ------
+    ValueError
+        If no time variable is found.
+    """
+    for var_name, variable in dataset.variables.items():
+        if getattr(variable, "axis", None) == "T" or getattr(variable, "standard_name", None) == "time":
+            return var_name
+
+    for var_name in TIME_VARIABLE_NAMES:
+        if var_name in dataset.variables:
+            return var_name
+
+    for dim_name, dimension in dataset.dimensions.items():
+        if dimension.isunlimited() and dim_name in dataset.variables:
+            return dim_name
+
+    raise ValueError(f"No time variable found in '{dataset.filepath()}'.")
+
+
+# Time coverage index #
+#---------------------#
+
+def read_time_coverage(nc_file: str | Path) -> dict:
+    """
+    Read the time span of a netCDF file from its time coordinate only.
+
+    No data variable is read, so the cost does not depend on the file size.
+
+    Parameters
+    ----------
+    nc_file : str | Path
+        Path to the netCDF file.
+
+    Returns
+    -------
+    dict
+        Dictionary with keys:
+        - 'file': absolute path of the file.
+        - 'start', 'end': first and last time steps, as ISO 8601 strings.
+        - 'start_seconds', 'end_seconds': the same, in seconds since
+          `REFERENCE_TIME_UNITS`, in the file's calendar.
+        - 'ntime': number of time steps.
+        - 'max_step_seconds': largest spacing between consecutive time steps,
+          or None for single-step files.
+        - 'calendar': the calendar of the time coordinate.
+
+    Raises
+    ------
+    ValueError
+        If the file has no time steps.
+    """
+    with netCDF4.Dataset(nc_file) as dataset:
+        time_variable = dataset.variables[find_time_variable(dataset)]
+        time_values = np.ma.getdata(time_variable[:])
+        units = time_variable.units
+        calendar = getattr(time_variable, "calendar", "standard")
+    if time_values.size == 0:
+        raise ValueError(f"File '{nc_file}' has no time steps.")
+
+    dates = cftime.num2date(time_values, units, calendar=calendar)
+    seconds = np.asarray(cftime.date2num(dates, REFERENCE_TIME_UNITS, calendar=calendar), dtype="d")
+    time_steps = np.diff(seconds)
+
+    return {
+        "file": str(Path(nc_file).resolve()),
+        "start": dates[0].isoformat(),
+        "end": dates[-1].isoformat(),
+        "start_seconds": float(seconds[0]),
+        "end_seconds": float(seconds[-1]),
+        "ntime": int(seconds.size),
+        "max_step_seconds": float(time_steps.max()) if time_steps.size else None,
+        "calendar": calendar
+    }
+
+
+def build_time_coverage_index(
+        file_list: str | list[str],
+        index_file: str | Path | None = None,
+        use_hash: bool = False) -> list[dict]:
+    """
+    Build a time-sorted index of the time span covered by each file.
+
+    Entries are persisted in a JSON sidecar keyed by each file's fingerprint,
+    so files that have not changed since the last call are not reopened.
+
+    Parameters
+    ----------
+    file_list : str | list[str]
+        Single file path or list of netCDF file paths.
+    index_file : str | Path | None, optional
+        Sidecar file used to persist the index. If None, a sidecar named
+        `INDEX_FILE_NAME` is kept in the directory of each file.
+        Default is None.
+    use_hash : bool, optional
+        Whether fingerprints include a SHA-256 of the file contents.
+        Default is False.
+
+    Returns
+    -------
+    list[dict]
+        One entry per file, as returned by `read_time_coverage`, sorted by
+        start time (and then by end time).
+
+    Examples
+    --------
+    >>> coverage_index = build_time_coverage_index(sorted(glob('era5/t2m_*.nc')))
+    >>> coverage_index[0]['start'], coverage_index[-1]['end']
+    ('1981-01-01T00:00:00', '2010-12-31T23:00:00')
+    """
+    if not isinstance(file_list, list):
+        file_list = [file_list]
+
+    # Group the files by the sidecar they are indexed in #
+    files_by_index_file = {}
+    for file in file_list:
+        file_index_file = Path(index_file) if index_file is not None \
+                          else Path(file).resolve().parent / INDEX_FILE_NAME
+        files_by_index_file.setdefault(file_index_file, []).append(file)
+
+    coverage_index = []
+    for file_index_file, indexed_files in files_by_index_file.items():
+        index = _read_index_file(file_index_file)
+        index_changed = False
+
+        for file in indexed_files:
+            fingerprint = file_fingerprint(file, use_hash=use_hash)
+            entry = index.get(fingerprint["path"])
+            if entry is None or entry["fingerprint"] != fingerprint:
+                entry = dict(fingerprint=fingerprint, coverage=read_time_coverage(file))
+                index[fingerprint["path"]] = entry
+                index_changed = True
+            coverage_index.append(entry["coverage"])
+
+        if index_changed:
+            _write_index_file(file_index_file, index)
+
+    coverage_index.sort(key=lambda entry: (entry["start_seconds"], entry["end_seconds"]))
+    return coverage_index
+
+
+def select_files_by_period(coverage_index: list[dict], start_year: int | str, end_year: int | str) -> list[dict]:
+    """
+    Keep the index entries whose time span intersects a range of years.
+
+    Parameters
+    ----------
+    coverage_index : list[dict]
+        Index as returned by `build_time_coverage_index`.
+    start_year : int | str
+        First year of the period (inclusive).
+    end_year : int | str
+        Last year of the period (inclusive).
+
+    Returns
+    -------
+    list[dict]
+        The selected entries, in the same order.
+    """
+    start_year = int(start_year)
+    end_year = int(end_year)
+    return [entry for entry in coverage_index
+            if int(entry["start"][:4]) <= end_year and int(entry["end"][:4]) >= start_year]
+
+
+def check_time_coverage(coverage_index: list[dict], gap_tolerance: float = 1.5) -> dict:
+    """
+    Detect duplicated, overlapping and missing time ranges in a time-sorted index.
+
+    A file overlaps the files before it if it starts at or before the latest
+    time step covered so far. There is a gap between them if the second
+    one starts later than `gap_tolerance` times the largest time step of
+    either file after the end of the first (for single-step files, the median
+    spacing between file start times is used instead). The tolerance absorbs
+    irregular calendar steps such as months of different lengths.
+
+    Parameters
+    ----------
+    coverage_index : list[dict]
+        Index as returned by `build_time_coverage_index`.
+    gap_tolerance : float, optional
+        Multiple of the time step above which a gap is reported. Default is 1.5.
+
+    Returns
+    -------
+    dict
+        Dictionary with keys:
+        - 'duplicates': pairs of files covering exactly the same time span.
+        - 'overlaps': pairs of files whose time spans overlap otherwise.
+        - 'gaps': tuples (file_before, file_after, missing_from, missing_to).
+
+    Raises
+    ------
+    ValueError
+        If the files use different calendars. Aliases of the same calendar
+        (e.g. 'standard' and 'gregorian', or 'noleap' and '365_day') are
+        considered equal.
+    """
+    calendars = {_normalise_calendar(entry["calendar"]) for entry in coverage_index}
+    if len(calendars) > 1:
+        raise ValueError(f"Files use different calendars: {sorted(calendars)}")
+
+    start_steps = np.diff([entry["start_seconds"] for entry in coverage_index])
+    fallback_step = float(np.median(start_steps)) if start_steps.size else None
+
+    report = dict(duplicates=[], overlaps=[], gaps=[])
+    if not coverage_index:
+        return report
+
+    # Compare each file with the one reaching furthest in time before it #
+    entry_before = coverage_index[0]
+    for entry_after in coverage_index[1:]:
+        file_pair = (entry_before["file"], entry_after["file"])
+
+        if (entry_before["start_seconds"], entry_before["end_seconds"]) \
+            == (entry_after["start_seconds"], entry_after["end_seconds"]):
+            report["duplicates"].append(file_pair)
+        elif entry_after["start_seconds"] <= entry_before["end_seconds"]:
+            report["overlaps"].append(file_pair)
+        else:
+            steps = [step for step in (entry_before["max_step_seconds"], entry_after["max_step_seconds"])
+                     if step is not None]
+            expected_step = max(steps) if steps else fallback_step
+            time_gap = entry_after["start_seconds"] - entry_before["end_seconds"]
+            if expected_step is not None and time_gap > gap_tolerance * expected_step:
+                report["gaps"].append((*file_pair, entry_before["end"], entry_after["start"]))
+
+        if entry_after["end_seconds"] > entry_before["end_seconds"]:
+            entry_before = entry_after
+
+    return report
+
+
+def format_time_coverage_report(report: dict) -> str:
+    """
+    Format the result of `check_time_coverage` as a human-readable text.
+
+    Parameters
+    ----------
+    report : dict
+        Report as returned by `check_time_coverage`.
+
+    Returns
+    -------
+    str
+        Multi-line description of the issues found, or an empty string.
+    """
+    lines = []
+    for file_before, file_after in report["duplicates"]:
+        lines.append(f"- Duplicate time span: '{file_before}' and '{file_after}'")
+    for file_before, file_after in report["overlaps"]:
+        lines.append(f"- Overlapping time spans: '{file_before}' and '{file_after}'")
+    for file_before, file_after, gap_start, gap_end in report["gaps"]:
+        lines.append(f"- Missing time steps between {gap_start} ('{file_before}') "
+                     f"and {gap_end} ('{file_after}')")
+    return "\n".join(lines)
+
+#--------------------------#
+# Parameters and constants #
+#--------------------------#
+
+# Default sidecar index file name #
+INDEX_FILE_NAME = ".time_coverage_index.json"
+
+# Common reference for comparing time steps across files #
+REFERENCE_TIME_UNITS = "seconds since 1800-01-01 00:00:00"
+
+# Aliases of CF calendar names #
+CALENDAR_ALIASES = {
+    "gregorian": "standard",
+    "365_day": "noleap",
+    "366_day": "all_leap"
+}
+
+# Common time variable names #
+TIME_VARIABLE_NAMES = ["time", "valid_time", "Time", "TIME", "t"]
@@ -0,0 +1,330 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import importlib.util
+
+import xarray as xr
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from climalab.netcdf_tools.command_runner import in_process_netcdf
+from climalab.netcdf_tools.storage_policy import StoragePolicy
+
+#-------------------------#
+# Define custom functions #
+#-------------------------#
+
+# Internal Helper Functions #
+#---------------------------#
+
+def _storage_encoding(ds: xr.Dataset, storage_policy: StoragePolicy | None, time_dim: str) -> dict:
+    """
+    Build the `to_netcdf` encoding applying a storage policy to the floating-point data variables.
+    """
+    if storage_policy is None:
+        return {}
+    return {var_name: storage_policy.variable_encoding(
+                variable.dims,
+                variable.shape,
+                time_dim=time_dim,
+                values=variable.values if storage_policy.precision == "packed_int16" else None)
+            for var_name, variable in ds.data_vars.items()
+            if variable.dtype.kind == "f"}
+
+
+def _open_dataset_lazily(nc_file: str) -> xr.Dataset:
+    """
+    Open a netCDF file without loading its data, in on-disk chunks if dask is available.
+
+    Parameters
+    ----------
+    nc_file : str
+        Path to the netCDF file.
+
+    Returns
+    -------
+    xarray.Dataset
+        Lazily loaded dataset.
+    """
+    chunks = {} if importlib.util.find_spec("dask") is not None else None
+    return xr.open_dataset(nc_file, chunks=chunks)
+
+
+def _season_months(season_str: str) -> list[int]:
+    """
+    Translate a season string of consecutive month initials into month numbers.
+
+    Parameters
+    ----------
+    season_str : str
+        Season, e.g. 'DJF', 'JJA' or 'JJAS'.
+
+    Returns
+    -------
+    list[int]
+        Month numbers, e.g. [12, 1, 2] for 'DJF'.
+
+    Raises
+    ------
+    ValueError
+        If the string is not a sequence of consecutive month initials.
+    """
+    season_str = season_str.upper()
+    start_idx = (MONTH_INITIALS * 2).find(season_str)
+    if start_idx == -1 or not 1 <= len(season_str) <= 12:
+        raise ValueError(f"Unsupported season '{season_str}'.")
+    return [(start_idx + i) % 12 + 1 for i in range(len(season_str))]
+
+
+def _reduce(obj: xr.Dataset, statistic: str, dim: str = "time") -> xr.Dataset:
+    """
+    Apply one of the CDO basic statistics along a dimension of an xarray object.
+
+    'mean' ignores missing values whereas 'avg' propagates them, as in CDO.
+    'var'/'std' are normalised by n and 'var1'/'std1' by n-1.
+    """
+    if statistic not in STATISTIC_REDUCERS:
+        raise ValueError(f"Unsupported statistic {statistic}. Options are {list(STATISTIC_REDUCERS)}")
+    return STATISTIC_REDUCERS[statistic](obj, dim)
+
+
+def _time_dependent(ds: xr.Dataset, time_dim: str) -> tuple[xr.Dataset, xr.Dataset, xr.DataArray | None]:
+    """
+    Split a dataset into time-dependent data variables, the rest, and the time bounds (if any).
+    """
+    times = ds[time_dim]
+    bounds_name = next((times.attrs.get(attr) or times.encoding.get(attr)
+                        for attr in TIME_BOUNDS_ATTRS
+                        if (times.attrs.get(attr) or times.encoding.get(attr)) in ds.variables), None)
+    time_vars = [var for var in ds.data_vars if time_dim in ds[var].dims and var != bounds_name]
+    static_vars = [var for var in ds.data_vars if var not in time_vars and var != bounds_name]
+    bounds = ds[bounds_name] if bounds_name is not None else None
+    return ds[time_vars], ds[static_vars], bounds
+
+
+def _reduce_time_bounds(bounds: xr.DataArray, time_dim: str, group=None) -> xr.DataArray:
+    """
+    Rebuild time bounds per group as the earliest lower and the latest upper bound.
+
+    `group` maps a time-dependent object to its groupby or resample object;
+    if None, the bounds are reduced over the whole time dimension.
+    """
+    bounds_dim = next(dim for dim in bounds.dims if dim != time_dim)
+    lower = bounds.isel({bounds_dim: 0}, drop=True)
+    upper = bounds.isel({bounds_dim: -1}, drop=True)
+    if group is None:
+        lower, upper = lower.min(time_dim), upper.max(time_dim)
+    else:
+        lower, upper = group(lower).min(), group(upper).max()
+    return xr.concat([lower, upper], dim=bounds_dim).transpose(..., bounds_dim)
+
+
+# Main functions #
+#----------------#
+
+@in_process_netcdf
+def xr_periodic_statistics(
+        nc_file: str,
+        output_file: str,
+        period_abbr: str,
+        statistic: str,
+        is_climatic: bool,
+        season_str: str | None = None,
+        time_dim: str = "time",
+        storage_policy: StoragePolicy | None = None) -> None:
+    """
+    Compute CDO-equivalent periodic statistics in-process with xarray.
+
+    Reproduces the CDO operators `<period><statistic>` (e.g. `monmean`,
+    `seasstd`) and their climatological variants `y<period><statistic>`
+    (e.g. `ymonmean`, `ydaymax`, `yseasvar1`). Periods are grouped as CDO
+    does: consecutive calendar periods for the former, and the same month,
+    day of year, season or hour of year across all years for the latter.
+    Seasons run DJF, MAM, JJA, SON, with December counted in the following
+    year's DJF. Each output time step is stamped with the last input time
+    step of its group, as CDO does by default.
+
+    Parameters
+    ----------
+    nc_file : str
+        Path to the input netCDF file.
+    output_file : str
+        Path to the output netCDF file.
+    period_abbr : str
+        Period abbreviation, one of 'year', 'seas', 'mon', 'day' or 'hour'.
+    statistic : str
+        Statistic to calculate, one of the CDO basic statistics
+        ('max', 'min', 'sum', 'mean', 'avg', 'var', 'var1', 'std', 'std1').
+    is_climatic : bool
+        Whether to calculate the climatological ('y'-prefixed) variant.
+    season_str : str | None, optional
+        Season to select before calculating the statistic (e.g., 'DJF').
+        Default is None.
+    time_dim : str, optional
+        Name of the time dimension. Default is 'time'.
+    storage_policy : StoragePolicy | None, optional
+        Precision, compression and chunking of the output data variables.
+        If None, xarray's defaults are used. Default is None.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ValueError
+        If the period, statistic or season is not supported.
+    """
+    with _open_dataset_lazily(nc_file) as ds:
+        if season_str:
+            months = _season_months(season_str)
+            ds = ds.sel({time_dim: ds[time_dim].dt.month.isin(months)})
+
+        ds_time, ds_static, bounds = _time_dependent(ds, time_dim)
+        times = ds[time_dim]
+
+        if is_climatic:
+            if period_abbr not in CLIMATIC_GROUP_KEYS:
+                raise ValueError(f"Unsupported climatological period '{period_abbr}'. "
+                                 f"Options are {list(CLIMATIC_GROUP_KEYS)}")
+            group_key = CLIMATIC_GROUP_KEYS[period_abbr](times).rename("group")
+            ds_stat = _reduce(ds_time.groupby(group_key), statistic, time_dim)
+            if bounds is not None:
+                ds_stat[bounds.name] = _reduce_time_bounds(bounds, time_dim,
+                                                           lambda obj: obj.groupby(group_key))
+            last_times = times.groupby(group_key).max()
+            if period_abbr == "seas":
+                present_seasons = [season for season in SEASON_ORDER if season in ds_stat["group"].values]
+                ds_stat = ds_stat.sel(group=present_seasons)
+                last_times = last_times.sel(group=present_seasons)
+            ds_stat = ds_stat.rename({"group": time_dim}).assign_coords({time_dim: last_times.values})
+        else:
+            if period_abbr not in RESAMPLE_RULES:
+                raise ValueError(f"Unsupported period '{period_abbr}'. "
+                                 f"Options are {list(RESAMPLE_RULES)}")
+            resampler = ds_time.resample({time_dim: RESAMPLE_RULES[period_abbr]})
+            ds_stat = _reduce(resampler, statistic, time_dim)
+            if bounds is not None:
+                ds_stat[bounds.name] = _reduce_time_bounds(
+                    bounds, time_dim,
+                    lambda obj: obj.resample({time_dim: RESAMPLE_RULES[period_abbr]}))
+            last_times = times.resample({time_dim: RESAMPLE_RULES[period_abbr]}).max()
+
+            # Empty calendar periods (e.g. data holes) are not output by CDO
+            has_data = times.resample({time_dim: RESAMPLE_RULES[period_abbr]}).count() > 0
+            ds_stat = ds_stat.isel({time_dim: has_data.values})
+            ds_stat = ds_stat.assign_coords({time_dim: last_times.values[has_data.values]})
+
+        ds_stat[time_dim].attrs = times.attrs
+        ds_stat[time_dim].encoding = {key: val for key, val in times.encoding.items()
+                                      if key in ("units", "calendar", "dtype")}
+        ds_out = xr.merge([ds_stat, ds_static])
+        ds_out.attrs = ds.attrs
+        ds_out.to_netcdf(output_file, encoding=_storage_encoding(ds_out, storage_policy, time_dim))
+
+
+@in_process_netcdf
+def xr_time_statistic(
+        input_file: str,
+        output_file: str,
+        calc_proc: str,
+        time_dim: str = "time",
+        storage_policy: StoragePolicy | None = None) -> None:
+    """
+    Compute a CDO-equivalent whole-period statistic (`tim<statistic>`) in-process.
+
+    Parameters
+    ----------
+    input_file : str
+        Path to the input netCDF file.
+    output_file : str
+        Path to the output netCDF file.
+    calc_proc : str
+        CDO operator name, e.g. 'timmean', 'timstd1' or 'timmax'.
+    time_dim : str, optional
+        Name of the time dimension. Default is 'time'.
+    storage_policy : StoragePolicy | None, optional
+        Precision, compression and chunking of the output data variables.
+        If None, xarray's defaults are used. Default is None.
+
+    Returns
+    -------
+    None
+
+    Raises
+    ------
+    ValueError
+        If `calc_proc` is not a supported `tim*` statistic.
+    """
+    calc_proc = calc_proc.lstrip("-")
+    if not calc_proc.startswith("tim"):
+        raise ValueError(f"Unsupported operator '{calc_proc}' for the xarray engine. "
+                         f"Options are {['tim' + stat for stat in STATISTIC_REDUCERS]}")
+    statistic = calc_proc[len("tim"):]
+
+    with _open_dataset_lazily(input_file) as ds:
+        ds_time, ds_static, bounds = _time_dependent(ds, time_dim)
+        times = ds[time_dim]
+
+        ds_stat = _reduce(ds_time, statistic, time_dim)
+        if bounds is not None:
+            ds_stat[bounds.name] = _reduce_time_bounds(bounds, time_dim)
+        ds_stat = ds_stat.expand_dims({time_dim: [times.values[-1]]})
+        ds_stat[time_dim].attrs = times.attrs
+        ds_stat[time_dim].encoding = {key: val for key, val in times.encoding.items()
+                                      if key in ("units", "calendar", "dtype")}
+        ds_out = xr.merge([ds_stat, ds_static])
+        ds_out.attrs = ds.attrs
+        ds_out.to_netcdf(output_file, encoding=_storage_encoding(ds_out, storage_policy, time_dim))
+
+#--------------------------#
+# Parameters and constants #
+#--------------------------#
+
+# Month initials, for season strings #
+MONTH_INITIALS = "JFMAMJJASOND"
+
+# Attributes of the time coordinate naming its bounds variable #
+TIME_BOUNDS_ATTRS = ["bounds", "climatology"]
+
+# Order of the seasons in climatological outputs #
+SEASON_ORDER = ["DJF", "MAM", "JJA", "SON"]
+
+# Switch case dictionaries #
+#--------------------------#
+
+# Basic statistics, following CDO's missing value and normalisation conventions #
+STATISTIC_REDUCERS = {
+    "max": lambda obj, dim: obj.max(dim, skipna=True),
+    "min": lambda obj, dim: obj.min(dim, skipna=True),
+    "sum": lambda obj, dim: obj.sum(dim, skipna=True, min_count=1),
+    "mean": lambda obj, dim: obj.mean(dim, skipna=True),
+    "avg": lambda obj, dim: obj.mean(dim, skipna=False),
+    "var": lambda obj, dim: obj.var(dim, skipna=True, ddof=0),
+    "var1": lambda obj, dim: obj.var(dim, skipna=True, ddof=1),
+    "std": lambda obj, dim: obj.std(dim, skipna=True, ddof=0),
+    "std1": lambda obj, dim: obj.std(dim, skipna=True, ddof=1),
+}
+
+# Consecutive calendar periods, as resampling rules #
+RESAMPLE_RULES = {
+    "year": "YS",
+    "seas": "QS-DEC",
+    "mon": "MS",
+    "day": "D",
+    "hour": "h",
+}
+
+# Multi-year grouping keys #
+CLIMATIC_GROUP_KEYS = {
+    "seas": lambda times: times.dt.season,
+    "mon": lambda times: times.dt.month,
+    "day": lambda times: times.dt.dayofyear,
+    "hour": lambda times: (times.dt.dayofyear - 1) * 24 + times.dt.hour,
+}
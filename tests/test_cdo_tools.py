@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import netCDF4
+import numpy as np
+import pytest
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from climalab.netcdf_tools import cdo_tools
+
+#-------------------------#
+# Define custom functions #
+#-------------------------#
+
+# Helpers #
+#---------#
+
+@pytest.fixture
+def submitted_commands(monkeypatch):
+    """
+    Record the command lists given to `run_command_batch` instead of running them.
+    """
+    cmd_lists = []
+    monkeypatch.setattr(cdo_tools, "run_command_batch",
+                        lambda cmd_list, **kwargs: cmd_lists.append(cmd_list))
+    return cmd_lists
+
+
+def _write_monthly_file(file):
+    """
+    Write a file whose 'months since' time units cannot be edited in place.
+    """
+    with netCDF4.Dataset(file, "w") as dataset:
+        dataset.createDimension("time", None)
+        time_var = dataset.createVariable("time", "f8", ("time",))
+        time_var.units = "months since 2000-01-01"
+        time_var.calendar = "360_day"
+        time_var[:] = np.arange(3)
+        dataset.createVariable("tas", "f4", ("time",))[:] = np.zeros(3, dtype="f4")
+
+
+def _write_daily_file(file, time_values):
+    """
+    Write a file with the given daily time steps.
+    """
+    with netCDF4.Dataset(file, "w") as dataset:
+        dataset.createDimension("time", None)
+        time_var = dataset.createVariable("time", "f8", ("time",))
+        time_var.units = "days since 2000-01-01"
+        time_var.calendar = "standard"
+        time_var[:] = time_values
+        tas = dataset.createVariable("tas", "f4", ("time",))
+        tas[:] = np.zeros(len(time_values), dtype="f4")
+
+
+# Tests #
+#-------#
+
+def test_shifttime_falls_back_to_cdo(tmp_path, submitted_commands):
+    file = str(tmp_path / "tas_mon.nc")
+    _write_monthly_file(file)
+
+    cdo_tools.cdo_shifttime(file, "-6hours")
+
+    [[cmd]] = submitted_commands
+    assert cmd[:3] == ["cdo", "shifttime,-6hours", file]
+    assert cmd[3] != file
+
+
+def test_inttime_falls_back_to_cdo(tmp_path, submitted_commands):
+    file = str(tmp_path / "tas_mon.nc")
+    _write_monthly_file(file)
+
+    cdo_tools.cdo_inttime(file, 2000, 1, 1, 0, 0, 0, "1month")
+
+    [[cmd]] = submitted_commands
+    assert cmd[:3] == ["cdo", "settaxis,2000-01-01,00:00:00,1month", file]
+    assert cmd[3] != file
+
+
+def test_rename_falls_back_to_cdo_for_grib(tmp_path, monkeypatch, submitted_commands):
+    file = str(tmp_path / "tas_day.grb")
+    with open(file, "wb") as grib_obj:
+        grib_obj.write(b"GRIB")
+    monkeypatch.setattr(cdo_tools, "get_file_variables", lambda file: "tas")
+
+    cdo_tools.cdo_rename(file, ["tas"], ["temperature"])
+
+    [[cmd]] = submitted_commands
+    assert cmd[:3] == ["cdo", "chname,tas,temperature", file]
+    assert cmd[3] != file
+
+
+def test_mergetime_writes_temp_file_next_to_first_input(tmp_path, monkeypatch):
+    output_files = []
+    monkeypatch.setattr(cdo_tools, "_mergetime",
+                        lambda file_list, output_file, **kwargs: output_files.append(output_file))
+    file_list = [str(tmp_path / "tas_2000.nc"), str(tmp_path / "tas_2001.nc")]
+
+    cdo_tools.custom_cdo_mergetime(file_list, "unused.nc", create_temp_file=True)
+
+    [output_file] = output_files
+    assert output_file not in file_list
+    assert output_file.startswith(str(tmp_path))
+
+
+def test_mergetime_warns_about_gaps(tmp_path, monkeypatch):
+    merged_lists = []
+    monkeypatch.setattr(cdo_tools, "_mergetime",
+                        lambda file_list, output_file, **kwargs: merged_lists.append(file_list))
+    monkeypatch.chdir(tmp_path)
+    file_list = []
+    for year, time_values in [(2000, [0, 1]), (2001, [5, 6])]:
+        file = str(tmp_path / f"tas_day_ERA5_reanalysis_{year}.nc")
+        _write_daily_file(file, time_values)
+        file_list.append(file)
+
+    with pytest.warns(UserWarning, match="missing"):
+        cdo_tools.cdo_mergetime(file_list, "tas", "daily", "ERA5", "reanalysis",
+                                "mergetime", "2000-2001", "europe", "nc")
+    assert len(merged_lists) == 1
+
+    with pytest.raises(ValueError, match="Inconsistent time coverage"):
+        cdo_tools.cdo_mergetime(file_list, "tas", "daily", "ERA5", "reanalysis",
+                                "mergetime", "2000-2001", "europe", "nc", allow_gaps=False)
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import netCDF4
+import numpy as np
+import pytest
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from climalab.netcdf_tools.in_place_editing import append_time_steps
+
+#-------------------------#
+# Define custom functions #
+#-------------------------#
+
+# Helpers #
+#---------#
+
+def _write_daily_file(file, time_values, units="days since 2000-01-01", time_dtype="i4"):
+    """
+    Write a small file with an unlimited time axis and a 'tas' variable.
+    """
+    with netCDF4.Dataset(file, "w") as dataset:
+        dataset.createDimension("time", None)
+        dataset.createDimension("lon", 2)
+        time_var = dataset.createVariable("time", time_dtype, ("time",))
+        time_var.units = units
+        time_var.calendar = "standard"
+        time_var[:] = time_values
+        dataset.createVariable("lon", "f8", ("lon",))[:] = [0.0, 1.0]
+        tas = dataset.createVariable("tas", "f4", ("time", "lon"))
+        tas[:] = np.ones((len(time_values), 2), dtype="f4")
+
+
+def _read_contents(file):
+    """
+    Return the time values and data of a file written by `_write_daily_file`.
+    """
+    with netCDF4.Dataset(file) as dataset:
+        return dataset.variables["time"][:].tolist(), dataset.variables["tas"][:].tolist()
+
+
+# Tests #
+#-------#
+
+def test_append_time_steps_converts_units(tmp_path):
+    merged_file = str(tmp_path / "merged.nc")
+    new_file = str(tmp_path / "new.nc")
+    _write_daily_file(merged_file, [0, 1, 2])
+    _write_daily_file(new_file, [72, 96], units="hours since 2000-01-01")
+
+    append_time_steps(merged_file, [new_file])
+
+    time_values, tas_values = _read_contents(merged_file)
+    assert time_values == [0, 1, 2, 3, 4]
+    assert len(tas_values) == 5
+
+
+def test_rejected_append_leaves_merged_file_unchanged(tmp_path):
+    merged_file = str(tmp_path / "merged.nc")
+    valid_file = str(tmp_path / "valid.nc")
+    fractional_file = str(tmp_path / "fractional.nc")
+    _write_daily_file(merged_file, [0, 1, 2])
+    _write_daily_file(valid_file, [72], units="hours since 2000-01-01")
+    _write_daily_file(fractional_file, [108], units="hours since 2000-01-01")
+    contents_before = _read_contents(merged_file)
+
+    # 108 hours is not a whole number of days, and is checked after the valid file
+    with pytest.raises(ValueError):
+        append_time_steps(merged_file, [valid_file, fractional_file])
+
+    assert _read_contents(merged_file) == contents_before
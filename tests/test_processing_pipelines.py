@@ -0,0 +1,48 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import pytest
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from climalab.netcdf_tools import processing_pipelines
+from climalab.netcdf_tools.longitude_tools import convert_longitude_convention
+
+#-------------------------#
+# Define custom functions #
+#-------------------------#
+
+# Tests #
+#-------#
+
+@pytest.mark.parametrize("function_name", [
+    "cdo_rename",
+    "cdo_inttime",
+    "cdo_shifttime",
+    "cdo_mergetime",
+    "custom_cdo_mergetime",
+    "modify_variable_units_and_values",
+    "modify_coordinate_values_by_threshold",
+    "modify_coordinate_all_values",
+])
+def test_steps_opening_netcdf_files_run_in_process(function_name):
+    function = processing_pipelines._resolve_function(function_name)
+    assert processing_pipelines._runs_in_process(function, {})
+
+
+def test_longitude_conversion_runs_in_process():
+    assert processing_pipelines._runs_in_process(convert_longitude_convention, {})
+
+
+def test_command_only_steps_run_concurrently():
+    for function_name in ["cdo_selyear", "cdo_time_mean"]:
+        function = processing_pipelines._resolve_function(function_name)
+        assert not processing_pipelines._runs_in_process(function, {})
+    function = processing_pipelines._resolve_function("cdo_time_mean")
+    assert processing_pipelines._runs_in_process(function, {"engine": "xarray"})
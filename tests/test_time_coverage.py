@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+#----------------#
+# Import modules #
+#----------------#
+
+import netCDF4
+import numpy as np
+import pytest
+
+#------------------------#
+# Import project modules #
+#------------------------#
+
+from climalab.netcdf_tools.time_coverage import (
+    build_time_coverage_index,
+    check_time_coverage,
+    read_time_coverage
+)
+
+#-------------------------#
+# Define custom functions #
+#-------------------------#
+
+# Helpers #
+#---------#
+
+def _write_time_file(file, time_values, calendar="standard"):
+    """
+    Write a file holding only a daily time coordinate.
+    """
+    with netCDF4.Dataset(file, "w") as dataset:
+        dataset.createDimension("time", None)
+        time_var = dataset.createVariable("time", "f8", ("time",))
+        time_var.units = "days since 2000-01-01"
+        time_var.calendar = calendar
+        time_var[:] = np.asarray(time_values, dtype="f8")
+
+
+# Tests #
+#-------#
+
+def test_calendar_aliases_are_compatible(tmp_path):
+    first_file = str(tmp_path / "tas_a.nc")
+    second_file = str(tmp_path / "tas_b.nc")
+    _write_time_file(first_file, [0, 1, 2], calendar="standard")
+    _write_time_file(second_file, [3, 4, 5], calendar="gregorian")
+
+    coverage_index = build_time_coverage_index([first_file, second_file])
+    report = check_time_coverage(coverage_index)
+
+    assert report == dict(duplicates=[], overlaps=[], gaps=[])
+
+
+def test_different_calendars_are_rejected(tmp_path):
+    first_file = str(tmp_path / "tas_a.nc")
+    second_file = str(tmp_path / "tas_b.nc")
+    _write_time_file(first_file, [0, 1, 2], calendar="standard")
+    _write_time_file(second_file, [3, 4, 5], calendar="noleap")
+
+    with pytest.raises(ValueError, match="different calendars"):
+        check_time_coverage(build_time_coverage_index([first_file, second_file]))
+
+
+def test_file_without_time_steps_is_rejected(tmp_path):
+    file = str(tmp_path / "tas_empty.nc")
+    _write_time_file(file, [])
+
+    with pytest.raises(ValueError, match="no time steps"):
+        read_time_coverage(file)